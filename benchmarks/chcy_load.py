@@ -0,0 +1,107 @@
+"""Chart Cyanvas LevelData loading with each executor, to find the crossover point.
+
+Levels of growing size (slides with ticks and attaches, taps and guides) are exported
+once, then loaded from the parsed JSON serially and in thread and process pools of
+WORKERS workers. Threads only add overhead under the GIL; processes pay off once the
+per-slide work outweighs starting the pool and pickling the entity slices.
+
+Run from the repository root: python -m benchmarks.chcy_load
+"""
+
+import contextlib
+import io
+import json
+import os
+import time
+
+from sonolus_converters.LevelData import chart_cyanvas
+from sonolus_converters.notes import Guide, GuidePoint, Single, Slide
+from sonolus_converters.notes import SlideStartPoint, SlideRelayPoint, SlideEndPoint
+from sonolus_converters.notes.bpm import Bpm
+from sonolus_converters.notes.metadata import MetaData
+from sonolus_converters.notes.score import Score
+
+SLIDES = (100, 500, 2000, 8000)
+EXECUTORS = ("serial", "thread", "process")
+WORKERS = os.cpu_count() or 1
+
+
+def build(count: int) -> Score:
+    notes: list = [Bpm(beat=0.0, bpm=120.0)]
+    for i in range(count):
+        beat = i * 0.5
+        lane = i % 10 - 4.5
+        relays = [
+            SlideRelayPoint(
+                beat=beat + k * 0.25,
+                ease="linear",
+                lane=lane,
+                size=1,
+                timeScaleGroup=0,
+                type="attach" if k == 2 else "tick",
+            )
+            for k in (1, 2, 3)
+        ]
+        notes.append(
+            Slide(
+                critical=i % 3 == 0,
+                connections=[
+                    SlideStartPoint(
+                        beat=beat,
+                        critical=False,
+                        ease="linear",
+                        judgeType="normal",
+                        lane=lane,
+                        size=1,
+                        timeScaleGroup=0,
+                    ),
+                    *relays,
+                    SlideEndPoint(
+                        beat=beat + 1,
+                        critical=False,
+                        judgeType="normal",
+                        lane=lane,
+                        size=1,
+                        timeScaleGroup=0,
+                    ),
+                ],
+            )
+        )
+        notes.append(
+            Single(beat=beat, critical=False, lane=-lane, size=1, timeScaleGroup=0)
+        )
+        if i % 4 == 0:
+            midpoints = [
+                GuidePoint(
+                    beat=beat + k, ease="linear", lane=lane, size=1, timeScaleGroup=0
+                )
+                for k in range(6)
+            ]
+            notes.append(Guide(color="green", fade="out", midpoints=midpoints))
+    metadata = MetaData(title="", artist="", designer="", waveoffset=0, requests=[])
+    return Score(metadata=metadata, notes=notes)
+
+
+def main():
+    header = "".join(f"{executor + ' s':>11}" for executor in EXECUTORS)
+    print(f"workers: {WORKERS}")
+    print(f"{'slides':>7} {'entities':>9}{header}")
+    for count in SLIDES:
+        buf = io.BytesIO()
+        chart_cyanvas.export(buf, build(count), as_compressed=False)
+        leveldata = json.loads(buf.getvalue())
+
+        times = []
+        for executor in EXECUTORS:
+            start = time.perf_counter()
+            # the loader reports each stage on stdout
+            with contextlib.redirect_stdout(io.StringIO()):
+                chart_cyanvas.load_data(leveldata, executor=executor, workers=WORKERS)
+            times.append(time.perf_counter() - start)
+        entities = len(leveldata["entities"])
+        row = "".join(f"{elapsed:>11.3f}" for elapsed in times)
+        print(f"{count:>7} {entities:>9}{row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Bytes per note held by loaded Scores, measured with tracemalloc on test_files.
+
+Each chart (and its USC export) is measured twice:
+- once in the current layout, with slotted dataclasses and interned literal strings;
+- once as a baseline. The chart is loaded with interning turned off, so JSON-based
+  loaders keep a fresh str per note. Every note is then copied into an equivalent plain
+  dataclass that keeps a per-instance __dict__.
+
+Run from the repository root: python -m benchmarks.memory
+"""
+
+import gc
+import io
+import tracemalloc
+from contextlib import ExitStack
+from dataclasses import fields, is_dataclass, make_dataclass
+from pathlib import Path
+from unittest import mock
+
+from sonolus_converters import sus, usc, pjsk
+from sonolus_converters.notes import Single, Slide, Guide
+from sonolus_converters.notes import guide, single, slide
+from sonolus_converters.notes.score import Score
+
+TEST_FILES = Path(__file__).resolve().parent.parent / "test_files"
+COPIES = 20
+
+_PLAIN_CLASSES: dict[type, type] = {}
+
+
+def count_notes(score) -> int:
+    count = 0
+    for note in score.notes:
+        if isinstance(note, Single):
+            count += 1
+        elif isinstance(note, Slide):
+            count += len(note.connections)
+        elif isinstance(note, Guide):
+            count += len(note.midpoints)
+    return count
+
+
+def plain_copy(value):
+    """Copy notes into equivalent dataclasses without slots."""
+    if is_dataclass(value):
+        cls = type(value)
+        plain = _PLAIN_CLASSES.get(cls)
+        if plain is None:
+            plain = _PLAIN_CLASSES[cls] = make_dataclass(
+                cls.__name__, [f.name for f in fields(cls)]
+            )
+        return plain(
+            **{f.name: plain_copy(getattr(value, f.name)) for f in fields(value)}
+        )
+    if isinstance(value, list):
+        return [plain_copy(item) for item in value]
+    return value
+
+
+def baseline(load) -> Score:
+    with ExitStack() as stack:
+        for module in (guide, single, slide):
+            # str() hands the same object back, so nothing gets interned
+            stack.enter_context(mock.patch.object(module, "intern", str))
+        score = load()
+    return Score(metadata=score.metadata, notes=plain_copy(score.notes))
+
+
+def measure(load) -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    scores = [load() for _ in range(COPIES)]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, sum(count_notes(s) for s in scores)
+
+
+def main():
+    totals = {"slots": 0, "baseline": 0}
+    total_notes = 0
+    print(
+        f"{'file':<40} {'source':<6} {'notes':>6}"
+        f" {'slots':>9} {'baseline':>9} {'saved':>6}  (bytes/note)"
+    )
+    for path in sorted(TEST_FILES.iterdir()):
+        if path.suffix == ".sus":
+            text = path.read_text(encoding="utf-8")
+            loaders = {"sus": lambda: sus.load(io.StringIO(text))}
+            score = sus.load(io.StringIO(text))
+        else:
+            data = path.read_bytes()
+            loaders = {"pjsk": lambda: pjsk.load(data)}
+            score = pjsk.load(data)
+        buf = io.StringIO()
+        usc.export(buf, score)
+        usc_text = buf.getvalue()
+        loaders["usc"] = lambda: usc.load(io.StringIO(usc_text))
+
+        for source, load in loaders.items():
+            size, notes = measure(load)
+            base_size, _ = measure(lambda: baseline(load))
+            totals["slots"] += size
+            totals["baseline"] += base_size
+            total_notes += notes
+            print(
+                f"{path.name:<40} {source:<6} {notes // COPIES:>6}"
+                f" {size / notes:>9.1f} {base_size / notes:>9.1f}"
+                f" {1 - size / base_size:>6.1%}"
+            )
+    size, base_size = totals["slots"], totals["baseline"]
+    print(
+        f"{'total':<40} {'':<6} {total_notes // COPIES:>6}"
+        f" {size / total_notes:>9.1f} {base_size / total_notes:>9.1f}"
+        f" {1 - size / base_size:>6.1%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""SUS export of thousands of overlapping slides, stressing the channel allocator.
+
+Every slide overlaps the next OVERLAP ones, so far more than the 36 standard
+channels are busy at once and the export needs extended_channels. The exported text
+is loaded back to check that no slide was merged into another.
+
+Run from the repository root: python -m benchmarks.sus_channels
+"""
+
+import io
+import time
+
+from sonolus_converters import sus
+from sonolus_converters.notes import Slide, SlideStartPoint, SlideEndPoint
+from sonolus_converters.notes.bpm import Bpm
+from sonolus_converters.notes.metadata import MetaData
+from sonolus_converters.notes.score import Score
+
+SLIDES = (1000, 4000, 16000)
+OVERLAP = 200
+STEP = 0.125
+
+
+def build(count: int) -> Score:
+    notes: list = [Bpm(beat=0.0, bpm=120.0)]
+    for i in range(count):
+        beat = i * STEP
+        lane = i % 12 - 5.5
+        notes.append(
+            Slide(
+                critical=False,
+                connections=[
+                    SlideStartPoint(
+                        beat=beat,
+                        critical=False,
+                        ease="linear",
+                        judgeType="normal",
+                        lane=lane,
+                        size=0.5,
+                        timeScaleGroup=0,
+                    ),
+                    SlideEndPoint(
+                        beat=beat + OVERLAP * STEP,
+                        critical=False,
+                        judgeType="normal",
+                        lane=lane,
+                        size=0.5,
+                        timeScaleGroup=0,
+                    ),
+                ],
+            )
+        )
+    metadata = MetaData(title="", artist="", designer="", waveoffset=0, requests=[])
+    return Score(metadata=metadata, notes=notes)
+
+
+def main():
+    print(f"{'slides':>7} {'export s':>9} {'load s':>8} {'round trip':>10}")
+    for count in SLIDES:
+        score = build(count)
+        buf = io.StringIO()
+        start = time.perf_counter()
+        sus.export(buf, score, extended_channels=True)
+        exported = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loaded = sus.loads(buf.getvalue())
+        load_time = time.perf_counter() - start
+        slides = sum(isinstance(note, Slide) for note in loaded.notes)
+        status = "ok" if slides == count else f"{slides} slides"
+        print(f"{count:>7} {exported:>9.3f} {load_time:>8.3f} {status:>10}")
+
+
+if __name__ == "__main__":
+    main()
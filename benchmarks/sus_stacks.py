@@ -0,0 +1,56 @@
+"""SUS export of dense same-lane note stacks, stressing conflict-line packing.
+
+Each measure gets STACK taps on the same lane, split over a few beats. Every stack
+level needs its own line, and each line is as wide as the finest note resolution in
+the measure.
+
+Run from the repository root: python -m benchmarks.sus_stacks
+"""
+
+import io
+import time
+
+from sonolus_converters import sus
+from sonolus_converters.notes import Single
+from sonolus_converters.notes.bpm import Bpm
+from sonolus_converters.notes.metadata import MetaData
+from sonolus_converters.notes.score import Score
+
+MEASURES = 200
+STACKS = (4, 16, 64, 256)
+
+
+def build(stack: int) -> Score:
+    notes: list = [Bpm(beat=0.0, bpm=120.0)]
+    for measure in range(MEASURES):
+        for i in range(stack):
+            # one note on a 1/480 offset forces the widest possible lines
+            beat = measure * 4 + (i % 4) + (1 / 480 if i == 0 else 0)
+            notes.append(
+                Single(
+                    beat=round(beat, 6),
+                    critical=False,
+                    lane=0,
+                    size=1,
+                    timeScaleGroup=0,
+                )
+            )
+    metadata = MetaData(title="", artist="", designer="", waveoffset=0, requests=[])
+    return Score(metadata=metadata, notes=notes)
+
+
+def main():
+    print(f"{'stack':>6} {'notes':>7} {'lines':>7} {'export s':>9}")
+    for stack in STACKS:
+        score = build(stack)
+        buf = io.StringIO()
+        start = time.perf_counter()
+        # shifting would spread the stacks out over neighbouring ticks
+        sus.export(buf, score, skip_shift=True)
+        elapsed = time.perf_counter() - start
+        lines = sum(line.startswith("#") for line in buf.getvalue().splitlines())
+        print(f"{stack:>6} {MEASURES * stack:>7} {lines:>7} {elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,2 @@
-from .loader import load
+from .loader import load, load_data
 from .exporter import export
@@ -52,6 +52,7 @@ def export(
     """
     Automatically deletes fake notes.
     """
+    score = score.clone()
     score.delete_fake_notes()
     if not any(isinstance(note, Bpm) for note in score.notes):
         score.notes.insert(0, Bpm(beat=round(0, 6), bpm=160.0))
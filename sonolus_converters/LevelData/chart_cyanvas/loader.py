@@ -1,7 +1,9 @@
 import json
 import gzip
-from typing import IO, Dict, Any, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+from typing import IO, Dict, Any, List, Literal, Optional, Tuple, Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 
 from ...notes.score import Score
 from ...notes.metadata import MetaData
@@ -97,7 +99,269 @@ def _parse_tsg_index(name: str) -> Optional[int]:
     return None
 
 
-def load(fp: IO) -> Score:
+_Executor = Literal["serial", "thread", "process"]
+_TsgJob = Tuple[int, List[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]
+# (start name, start, connectors sorted by head beat, related ticks, end name, end)
+_SlideJob = Tuple[
+    str,
+    Dict[str, Any],
+    List[Tuple[str, Dict[str, Any]]],
+    List[Tuple[Optional[str], int, str, Dict[str, Any]]],
+    Optional[str],
+    Optional[Dict[str, Any]],
+]
+
+
+def _map_jobs(
+    fn: Callable[[Any], Any],
+    jobs: List[Any],
+    executor: _Executor,
+    workers: Optional[int],
+) -> List[Any]:
+    # results always come back in job order, whatever the executor
+    if executor == "serial" or len(jobs) < 2:
+        return [fn(job) for job in jobs]
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fn, jobs))
+    # contiguous chunks, a few per worker, to keep pickling overhead down
+    size = -(-len(jobs) // ((workers or os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, jobs, chunksize=size))
+
+
+def _build_tsg(beat_key: Any, job: _TsgJob) -> Tuple[int, TimeScaleGroup]:
+    idx, tsc_ents, fallback = job
+    changes: List[TimeScalePoint] = []
+    for tsc_ent in tsc_ents:
+        if tsc_ent:
+            beat = tsc_ent["data"].get(beat_key, tsc_ent["data"].get("beat", 0.0))
+            timeScale = tsc_ent["data"].get("timeScale", 1.0)
+            changes.append(TimeScalePoint(beat=beat, timeScale=timeScale))
+    if not changes:
+        tsc_ent = fallback
+        if tsc_ent:
+            beat = tsc_ent["data"].get(beat_key, tsc_ent["data"].get("beat", 0.0))
+            timeScale = tsc_ent["data"].get("timeScale", 1.0)
+            changes.append(TimeScalePoint(beat=beat, timeScale=timeScale))
+    if not changes:
+        changes = [TimeScalePoint(beat=0.0, timeScale=1.0)]
+    changes.sort(key=lambda c: getattr(c, "beat", 0.0))
+    return (idx, TimeScaleGroup(changes=changes))
+
+
+def _build_slide(beat_key: Any, job: _SlideJob) -> Slide:
+    """
+    Build one slide from its start, its connectors sorted by head beat, its related
+    ticks/attaches and its end entity. Only uses what is in ``job``, so it can run in
+    a worker process.
+    """
+    start_name, start_ent, conns_sorted, ticks, end_name, end_ent = job
+
+    ease_map: Dict[str, str] = {}
+    joint_critical_map: Dict[str, Optional[bool]] = {}
+    for cname, cent in conns_sorted:
+        conn_data = cent["data"]
+        ease_val = conn_data.get("ease", None)
+        ease_str = _INV_EASES.get(ease_val, None) if ease_val is not None else None
+        if ease_str is not None:
+            for ref_field in ("start", "head", "tail", "end"):
+                ref = conn_data.get(ref_field)
+                ref_name = ref.get("name") if isinstance(ref, dict) else ref
+                if isinstance(ref_name, str):
+                    ease_map[ref_name] = ease_str
+        conn_is_critical = "Critical" in cent.get("archetype", "")
+        for ref_field in ("head", "tail"):
+            ref = conn_data.get(ref_field)
+            ref_name = ref.get("name") if isinstance(ref, dict) else ref
+            if isinstance(ref_name, str):
+                joint_critical_map[ref_name] = conn_is_critical
+
+    start_beat = start_ent["data"].get(beat_key, start_ent["data"].get("beat", None))
+    start_lane = start_ent["data"].get("lane", None)
+    start_size = start_ent["data"].get("size", None)
+    start_tsg = start_ent["data"].get("timeScaleGroup", 0)
+    if isinstance(start_tsg, str) and str(start_tsg).startswith("tsg:"):
+        try:
+            start_tsg = int(str(start_tsg).split(":", 1)[1])
+        except Exception:
+            start_tsg = 0
+    if "Hidden" in start_ent["archetype"]:
+        start_judge = "none"
+    elif "Trace" in start_ent["archetype"]:
+        start_judge = "trace"
+    else:
+        start_judge = "normal"
+
+    if start_beat is None or start_lane is None or start_size is None:
+        raise RuntimeError(
+            f"Slide start '{start_name}' missing required beat/lane/size: beat={start_beat}, lane={start_lane}, size={start_size}"
+        )
+
+    found = None
+    for cname, cent in conns_sorted:
+        head_ref = cent["data"].get("head")
+        head_name = head_ref.get("name") if isinstance(head_ref, dict) else head_ref
+        if head_name == start_name:
+            found = (cname, cent)
+            break
+
+    if not found:
+        raise RuntimeError(
+            f"No connector where head == start for slide start '{start_name}'"
+        )
+
+    cname, cent = found
+    sv = cent["data"].get("ease", None)
+    if sv is None:
+        raise RuntimeError(
+            f"Connector '{cname}' referencing start '{start_name}' is missing 'ease'"
+        )
+
+    start_ease = sv if isinstance(sv, str) else _INV_EASES.get(sv)
+    if start_ease is None:
+        raise RuntimeError(
+            f"Unknown ease value '{sv}' on connector '{cname}' for start '{start_name}'"
+        )
+
+    start_critical = ("Critical" in start_ent.get("archetype", "")) or (
+        "Critical" in cent.get("archetype", "")
+    )
+
+    start_point = SlideStartPoint(
+        beat=start_beat,
+        critical=start_critical,
+        ease=start_ease,
+        judgeType=start_judge,
+        lane=start_lane,
+        size=start_size,
+        timeScaleGroup=start_tsg,
+    )
+
+    relay_items: List[Dict[str, Any]] = []
+    for ent_name, idx, arch, data_map in ticks:
+        beat = data_map.get(beat_key, data_map.get("beat", None))
+        if beat is None:
+            if ent_name is not None:
+                raise RuntimeError(
+                    f"Slide tick/attach '{ent_name}' missing beat for slide starting '{start_name}'"
+                )
+            raise RuntimeError(
+                f"Unnamed slide tick at index {idx} missing beat for slide starting '{start_name}'"
+            )
+        lane = data_map.get("lane", None)
+        size = data_map.get("size", None)
+        tsg = data_map.get("timeScaleGroup", 0)
+        if isinstance(tsg, str) and str(tsg).startswith("tsg:"):
+            try:
+                tsg = int(str(tsg).split(":", 1)[1])
+            except Exception:
+                tsg = 0
+        rtype = "attach" if ("Attached" in arch) else "tick"
+
+        if "Critical" in arch:
+            rcritical = True
+        elif "Normal" in arch:
+            rcritical = False
+        elif "Hidden" in arch or arch == "HiddenSlideTickNote":
+            rcritical = None
+        elif ent_name is not None:
+            rcritical = joint_critical_map.get(ent_name, start_point.critical)
+        else:
+            rcritical = start_point.critical
+
+        ease_name = ent_name if ent_name is not None else f"__unnamed_tick_{idx}"
+        rp_ease = ease_map.get(ease_name, start_ease)
+        relay_items.append(
+            {
+                "beat": beat,
+                "lane": lane,
+                "size": size,
+                "timeScaleGroup": tsg,
+                "type": rtype,
+                "critical": rcritical,
+                "ease": rp_ease,
+            }
+        )
+
+    if end_ent is None:
+        raise RuntimeError(
+            f"Couldn't find end entity for slide starting at '{start_name}'"
+        )
+
+    end_beat = end_ent["data"].get(beat_key, end_ent["data"].get("beat", None))
+    end_lane = end_ent["data"].get("lane", None)
+    end_size = end_ent["data"].get("size", None)
+    end_tsg = end_ent["data"].get("timeScaleGroup", 0)
+    if isinstance(end_tsg, str) and str(end_tsg).startswith("tsg:"):
+        try:
+            end_tsg = int(str(end_tsg).split(":", 1)[1])
+        except Exception:
+            end_tsg = 0
+    if "Hidden" in end_ent["archetype"]:
+        end_judge = "none"
+    elif "Trace" in end_ent["archetype"]:
+        end_judge = "trace"
+    else:
+        end_judge = "normal"
+    dir_val = end_ent["data"].get("direction", None)
+    direction = (
+        _INV_DIRECTIONS.get(int(dir_val), None) if dir_val is not None else None
+    )
+
+    if end_beat is None or end_lane is None or end_size is None:
+        raise RuntimeError(
+            f"Slide end '{end_name}' missing required beat/lane/size: beat={end_beat}, lane={end_lane}, size={end_size}"
+        )
+
+    end_critical = "Critical" in end_ent["archetype"]
+
+    end_point = SlideEndPoint(
+        beat=end_beat,
+        critical=end_critical,
+        judgeType=end_judge,
+        lane=end_lane,
+        size=end_size,
+        timeScaleGroup=end_tsg,
+        direction=direction,
+    )
+
+    # sort relay items by beat and fill missing lane/size from previous (or start if first)
+    relay_items_sorted = sorted(relay_items, key=lambda r: r["beat"])
+    filled_relays: List[SlideRelayPoint] = []
+    prev_lane = start_point.lane
+    prev_size = start_point.size
+    for item in relay_items_sorted:
+        lane = item.get("lane", None)
+        size = item.get("size", None)
+        if lane is None:
+            lane = prev_lane
+        if size is None:
+            size = prev_size
+        prev_lane = lane
+        prev_size = size
+        rp = SlideRelayPoint(
+            beat=item["beat"],
+            ease=item["ease"],
+            lane=lane,
+            size=size,
+            timeScaleGroup=item.get("timeScaleGroup", 0),
+            type=item.get("type", "tick"),
+            critical=item.get("critical"),
+        )
+        filled_relays.append(rp)
+
+    connections_list = [start_point] + filled_relays + [end_point]
+    slide_obj = Slide(
+        critical=bool(start_point.critical), connections=connections_list
+    )
+    slide_obj.sort()
+    return slide_obj
+
+
+def load(
+    fp: IO, executor: _Executor = "serial", workers: Optional[int] = None
+) -> Score:
     # read JSON (possibly gzipped)
     start = fp.peek(2) if hasattr(fp, "peek") else fp.read(2)
     if not hasattr(fp, "peek"):
@@ -107,7 +371,26 @@ def load(fp: IO) -> Score:
             leveldata = json.load(gz)
     else:
         leveldata = json.load(fp)
-
+    return load_data(leveldata, executor, workers)
+
+
+def load_data(
+    leveldata: Dict[str, Any],
+    executor: _Executor = "serial",
+    workers: Optional[int] = None,
+) -> Score:
+    """
+    Load LevelData that has already been decompressed and parsed from JSON.
+
+    executor: how time scale groups and slides are built: "serial", or in a "thread"
+    or "process" pool of ``workers`` workers. Each process job only carries the
+    entities of its own slide. The result is the same in every mode; a pool only pays
+    off on very large levels (see benchmarks/chcy_load.py). On platforms that spawn
+    worker processes (Windows, macOS), "process" requires the calling script to start
+    from an ``if __name__ == "__main__":`` guard.
+    """
+    if executor not in ("serial", "thread", "process"):
+        raise ValueError(f"Unknown executor: {executor}")
     metadata = MetaData(
         title="",
         artist="",
@@ -167,9 +450,6 @@ def load(fp: IO) -> Score:
     # Build entity_cache mapping canonical_name -> normalized entry with quick fields
     # canonical_name: existing name for named, or generated "__unnamed_ent_i"
     entity_cache: Dict[str, Dict[str, Any]] = {}
-    fast_lookup: Dict[Tuple[Any, Any, Any, Any], List[str]] = (
-        {}
-    )  # (beat,lane,size,tsg) -> list of names
 
     unnamed_index = 0
     for name, nd in normalized_entities:
@@ -201,10 +481,6 @@ def load(fp: IO) -> Score:
             "timeScaleGroup": tsg,
             "direction": direction,
         }
-        # populate fast_lookup when beat/lane/size known
-        if beat is not None and lane is not None and size is not None:
-            key = (beat, lane, size, tsg)
-            fast_lookup.setdefault(key, []).append(canonical)
 
     # convenience iterator similar to earlier behavior (unnamed first, then named)
     def _all_entities_iter():
@@ -219,7 +495,7 @@ def load(fp: IO) -> Score:
     notes: List[Any] = []
 
     # -------------------------
-    # TimeScaleGroups (parallelized per group)
+    # TimeScaleGroups
     # -------------------------
     tsg_items = [
         (n, v)
@@ -227,42 +503,19 @@ def load(fp: IO) -> Score:
         if _is_timescale_group_archetype(v["archetype"])
     ]
 
-    def _process_tsg(
-        item: Tuple[str, Dict[str, Any]],
-    ) -> Optional[Tuple[int, TimeScaleGroup]]:
+    def _tsg_job(item: Tuple[str, Dict[str, Any]]) -> Optional[_TsgJob]:
         name, ent = item
         idx = _parse_tsg_index(name)
         if idx is None:
             return None
         length = ent["data"].get("length", 0) or 0
-        changes: List[TimeScalePoint] = []
-        for i in range(int(length)):
-            tsc_name = f"tsc:{idx}:{i}"
-            tsc_ent = parsed.get(tsc_name)
-            if tsc_ent:
-                beat = tsc_ent["data"].get(beat_key, tsc_ent["data"].get("beat", 0.0))
-                timeScale = tsc_ent["data"].get("timeScale", 1.0)
-                changes.append(TimeScalePoint(beat=beat, timeScale=timeScale))
-        if not changes:
-            tsc_ent = parsed.get("tsc:0:0")
-            if tsc_ent:
-                beat = tsc_ent["data"].get(beat_key, tsc_ent["data"].get("beat", 0.0))
-                timeScale = tsc_ent["data"].get("timeScale", 1.0)
-                changes.append(TimeScalePoint(beat=beat, timeScale=timeScale))
-        if not changes:
-            changes = [TimeScalePoint(beat=0.0, timeScale=1.0)]
-        changes.sort(key=lambda c: getattr(c, "beat", 0.0))
-        return (idx, TimeScaleGroup(changes=changes))
-
-    tsg_by_index: Dict[int, TimeScaleGroup] = {}
-    if tsg_items:
-        with ThreadPoolExecutor() as ex:
-            futures = [ex.submit(_process_tsg, it) for it in tsg_items]
-            for f in as_completed(futures):
-                res = f.result()
-                if res:
-                    idx, tsg = res
-                    tsg_by_index[idx] = tsg
+        changes = [parsed.get(f"tsc:{idx}:{i}") for i in range(int(length))]
+        return (idx, changes, parsed.get("tsc:0:0"))
+
+    tsg_jobs = [job for job in map(_tsg_job, tsg_items) if job is not None]
+    tsg_by_index: Dict[int, TimeScaleGroup] = dict(
+        _map_jobs(partial(_build_tsg, beat_key), tsg_jobs, executor, workers)
+    )
 
     for idx in sorted(tsg_by_index.keys()):
         notes.append(tsg_by_index[idx])
@@ -396,7 +649,56 @@ def load(fp: IO) -> Score:
         (n, e) for n, e in parsed.items() if _is_slide_start_archetype(e["archetype"])
     ]
 
-    def _process_slide_start(start_pair: Tuple[str, Dict[str, Any]]) -> Optional[Slide]:
+    # reverse index over slide ticks/attaches, built once instead of scanning every
+    # entity per slide start: (name or None, raw_unnamed index, archetype, data)
+    tick_entities: List[Tuple[Optional[str], int, str, Dict[str, Any]]] = []
+    for ent_name, ent in parsed.items():
+        arch = ent["archetype"]
+        if _is_slide_tick_archetype(arch) and arch != "IgnoredSlideTickNote":
+            tick_entities.append((ent_name, -1, arch, ent["data"]))
+    for idx, ent in enumerate(raw_unnamed):
+        arch = ent.get("archetype")
+        if arch and _is_slide_tick_archetype(arch) and arch != "IgnoredSlideTickNote":
+            data_map = (
+                ent.get("data")
+                if isinstance(ent.get("data"), dict)
+                else _entity_data_map(ent)
+            )
+            tick_entities.append((None, idx, arch, data_map))
+
+    ticks_by_ref: Dict[str, List[int]] = {}  # "attach"/"slide" target -> positions
+    named_tick_pos: Dict[str, int] = {}
+    unnamed_ticks_by_key: Dict[Tuple[Any, Any, Any, Any], List[int]] = {}
+    for pos, (ent_name, _, _, data_map) in enumerate(tick_entities):
+        for ref_field in ("attach", "slide"):
+            ref = data_map.get(ref_field)
+            ref_name = ref.get("name") if isinstance(ref, dict) else ref
+            if ref_name and isinstance(ref_name, str):
+                ticks_by_ref.setdefault(ref_name, []).append(pos)
+        if ent_name is not None:
+            named_tick_pos[ent_name] = pos
+            continue
+        b = data_map.get(beat_key, data_map.get("beat", None))
+        lane = data_map.get("lane", None)
+        size = data_map.get("size", None)
+        tsg = data_map.get("timeScaleGroup", None)
+        if isinstance(tsg, str) and str(tsg).startswith("tsg:"):
+            try:
+                tsg = int(str(tsg).split(":", 1)[1])
+            except Exception:
+                tsg = 0
+        if b is not None and lane is not None and size is not None:
+            unnamed_ticks_by_key.setdefault((b, lane, size, tsg), []).append(pos)
+
+    def _spatial_key(entry: Dict[str, Any]) -> Optional[Tuple[Any, Any, Any, Any]]:
+        # (beat, lane, size, tsg), or None when the entity has no full position
+        if entry["beat"] is None or entry["lane"] is None or entry["size"] is None:
+            return None
+        return (entry["beat"], entry["lane"], entry["size"], entry["timeScaleGroup"])
+
+    def _slide_job(start_pair: Tuple[str, Dict[str, Any]]) -> Optional[_SlideJob]:
+        # the slice of entities one slide needs; the slide itself is built by
+        # _build_slide, possibly in another process
         start_name, start_ent = start_pair
         conns = connectors_by_start.get(start_name, [])
         if not conns:
@@ -418,96 +720,6 @@ def load(fp: IO) -> Score:
 
         conns_sorted = sorted(conns, key=_conn_head_beat)
 
-        ease_map: Dict[str, str] = {}
-        joint_critical_map: Dict[str, Optional[bool]] = {}
-        for cname, cent in conns_sorted:
-            conn_data = cent["data"]
-            ease_val = conn_data.get("ease", None)
-            ease_str = _INV_EASES.get(ease_val, None) if ease_val is not None else None
-            if ease_str is not None:
-                for ref_field in ("start", "head", "tail", "end"):
-                    ref = conn_data.get(ref_field)
-                    ref_name = ref.get("name") if isinstance(ref, dict) else ref
-                    if isinstance(ref_name, str):
-                        ease_map[ref_name] = ease_str
-            conn_is_critical = "Critical" in cent.get("archetype", "")
-            for ref_field in ("head", "tail"):
-                ref = conn_data.get(ref_field)
-                ref_name = ref.get("name") if isinstance(ref, dict) else ref
-                if isinstance(ref_name, str):
-                    joint_critical_map[ref_name] = conn_is_critical
-
-        end_ref_candidate = None
-        for _, cent in conns_sorted:
-            end_ref = cent["data"].get("end")
-            end_name = end_ref.get("name") if isinstance(end_ref, dict) else end_ref
-            if isinstance(end_name, str):
-                end_ref_candidate = end_name
-                break
-
-        start_beat = start_ent["data"].get(
-            beat_key, start_ent["data"].get("beat", None)
-        )
-        start_lane = start_ent["data"].get("lane", None)
-        start_size = start_ent["data"].get("size", None)
-        start_tsg = start_ent["data"].get("timeScaleGroup", 0)
-        if isinstance(start_tsg, str) and str(start_tsg).startswith("tsg:"):
-            try:
-                start_tsg = int(str(start_tsg).split(":", 1)[1])
-            except Exception:
-                start_tsg = 0
-        if "Hidden" in start_ent["archetype"]:
-            start_judge = "none"
-        elif "Trace" in start_ent["archetype"]:
-            start_judge = "trace"
-        else:
-            start_judge = "normal"
-
-        if start_beat is None or start_lane is None or start_size is None:
-            raise RuntimeError(
-                f"Slide start '{start_name}' missing required beat/lane/size: beat={start_beat}, lane={start_lane}, size={start_size}"
-            )
-
-        found = None
-        for cname, cent in conns_sorted:
-            head_ref = cent["data"].get("head")
-            head_name = head_ref.get("name") if isinstance(head_ref, dict) else head_ref
-            if head_name == start_name:
-                found = (cname, cent)
-                break
-
-        if not found:
-            raise RuntimeError(
-                f"No connector where head == start for slide start '{start_name}'"
-            )
-
-        cname, cent = found
-        sv = cent["data"].get("ease", None)
-        if sv is None:
-            raise RuntimeError(
-                f"Connector '{cname}' referencing start '{start_name}' is missing 'ease'"
-            )
-
-        start_ease = sv if isinstance(sv, str) else _INV_EASES.get(sv)
-        if start_ease is None:
-            raise RuntimeError(
-                f"Unknown ease value '{sv}' on connector '{cname}' for start '{start_name}'"
-            )
-
-        start_critical = ("Critical" in start_ent.get("archetype", "")) or (
-            "Critical" in cent.get("archetype", "")
-        )
-
-        start_point = SlideStartPoint(
-            beat=start_beat,
-            critical=start_critical,
-            ease=start_ease,
-            judgeType=start_judge,
-            lane=start_lane,
-            size=start_size,
-            timeScaleGroup=start_tsg,
-        )
-
         joint_names: List[str] = []
         for _, cent in conns_sorted:
             data = cent["data"]
@@ -519,248 +731,36 @@ def load(fp: IO) -> Score:
 
         conn_names_for_slide = [cname for cname, _ in conns_sorted]
 
-        relay_items: List[Dict[str, Any]] = []
-
-        # named ticks/attaches
-        for ent_name, ent in parsed.items():
-            arch = ent["archetype"]
-            if not _is_slide_tick_archetype(arch) or arch == "IgnoredSlideTickNote":
-                continue
-
-            attach_ref = ent["data"].get("attach")
-            slide_ref = ent["data"].get("slide")
-            ref_names = []
-            if attach_ref:
-                ref_names.append(
-                    attach_ref.get("name")
-                    if isinstance(attach_ref, dict)
-                    else attach_ref
+        # ticks/attaches of this slide: referencing one of its connectors, being one
+        # of its joints, or (unnamed) sitting exactly on one of its joints
+        related = set()
+        for cname in conn_names_for_slide:
+            related.update(ticks_by_ref.get(cname, ()))
+        for joint_name in joint_names:
+            if joint_name in named_tick_pos:
+                related.add(named_tick_pos[joint_name])
+            joint_entry = entity_cache.get(joint_name)
+            if joint_entry and joint_entry["orig_name"] == joint_name:
+                related.update(
+                    unnamed_ticks_by_key.get(_spatial_key(joint_entry), ())
                 )
-            if slide_ref:
-                ref_names.append(
-                    slide_ref.get("name") if isinstance(slide_ref, dict) else slide_ref
-                )
-
-            is_related = ent_name in joint_names or any(
-                rn in conn_names_for_slide for rn in ref_names if rn
-            )
-            if not is_related:
-                continue
-
-            beat = ent["data"].get(beat_key, ent["data"].get("beat", None))
-            if beat is None:
-                raise RuntimeError(
-                    f"Slide tick/attach '{ent_name}' missing beat for slide starting '{start_name}'"
-                )
-            lane = ent["data"].get("lane", None)
-            size = ent["data"].get("size", None)
-            tsg = ent["data"].get("timeScaleGroup", 0)
-            if isinstance(tsg, str) and str(tsg).startswith("tsg:"):
-                try:
-                    tsg = int(str(tsg).split(":", 1)[1])
-                except Exception:
-                    tsg = 0
-            rtype = "attach" if ("Attached" in arch) else "tick"
-
-            if "Critical" in arch:
-                rcritical = True
-            elif "Normal" in arch:
-                rcritical = False
-            elif "Hidden" in arch or arch == "HiddenSlideTickNote":
-                rcritical = None
-            else:
-                rcritical = joint_critical_map.get(ent_name, start_point.critical)
-
-            rp_ease = ease_map.get(ent_name, start_ease)
-            relay_items.append(
-                {
-                    "beat": beat,
-                    "lane": lane,
-                    "size": size,
-                    "timeScaleGroup": tsg,
-                    "type": rtype,
-                    "critical": rcritical,
-                    "ease": rp_ease,
-                }
-            )
-
-        # unnamed ticks/attaches (match by references or spatial match)
-        for idx, ent in enumerate(raw_unnamed):
-            arch = ent.get("archetype")
-            if (
-                not arch
-                or not _is_slide_tick_archetype(arch)
-                or arch == "IgnoredSlideTickNote"
-            ):
-                continue
 
-            data_map = (
-                ent.get("data")
-                if isinstance(ent.get("data"), dict)
-                else _entity_data_map(ent)
-            )
-            attach_ref = data_map.get("attach")
-            slide_ref = data_map.get("slide")
-            ref_names = []
-            if attach_ref:
-                ref_names.append(
-                    attach_ref.get("name")
-                    if isinstance(attach_ref, dict)
-                    else attach_ref
-                )
-            if slide_ref:
-                ref_names.append(
-                    slide_ref.get("name") if isinstance(slide_ref, dict) else slide_ref
-                )
-
-            referenced = any(rn in conn_names_for_slide for rn in ref_names if rn)
-            if not referenced:
-                b = data_map.get(beat_key, data_map.get("beat", None))
-                lane = data_map.get("lane", None)
-                size = data_map.get("size", None)
-                tsg = data_map.get("timeScaleGroup", None)
-                if isinstance(tsg, str) and str(tsg).startswith("tsg:"):
-                    try:
-                        tsg = int(str(tsg).split(":", 1)[1])
-                    except Exception:
-                        tsg = 0
-                if b is not None and lane is not None and size is not None:
-                    key = (b, lane, size, tsg)
-                    candidates = fast_lookup.get(key, [])
-                    for cand in candidates:
-                        cand_entry = entity_cache.get(cand)
-                        if not cand_entry:
-                            continue
-                        orig_name = cand_entry.get("orig_name")
-                        if orig_name in joint_names:
-                            referenced = True
-                            break
-
-            if not referenced:
-                continue
-
-            gen_name = f"__unnamed_tick_{idx}"
-            beat = data_map.get(beat_key, data_map.get("beat", None))
-            if beat is None:
-                raise RuntimeError(
-                    f"Unnamed slide tick at index {idx} missing beat for slide starting '{start_name}'"
-                )
-            lane = data_map.get("lane", None)
-            size = data_map.get("size", None)
-            tsg = data_map.get("timeScaleGroup", 0)
-            if isinstance(tsg, str) and str(tsg).startswith("tsg:"):
-                try:
-                    tsg = int(str(tsg).split(":", 1)[1])
-                except Exception:
-                    tsg = 0
-            rtype = "attach" if ("Attached" in arch) else "tick"
-
-            if "Critical" in arch:
-                rcritical = True
-            elif "Normal" in arch:
-                rcritical = False
-            elif "Hidden" in arch or arch == "HiddenSlideTickNote":
-                rcritical = None
-            else:
-                rcritical = start_point.critical
-
-            rp_ease = ease_map.get(gen_name, start_ease)
-            relay_items.append(
-                {
-                    "beat": beat,
-                    "lane": lane,
-                    "size": size,
-                    "timeScaleGroup": tsg,
-                    "type": rtype,
-                    "critical": rcritical,
-                    "ease": rp_ease,
-                }
-            )
-
-        if not end_ref_candidate or end_ref_candidate not in parsed:
-            raise RuntimeError(
-                f"Couldn't find end entity for slide starting at '{start_name}'"
-            )
-
-        end_ent = parsed[end_ref_candidate]
-        end_beat = end_ent["data"].get(beat_key, end_ent["data"].get("beat", None))
-        end_lane = end_ent["data"].get("lane", None)
-        end_size = end_ent["data"].get("size", None)
-        end_tsg = end_ent["data"].get("timeScaleGroup", 0)
-        if isinstance(end_tsg, str) and str(end_tsg).startswith("tsg:"):
-            try:
-                end_tsg = int(str(end_tsg).split(":", 1)[1])
-            except Exception:
-                end_tsg = 0
-        if "Hidden" in end_ent["archetype"]:
-            end_judge = "none"
-        elif "Trace" in end_ent["archetype"]:
-            end_judge = "trace"
-        else:
-            end_judge = "normal"
-        dir_val = end_ent["data"].get("direction", None)
-        direction = (
-            _INV_DIRECTIONS.get(int(dir_val), None) if dir_val is not None else None
-        )
-
-        if end_beat is None or end_lane is None or end_size is None:
-            raise RuntimeError(
-                f"Slide end '{end_ref_candidate}' missing required beat/lane/size: beat={end_beat}, lane={end_lane}, size={end_size}"
-            )
-
-        end_critical = "Critical" in end_ent["archetype"]
-
-        end_point = SlideEndPoint(
-            beat=end_beat,
-            critical=end_critical,
-            judgeType=end_judge,
-            lane=end_lane,
-            size=end_size,
-            timeScaleGroup=end_tsg,
-            direction=direction,
-        )
+        end_name = None
+        for _, cent in conns_sorted:
+            end_ref = cent["data"].get("end")
+            ref_name = end_ref.get("name") if isinstance(end_ref, dict) else end_ref
+            if isinstance(ref_name, str):
+                end_name = ref_name
+                break
 
-        # sort relay items by beat and fill missing lane/size from previous (or start if first)
-        relay_items_sorted = sorted(relay_items, key=lambda r: r["beat"])
-        filled_relays: List[SlideRelayPoint] = []
-        prev_lane = start_point.lane
-        prev_size = start_point.size
-        for item in relay_items_sorted:
-            lane = item.get("lane", None)
-            size = item.get("size", None)
-            if lane is None:
-                lane = prev_lane
-            if size is None:
-                size = prev_size
-            prev_lane = lane
-            prev_size = size
-            rp = SlideRelayPoint(
-                beat=item["beat"],
-                ease=item["ease"],
-                lane=lane,
-                size=size,
-                timeScaleGroup=item.get("timeScaleGroup", 0),
-                type=item.get("type", "tick"),
-                critical=item.get("critical"),
-            )
-            filled_relays.append(rp)
+        # positions keep the original order: named ticks first, then unnamed ones
+        ticks = [tick_entities[pos] for pos in sorted(related)]
+        end_ent = parsed.get(end_name) if end_name is not None else None
+        return (start_name, start_ent, conns_sorted, ticks, end_name, end_ent)
 
-        connections_list = [start_point] + filled_relays + [end_point]
-        slide_obj = Slide(
-            critical=bool(start_point.critical), connections=connections_list
-        )
-        slide_obj.sort()
-        return slide_obj
-
-    slides_results: List[Slide] = []
-    if slide_starts:
-        with ThreadPoolExecutor() as ex:
-            futures = [ex.submit(_process_slide_start, sp) for sp in slide_starts]
-            for f in as_completed(futures):
-                s = f.result()
-                if s:
-                    slides_results.append(s)
-    notes.extend(slides_results)
+    slide_jobs = [job for job in map(_slide_job, slide_starts) if job is not None]
+    build_slide = partial(_build_slide, beat_key)
+    notes.extend(_map_jobs(build_slide, slide_jobs, executor, workers))
 
     print("✔ Slides")
 
@@ -853,34 +853,42 @@ def load(fp: IO) -> Score:
 
     guides_results = []
 
+    def _key_head(s):
+        h = s["head"]
+        return (h.lane, h.size, h.beat, h.timeScaleGroup)
+
+    def _key_tail(s):
+        t = s["tail"]
+        return (t.lane, t.size, t.beat, t.timeScaleGroup)
+
     for (_, _, color), segs in groups.items():
-        remaining = list(segs)
-        remaining.sort(
+        segs = sorted(
+            segs,
             key=lambda s: (
                 getattr(s["head"], "beat", 0.0),
                 getattr(s["tail"], "beat", 0.0),
-            )
+            ),
         )
-
-        def _key_head(s):
-            h = s["head"]
-            return (h.lane, h.size, h.beat, h.timeScaleGroup)
-
-        def _key_tail(s):
-            t = s["tail"]
-            return (t.lane, t.size, t.beat, t.timeScaleGroup)
+        # id -> segment, in sorted order; plus a head key -> segments index so that
+        # following a chain is a lookup rather than a scan of every segment
+        remaining = {id(s): s for s in segs}
+        segs_by_head: Dict[Tuple[Any, Any, Any, Any], List[Dict[str, Any]]] = {}
+        for seg in segs:
+            segs_by_head.setdefault(_key_head(seg), []).append(seg)
 
         while remaining:
-            tail_keys = {_key_tail(s) for s in remaining}
-            start_candidates = [s for s in remaining if _key_head(s) not in tail_keys]
+            tail_keys = {_key_tail(s) for s in remaining.values()}
+            start_candidates = [
+                s for s in remaining.values() if _key_head(s) not in tail_keys
+            ]
 
             if start_candidates:
                 start_seg = min(
                     start_candidates, key=lambda s: getattr(s["head"], "beat", 0.0)
                 )
-                remaining.remove(start_seg)
             else:
-                start_seg = remaining.pop(0)
+                start_seg = next(iter(remaining.values()))
+            del remaining[id(start_seg)]
 
             chain = [start_seg]
             cur_tail_key = _key_tail(chain[-1])
@@ -888,8 +896,8 @@ def load(fp: IO) -> Score:
             while True:
                 candidates = [
                     s
-                    for s in remaining
-                    if _key_head(s) == cur_tail_key and s["color"] == chain[-1]["color"]
+                    for s in segs_by_head.get(cur_tail_key, ())
+                    if id(s) in remaining and s["color"] == chain[-1]["color"]
                 ]
                 if not candidates:
                     break
@@ -900,7 +908,7 @@ def load(fp: IO) -> Score:
                         getattr(s["tail"], "beat", 0.0),
                     ),
                 )
-                remaining.remove(next_seg)
+                del remaining[id(next_seg)]
                 chain.append(next_seg)
                 cur_tail_key = _key_tail(next_seg)
 
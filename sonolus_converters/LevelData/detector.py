@@ -1,6 +1,7 @@
 import io
 import gzip
 import json
+import re
 from collections import abc
 from typing import Literal
 
@@ -131,6 +132,33 @@ def _pysekai_engine_archetypes():
     }
 
 
+_CHCY_ARCHETYPES = frozenset(_chcy_engine_archetypes())
+_PYSEKAI_ARCHETYPES = frozenset(_pysekai_engine_archetypes())
+_SHARED_ARCHETYPES = _CHCY_ARCHETYPES & _PYSEKAI_ARCHETYPES
+# archetype -> the only engine that has it
+_UNIQUE_ARCHETYPES: dict[str, Literal["chcy", "pysekai"]] = {
+    **dict.fromkeys(_CHCY_ARCHETYPES - _PYSEKAI_ARCHETYPES, "chcy"),
+    **dict.fromkeys(_PYSEKAI_ARCHETYPES - _CHCY_ARCHETYPES, "pysekai"),
+}
+
+_BGM_OFFSET_KEY_RE = re.compile(rb'"bgmOffset"\s*:')
+_ARCHETYPE_RE = re.compile(rb'"archetype"\s*:\s*"([^"\\]*)"')
+
+
+def detect_prefix(prefix: bytes) -> None | Literal["chcy", "pysekai"]:
+    """
+    Classify LevelData JSON from the first bytes of the document: it has to open as an
+    object with a ``bgmOffset`` key, and the first archetype unique to one engine
+    decides. ``None`` means undecided, not "not LevelData"; use ``detect`` then.
+    """
+    if prefix.lstrip()[:1] != b"{" or not _BGM_OFFSET_KEY_RE.search(prefix):
+        return
+    for match in _ARCHETYPE_RE.finditer(prefix):
+        engine = _UNIQUE_ARCHETYPES.get(match.group(1).decode())
+        if engine:
+            return engine
+
+
 def detect(
     data: str | bytes | bytearray | abc.Mapping, *, skip_gzip=False, skip_json=False
 ) -> None | Literal["chcy", "pysekai"]:
@@ -159,20 +187,17 @@ def detect(
     try:
         if not "bgmOffset" in level_data:
             return
-        archetypes = set(str(ent["archetype"]) for ent in level_data["entities"])
-        chcy_archetypes = _chcy_engine_archetypes()
-        pysk_archetypes = _pysekai_engine_archetypes()
-
-        chcy_unique_archetypes = chcy_archetypes - pysk_archetypes
-        if any(archetype in chcy_unique_archetypes for archetype in archetypes):
-            return "chcy"
-
-        pysk_unique_archetypes = pysk_archetypes - chcy_archetypes
-        if any(archetype in pysk_unique_archetypes for archetype in archetypes):
-            return "pysekai"
+        # the first archetype unique to one engine decides
+        has_shared = False
+        for ent in level_data["entities"]:
+            archetype = str(ent["archetype"])
+            engine = _UNIQUE_ARCHETYPES.get(archetype)
+            if engine:
+                return engine
+            if not has_shared:
+                has_shared = archetype in _SHARED_ARCHETYPES
 
-        shared_archetypes = chcy_archetypes & pysk_archetypes
-        if all(archetype not in shared_archetypes for archetype in archetypes):
+        if not has_shared:
             return
         return "pysekai"
     except:
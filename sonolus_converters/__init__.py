@@ -6,6 +6,6 @@ from . import pjsk
 from . import scp
 from . import bandori_sus
 from . import holodori_sus
-from .detector import detect
+from .detector import detect, load_any
 from .version import __version__
 from . import utils
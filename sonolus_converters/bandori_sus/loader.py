@@ -1,4 +1,4 @@
-from typing import TextIO, Literal
+from typing import Iterable, TextIO, Literal
 from ..notes.score import Score
 from ..notes.metadata import MetaData
 from ..notes.bpm import Bpm
@@ -12,7 +12,9 @@ from ..sus.loader import (
     _get_notes,
     _get_note_stream,
     _parse_hispeed_entry,
-    _is_command,
+    _iter_lines,
+    _tokenize,
+    _SusLine,
     _tick_to_beat,
     _note_key,
     TICKS_PER_BEAT,
@@ -31,10 +33,14 @@ def _to_usc_size(width: int, lane_factor: float) -> float:
 
 
 def load(fp: TextIO) -> Score:
-    return loads(fp.read())
+    return _load_lines(_iter_lines(fp))
 
 
 def loads(data: str) -> Score:
+    return _load_lines(_iter_lines(data))
+
+
+def _load_lines(lines: Iterable[str]) -> Score:
     ticks_per_beat = TICKS_PER_BEAT
     lanecount = DEFAULT_LANECOUNT
     title = ""
@@ -55,42 +61,25 @@ def loads(data: str) -> Score:
     directionals: list[_SusNote] = []
     slide_streams: dict[int, list[_SusNote]] = {}
 
-    # PHASE 1: bar_lengths, ticks_per_beat, MEASUREBS, LANECOUNT
+    # PHASE 1: tokenize, collecting bar_lengths, ticks_per_beat, MEASUREBS, LANECOUNT
     measure_offset = 0
-    lines_to_process: list[tuple[str, int]] = []
-    for raw_line in data.splitlines():
-        line = raw_line.strip()
-        if not line.startswith("#"):
-            continue
-
-        if _is_command(line):
-            space = line.find(" ", 1)
-            if space == -1:
-                lines_to_process.append((line, measure_offset))
-                continue
-            key = line[1:space].upper()
-            value = line[space + 1 :].strip()
-            if value.startswith('"') and value.endswith('"'):
-                value = value[1:-1]
-            if key == "REQUEST":
-                parts = value.split()
+    records: list[tuple[_SusLine, int]] = []
+    for record in _tokenize(lines):
+        if record.kind == "command":
+            if record.header == "REQUEST":
+                parts = record.data.split()
                 if len(parts) == 2 and parts[0] == "ticks_per_beat":
                     ticks_per_beat = int(parts[1])
-            elif key == "MEASUREBS":
-                measure_offset = int(value)
-            elif key == "LANECOUNT":
-                lanecount = int(value)
-        else:
-            colon = line.find(":", 1)
-            if colon == -1:
-                lines_to_process.append((line, measure_offset))
-                continue
-            header = line[1:colon].strip()
-            line_data = line[colon + 1 :].strip()
-            if len(header) == 5 and header.endswith("02") and header[:3].isdigit():
-                bar_lengths.append((int(header[:3]) + measure_offset, float(line_data)))
-
-        lines_to_process.append((line, measure_offset))
+            elif record.header == "MEASUREBS":
+                measure_offset = int(record.data)
+            elif record.header == "LANECOUNT":
+                lanecount = int(record.data)
+        elif record.kind == "bar_length":
+            bar_lengths.append(
+                (int(record.header[:3]) + measure_offset, float(record.data))
+            )
+            continue
+        records.append((record, measure_offset))
 
     if not bar_lengths:
         bar_lengths.append((0, 4.0))
@@ -104,46 +93,26 @@ def loads(data: str) -> Score:
     center = MIN_LANE + lanecount / 2.0
 
     # PHASE 2: notes, BPM, TIL, metadata
-    for line, m_offset in lines_to_process:
-        if _is_command(line):
-            space = line.find(" ", 1)
-            if space == -1:
-                continue
-            key = line[1:space].upper()
-            value = line[space + 1 :].strip()
-            if value.startswith('"') and value.endswith('"'):
-                value = value[1:-1]
-
-            if key == "TITLE":
-                title = value
-            elif key == "ARTIST":
-                artist = value
-            elif key == "DESIGNER":
-                designer = value
-            elif key == "WAVEOFFSET":
-                wave_offset = float(value)
-            elif key == "REQUEST":
-                requests.append(value)
-            elif key == "HISPEED":
-                tid = til_map.get(value)
+    for record, m_offset in records:
+        kind, header, line_data = record.kind, record.header, record.data
+        if kind == "command":
+            if header == "TITLE":
+                title = line_data
+            elif header == "ARTIST":
+                artist = line_data
+            elif header == "DESIGNER":
+                designer = line_data
+            elif header == "WAVEOFFSET":
+                wave_offset = float(line_data)
+            elif header == "REQUEST":
+                requests.append(line_data)
+            elif header == "HISPEED":
+                tid = til_map.get(line_data)
                 if tid is not None:
                     current_til = tid
-            continue
-
-        colon = line.find(":", 1)
-        if colon == -1:
-            continue
-        header = line[1:colon].strip()
-        line_data = line[colon + 1 :].strip()
-
-        if len(header) not in (5, 6):
-            continue
-
-        if len(header) == 5 and header.endswith("02") and header[:3].isdigit():
-            pass
-        elif header.startswith("BPM") and len(header) == 5:
+        elif kind == "bpm":
             bpm_definitions[header[3:]] = float(line_data)
-        elif len(header) == 5 and header.endswith("08"):
+        elif kind == "bpm_change":
             measure = int(header[:3]) + m_offset
             stripped = line_data.replace(" ", "")
             pairs = [
@@ -156,7 +125,7 @@ def loads(data: str) -> Score:
                 tick = _get_ticks(bars, measure, j, len(pairs))
                 bpm = bpm_definitions.get(pair, 120.0)
                 bpm_data_lines.append((tick, bpm))
-        elif header.startswith("TIL") and len(header) == 5:
+        elif kind == "til":
             til_id = header[3:]
             til_map[til_id] = til_data_index
             stripped = line_data.strip('"').replace(" ", "")
@@ -169,17 +138,16 @@ def loads(data: str) -> Score:
                     new_til.append((measure_ticks + tick_offset, value))
             tils.append(new_til)
             til_data_index += 1
-        elif len(header) == 5 and header[3] == "1":
+        elif kind == "notes":
             measure = int(header[:3]) + m_offset
-            taps.extend(_get_notes(header, line_data, bars, measure, current_til))
-        elif len(header) == 5 and header[3] == "5":
-            measure = int(header[:3]) + m_offset
-            directionals.extend(
-                _get_notes(header, line_data, bars, measure, current_til)
-            )
-        elif len(header) == 6 and header[3] == "3":
+            notes = _get_notes(header, line_data, bars, measure, current_til)
+            if header[3] == "1":
+                taps.extend(notes)
+            else:
+                directionals.extend(notes)
+        elif kind == "slide" and header[3] == "3":
             measure = int(header[:3]) + m_offset
-            channel = int(header[5], 36)
+            channel = int(header[5:], 36)
             slide_streams.setdefault(channel, []).extend(
                 _get_notes(header, line_data, bars, measure, current_til)
             )
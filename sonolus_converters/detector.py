@@ -4,6 +4,12 @@ import gzip
 import json
 import io
 from . import sus, mmws, usc, pjsk, LevelData
+from .notes.score import Score
+from .utils import inflate_prefix
+
+GZIP_MAGIC_NUM = b"\x1f\x8b"
+# bytes of (inflated) data inspected before falling back to a full parse
+SNIFF_SIZE = 64 * 1024
 
 
 def detect(data: Union[os.PathLike, IO[bytes], bytes, str]) -> Union[
@@ -24,20 +30,58 @@ def detect(data: Union[os.PathLike, IO[bytes], bytes, str]) -> Union[
 ]:
     """Parse the data and determine the format of the score
 
+    The format is sniffed from a bounded prefix first (magic numbers, the first
+    inflated kilobytes, leading JSON keys); the data is only fully decoded and parsed
+    when that is inconclusive.
+
     :returns: ``(format, specifier)`` if detected, else ``None``.
     :rtype: tuple[str, str] | None
     """
+    data = _read(data)
+    return _sniff(data) or _detect_full(data)[0]
+
+
+def _read(data: Union[os.PathLike, IO[bytes], bytes, str]) -> bytes:
     if isinstance(data, (os.PathLike, str)):
         with open(data, "rb") as f:
             data = f.read()
-    elif isinstance(data, IO):
+    elif hasattr(data, "read"):
         data = data.read()
     elif isinstance(data, memoryview):
         data = data.tobytes()
+    return data
+
+
+def _sniff(data: bytes):
+    if data[:2] == GZIP_MAGIC_NUM:
+        text = inflate_prefix(data, SNIFF_SIZE)
+        format_spec = LevelData.detector.detect_prefix(text) if text else None
+        if format_spec:
+            return ("lvd", "compress_" + format_spec)
+        return None
+
+    format_spec = mmws.detect(data)
+    if format_spec:
+        return ("mmw", format_spec)
+
+    if pjsk.detector.detect_prefix(data):
+        return ("pjsk", "")
+
+    if data[:SNIFF_SIZE].lstrip()[:1] == b"{":
+        format_spec = LevelData.detector.detect_prefix(data[:SNIFF_SIZE])
+        if format_spec:
+            return ("lvd", format_spec)
+        format_spec = usc.detector.detect_prefix(data)
+        if format_spec:
+            return ("usc", format_spec)
+    return None
 
+
+def _detect_full(data: bytes):
+    """Full-parse detection; returns ``(format, specifier)`` or ``None``, and the
+    decoded payload the format's loader takes."""
     # Check for formats with binary data and magic number first
     # Gzip data
-    GZIP_MAGIC_NUM = b"\x1f\x8b"
     if data[:2] == GZIP_MAGIC_NUM:
         try:
             with gzip.GzipFile(fileobj=io.BytesIO(data), mode="rb", mtime=0) as gz:
@@ -46,32 +90,100 @@ def detect(data: Union[os.PathLike, IO[bytes], bytes, str]) -> Union[
                     json_data, skip_gzip=True, skip_json=True
                 )
                 if format_spec is not None:
-                    return ("lvd", "compress_" + format_spec)
+                    return ("lvd", "compress_" + format_spec), json_data
         except (gzip.BadGzipFile, json.JSONDecodeError):
             pass
     # MMW data
     format_spec = mmws.detect(data)
     if format_spec:
-        return ("mmw", format_spec)
+        return ("mmw", format_spec), data
 
     # PJSK internal score (base64 encoded gzip json)
-    if pjsk.detect(data):
-        return ("pjsk", "")
+    pjsk_data = pjsk.detector.decode_score(data)
+    if pjsk_data is not None:
+        return ("pjsk", ""), pjsk_data
 
     # Binary dection over
     try:
-        data = data.decode()
+        text = data.decode()
     except UnicodeDecodeError:
-        return
-    # uncompressed Leveldata
-    format_spec = LevelData.detect(data, skip_gzip=True)
-    if format_spec:
-        return ("lvd", format_spec)
-    # usc
-    format_spec = usc.detect(data)
-    if format_spec:
-        return ("usc", format_spec)
+        return None, None
+    # JSON formats share one parse; only objects can be LevelData or usc
+    try:
+        json_data = json.loads(text)
+    except json.JSONDecodeError:
+        json_data = None
+    if isinstance(json_data, dict):
+        # uncompressed Leveldata
+        format_spec = LevelData.detect(json_data, skip_gzip=True, skip_json=True)
+        if format_spec:
+            return ("lvd", format_spec), json_data
+        # usc
+        format_spec = usc.detect(json_data, skip_json=True)
+        if format_spec:
+            return ("usc", format_spec), json_data
     # sus
-    format_spec = sus.detect(data)
+    format_spec = sus.detect(text)
     if format_spec is not None:
-        return ("sus", format_spec)
+        return ("sus", format_spec), text
+    return None, None
+
+
+def load_any(
+    data: Union[os.PathLike, IO[bytes], bytes, str],
+) -> Tuple[str, str, Score]:
+    """Detect the format of the score and load it
+
+    The data is read and decoded once: the payload decoded during detection (JSON
+    object, text or raw bytes) is handed straight to the matching loader.
+
+    :returns: ``(format, specifier, score)``
+    :raises ValueError: if the format cannot be detected, or is PySekai LevelData (which
+        has no loader).
+    """
+    data = _read(data)
+    format_spec = _sniff(data)
+    if format_spec:
+        _check_loadable(format_spec)
+        payload = _decode(format_spec, data)
+    else:
+        format_spec, payload = _detect_full(data)
+        if format_spec is None:
+            raise ValueError("Could not detect the score format")
+        _check_loadable(format_spec)
+    fmt, spec = format_spec
+    return fmt, spec, _load(fmt, spec, payload)
+
+
+def _check_loadable(format_spec: Tuple[str, str]):
+    # fail before decoding a payload no loader accepts
+    fmt, spec = format_spec
+    if fmt == "lvd" and not spec.endswith("chcy"):
+        raise ValueError("PySekai LevelData loading is not supported")
+
+
+def _decode(format_spec: Tuple[str, str], data: bytes):
+    # payload for a format that was only sniffed from the prefix
+    match format_spec:
+        case ("lvd", spec) if spec.startswith("compress_"):
+            return json.loads(gzip.decompress(data))
+        case ("lvd" | "usc", _):
+            return json.loads(data)
+        case ("pjsk", _):
+            return pjsk.load_raw(data)
+    return data
+
+
+def _load(fmt: str, spec: str, payload) -> Score:
+    match fmt:
+        case "sus":
+            return sus.loads(payload)
+        case "mmw":
+            return mmws.loads(payload)
+        case "usc":
+            return usc.load_data(payload)
+        case "pjsk":
+            return pjsk.load_data(payload)
+        case "lvd" if spec.endswith("chcy"):
+            return LevelData.chart_cyanvas.load_data(payload)
+    raise ValueError(f"Unsupported format: {fmt}")
@@ -1,6 +1,6 @@
 """holodori sus -> Score. a sekai-sus dialect decoded off the game's SusConverter."""
 
-from typing import TextIO, Literal
+from typing import Iterable, TextIO, Literal
 import re
 
 from ..notes.score import Score
@@ -27,6 +27,9 @@ from ..sus.loader import (
     _get_bars,
     _get_ticks,
     _get_note_stream,
+    _SusLine,
+    _iter_lines,
+    _tokenize,
     _tick_to_beat,
     _sus_to_usc_lane,
     _sus_to_usc_size,
@@ -118,13 +121,26 @@ _FEVER_POINT_TYPES: dict[tuple[str, int], str] = {
 }
 
 _SP_SKILL_RE = re.compile(r"^(\d{3}) (\d+)/(\d+) (\d+)")
+_GHOST_HEADER_RE = re.compile(
+    r"^(\d{3})[0-9a-z]([0-9a-z])([0-9a-zA-Z])([0-9A-Fa-f]{4})$"
+)
+_SLIDE_HEADER_RE = re.compile(r"(\d{3})3([0-9a-z])([0-9a-zA-Z])")
+
+
+def _is_directive(line: str) -> bool:
+    # anything without a ":" is a space-separated meta directive
+    return line.find(":", 1) == -1
 
 
 def load(fp: TextIO) -> Score:
-    return loads(fp.read())
+    return _load_lines(_iter_lines(fp))
 
 
 def loads(data: str) -> Score:
+    return _load_lines(_iter_lines(data))
+
+
+def _load_lines(lines: Iterable[str]) -> Score:
     ticks_per_beat = TICKS_PER_BEAT  # positions are fractional i/N; the file's ticks_per_beat is ignored
     music_id = ""
     wave_offset = 0.0
@@ -148,29 +164,21 @@ def loads(data: str) -> Score:
     ghost_streams: dict[int, list[_SusNote]] = {}
     ghost_colors: dict[int, str] = {}
 
-    # PHASE 1: bar lengths
-    for raw in data.splitlines():
-        line = raw.strip()
-        if not line.startswith("#"):
-            continue
-        colon = line.find(":", 1)
-        if colon != -1:
-            header = line[1:colon].strip()
-            if len(header) == 5 and header[3:] == "02" and header[:3].isdigit():
-                bar_lengths.append((int(header[:3]), float(line[colon + 1 :].strip())))
+    # PHASE 1: tokenize, collecting bar lengths
+    records: list[_SusLine] = []
+    for record in _tokenize(lines, _is_directive):
+        if record.kind == "bar_length":
+            bar_lengths.append((int(record.header[:3]), float(record.data)))
+        else:
+            records.append(record)
     if not bar_lengths:
         bar_lengths.append((0, 4.0))
     bars = _get_bars(bar_lengths, ticks_per_beat)
 
     # PHASE 2: everything else
-    for raw in data.splitlines():
-        line = raw.strip()
-        if not line.startswith("#"):
-            continue
-        colon = line.find(":", 1)
-
-        if colon == -1:  # space-separated meta directive
-            parts = line[1:].split(None, 1)
+    for record in records:
+        if record.kind == "command":  # space-separated meta directive
+            parts = record.line[1:].split(None, 1)
             key = parts[0].upper() if parts else ""
             val = parts[1].strip().strip('"') if len(parts) > 1 else ""
             if key == "MUSIC_ID":
@@ -192,13 +200,21 @@ def loads(data: str) -> Score:
                     sp_skill_points.append((tick, int(sm.group(4))))
             continue
 
-        header = line[1:colon].strip()
-        line_data = line[colon + 1 :].strip()
+        header = record.header
+        line_data = record.data
+
+        # long notes: #mmm 3 lane channel  (channel groups one hold's segments)
+        if record.kind == "slide":
+            m = _SLIDE_HEADER_RE.fullmatch(header)
+            if m and line_data:
+                measure, channel = int(m.group(1)), int(m.group(3), 36)
+                slide_streams.setdefault(channel, []).extend(
+                    _holodori_notes(header, m.group(2), line_data, bars, measure, 0)
+                )
+            continue
 
         # ghost: #mmm 9 lane channel + 4-hex color id
-        gm = re.match(
-            r"^(\d{3})[0-9a-z]([0-9a-z])([0-9a-zA-Z])([0-9A-Fa-f]{4})$", header
-        )
+        gm = _GHOST_HEADER_RE.match(header)
         if gm:
             measure = int(gm.group(1))
             channel = int(gm.group(3), 36)
@@ -267,24 +283,6 @@ def loads(data: str) -> Score:
                 _holodori_notes(header, lane_char, line_data, bars, measure, 0)
             )
 
-    # long notes: #mmm 3 lane channel  (channel groups one hold's segments)
-    for raw in data.splitlines():
-        line = raw.strip()
-        m = re.match(r"^#(\d{3})3([0-9a-z])([0-9a-zA-Z]):(.+)$", line)
-        if not m:
-            continue
-        measure, channel = int(m.group(1)), int(m.group(3), 36)
-        slide_streams.setdefault(channel, []).extend(
-            _holodori_notes(
-                m.group(1) + "3" + m.group(2) + m.group(3),
-                m.group(2),
-                m.group(4).strip(),
-                bars,
-                measure,
-                0,
-            )
-        )
-
     # group each channel into holds: FIFO-match each end (kind 2) to the OLDEST open start (kind 1),
     # taking the relays between them. LIFO would fuse interleaved slides into chart-long holds. de-dup
     # exact repeats first, since the dense multi-line encoding repeats points.
@@ -1,3 +1,3 @@
-from .loader import load
+from .loader import load, loads
 from .exporter import export
 from .detector import detect
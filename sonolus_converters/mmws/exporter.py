@@ -40,7 +40,7 @@ def write_events(fbin: BinaryIO, version: Version, noteGroup: NoteGroups):
     bpmChanges = noteGroup.by(Bpm)
     write_int(fbin, len(bpmChanges))
     for bpmChange in bpmChanges:
-        write_int(fbin, beat_to_tick(bpmChange.beat))
+        write_int(fbin, point_tick(bpmChange))
         write_float(fbin, bpmChange.bpm)
 
     if version.has_hispeed:
@@ -53,7 +53,7 @@ def write_events(fbin: BinaryIO, version: Version, noteGroup: NoteGroups):
         write_int(fbin, time_scale_count)
         for layer, group in enumerate(groups):
             for speedChange in group.changes:
-                write_int(fbin, beat_to_tick(speedChange.beat))
+                write_int(fbin, point_tick(speedChange))
                 write_float(fbin, speedChange.timeScale)
                 if version.has_layers:
                     write_int(fbin, layer)
@@ -115,19 +115,18 @@ def write_note_data(
     *,
     slide: Slide | None = None,
 ):
+    fields: list[int | float] = [point_tick(note)]
     if version.has_floatLaneWidth:
-        write_int(fbin, beat_to_tick(note.beat))
-        write_float(fbin, to_mmw_lane(note.lane, note.size))
-        write_float(fbin, size_to_width(note.size))
+        fields.append(to_mmw_lane(note.lane, note.size))
+        fields.append(size_to_width(note.size))
     else:
-        write_int(fbin, beat_to_tick(note.beat))
-        write_int(fbin, to_mmw_lane(note.lane, note.size, lambda x: int(round(x))))
-        write_int(fbin, size_to_width(note.size, lambda x: int(round(x))))
+        fields.append(to_mmw_lane(note.lane, note.size, lambda x: int(round(x))))
+        fields.append(size_to_width(note.size, lambda x: int(round(x))))
     if version.has_layers:
-        write_int(fbin, note.timeScaleGroup)
+        fields.append(note.timeScaleGroup)
     if note_type == "tap" or note_type == "end":
         direction = getattr(note, "direction", None)
-        write_int(fbin, direction_to_flick(direction))
+        fields.append(direction_to_flick(direction))
     flag = NoteFlag.NONE
     if getattr(note, "fake", False):
         flag |= NoteFlag.NOTE_DUMMY
@@ -137,21 +136,22 @@ def write_note_data(
         note_type == "mid" and slide and slide.critical
     ):
         flag |= NoteFlag.NOTE_CRITICAL
-    write_int(fbin, flag.value)
+    fields.append(flag.value)
     if note_type == "mid":
         if isinstance(note, GuidePoint):
-            write_int(fbin, 0)  # Hold point
+            fields.append(0)  # Hold point
         elif note.type == "tick":
             if note.critical is None:
-                write_int(fbin, 1)
+                fields.append(1)
             else:
-                write_int(fbin, 0)
+                fields.append(0)
         elif note.type == "attach":
-            write_int(fbin, 2)
+            fields.append(2)
         else:
             raise ValueError(f"Invalid hold mid type {note.type}")
     if note_type == "start" or note_type == "mid":
-        write_int(fbin, ease_to_ease_num(getattr(note, "ease", "linear")))
+        fields.append(ease_to_ease_num(getattr(note, "ease", "linear")))
+    fbin.write(note_structs(version)[cast(NoteKind, note_type)].pack(*fields))
 
 
 def write_taps(
@@ -212,37 +212,39 @@ def write_holds(fbin: BinaryIO, version: Version, noteGroup: NoteGroups):
 
 
 def export(
-    path: Union[str, Path, io.BytesIO],
+    path: Union[str, Path, BinaryIO],
     score: Score,
     *,
     format: Literal[".mmws", ".ccmmws", ".unchmmws"] | str | None = None,
 ):
-    if isinstance(path, io.BytesIO):
-        has_path = False
-        fbin = path
-    elif isinstance(path, (str, Path)):
-        has_path = True
+    """
+    Write ``score`` as MMWS. The document is assembled in memory, with the section
+    address table filled in last, and then written to ``path`` in a single call, so
+    any writable binary stream works as a target, seekable or not.
+    """
+    if isinstance(path, (str, Path)):
         path = Path(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        fbin = path.open("wb")
         if format is None:
             _, format = os.path.splitext(path.name)
-    else:
+    elif not hasattr(path, "write"):
         raise TypeError(f"Unsupported path type: {type(path)}")
 
+    score = score.clone()
     match format:
         case ".mmws":
             version = Version(0, 0)
             signature = Signature.MikuMikuWorld
-            score.replace_extended_ease()
-            score.replace_extended_guide_colors()
-            score.delete_fake_notes()
-            score.delete_damage_notes()
-            score.strip_extended_lanes()
+            score.normalize(
+                replace_extended_ease=True,
+                replace_extended_guide_colors=True,
+                delete_fake_notes=True,
+                delete_damage_notes=True,
+                strip_extended_lanes=True,
+            )
         case ".ccmmws":
             version = Version(0)
             signature = Signature.MikuMikuWorld4ChartCyanvas
-            score.delete_fake_notes()
+            score.normalize(delete_fake_notes=True)
         case ".unchmmws":
             version = Version()
             signature = Signature.MikuMikuWorld4UntitledChart
@@ -250,60 +252,56 @@ def export(
             raise ValueError(f"Unsupported format: {format}")
     noteGroups = NoteGroups(convert_holodori_events(score.notes))
 
-    try:
-        write_cstr(fbin, signature.value)
-        write_int(fbin, version.value)
+    fbin = io.BytesIO()
+    write_cstr(fbin, signature.value)
+    write_int(fbin, version.value)
 
-        if version.has_address:
-            address_size = 4 * (
-                4 + version.has_damageNote + version.has_layers + version.has_waypoints
-            )
-            table_address = fbin.tell()
-            fill_zero(fbin, address_size)
-
-        if version.has_address:
-            metadata_address = fbin.tell()
-        write_metadata(fbin, version, score.metadata, score.notes)
-
-        if version.has_address:
-            events_address = fbin.tell()
-        write_events(fbin, version, noteGroups)
-
-        if version.has_address:
-            tapsAddress = fbin.tell()
-        write_taps(fbin, version, "single", noteGroups)
-
-        if version.has_address:
-            holdsAddress = fbin.tell()
-        write_holds(fbin, version, noteGroups)
-
-        if version.has_address and version.has_damageNote:
-            damagesAddress = fbin.tell()
-            write_taps(fbin, version, "damage", noteGroups)
-
-        if version.has_address and version.has_layers:
-            layersAddress = fbin.tell()
-            layers = noteGroups.by(TimeScaleGroup)
-            write_int(fbin, len(layers))
-            for i in range(len(layers)):
-                write_cstr(fbin, f"#{i + 1}")
-
-        if version.has_address and version.has_waypoints:
-            waypointAddress = fbin.tell()
-            write_int(fbin, 0)  # waypoint count
-
-        if version.has_address:
-            fbin.seek(table_address, os.SEEK_SET)
-            write_int(fbin, metadata_address)
-            write_int(fbin, events_address)
-            write_int(fbin, tapsAddress)
-            write_int(fbin, holdsAddress)
-            if version.has_damageNote:
-                write_int(fbin, damagesAddress)
-            if version.has_layers:
-                write_int(fbin, layersAddress)
-            if version.has_waypoints:
-                write_int(fbin, waypointAddress)
-    finally:
-        if has_path:
-            fbin.close()
+    if version.has_address:
+        address_count = (
+            4 + version.has_damageNote + version.has_layers + version.has_waypoints
+        )
+        table_address = fbin.tell()
+        fill_zero(fbin, 4 * address_count)
+        addresses: list[int] = []
+
+    if version.has_address:
+        addresses.append(fbin.tell())  # metadata
+    write_metadata(fbin, version, score.metadata, score.notes)
+
+    if version.has_address:
+        addresses.append(fbin.tell())  # events
+    write_events(fbin, version, noteGroups)
+
+    if version.has_address:
+        addresses.append(fbin.tell())  # taps
+    write_taps(fbin, version, "single", noteGroups)
+
+    if version.has_address:
+        addresses.append(fbin.tell())  # holds
+    write_holds(fbin, version, noteGroups)
+
+    if version.has_address and version.has_damageNote:
+        addresses.append(fbin.tell())
+        write_taps(fbin, version, "damage", noteGroups)
+
+    if version.has_address and version.has_layers:
+        addresses.append(fbin.tell())
+        layers = noteGroups.by(TimeScaleGroup)
+        write_int(fbin, len(layers))
+        for i in range(len(layers)):
+            write_cstr(fbin, f"#{i + 1}")
+
+    if version.has_address and version.has_waypoints:
+        addresses.append(fbin.tell())
+        write_int(fbin, 0)  # waypoint count
+
+    data = fbin.getbuffer()
+    if version.has_address:
+        struct.pack_into(f"<{address_count}I", data, table_address, *addresses)
+
+    if isinstance(path, Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            f.write(data)
+    else:
+        path.write(data)
@@ -1,50 +1,66 @@
 from .mmw_io import *
 
-from typing import TextIO, Type, Iterable, TypeVar
+from typing import TYPE_CHECKING, TextIO, TypeVar, overload
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from ..notes.arrays import ScoreArrays
 
 T = TypeVar("T")
 
 
-def read_metadata(fbin: BinaryIO):
+def read_metadata(reader: MmwReader):
     return MetaData(
-        title=read_cstr(fbin, 64),
-        designer=read_cstr(fbin, 64),
-        artist=(read_cstr(fbin, 64), read_cstr(fbin, 64))[
+        title=reader.read_cstr(),
+        designer=reader.read_cstr(),
+        artist=(reader.read_cstr(), reader.read_cstr())[
             0
         ],  # artist + musicFile(read to advance buffer)
-        waveoffset=read_float(fbin) / -1000,
+        waveoffset=reader.read_float() / -1000,
         requests=[],
     )
 
 
 def read_events(
-    fbin: BinaryIO, version: Version, time_scale_groups: list[TimeScaleGroup]
+    reader: MmwReader,
+    version: Version,
+    time_scale_groups: list[TimeScaleGroup],
+    ticks: bool = False,
 ):
     events: list[Bpm | Skill | FeverStart | FeverChance] = []
-    time_signature_count = read_int(fbin)
+    time_signature_count = reader.read_int()
     if time_signature_count:
-        fbin.seek(3 * time_signature_count * (32 // 8), os.SEEK_CUR)
-    tempo_count = read_int(fbin)
+        reader.seek(3 * time_signature_count * (32 // 8), os.SEEK_CUR)
+    tempo_count = reader.read_int()
     for _ in range(tempo_count):
-        tempo = Bpm(beat=tick_to_beat(read_int(fbin)), bpm=read_float(fbin))
+        tick = reader.read_int()
+        tempo = Bpm(
+            beat=tick_to_beat(tick),
+            bpm=reader.read_float(),
+            tick=tick if ticks else None,
+        )
         events.append(tempo)
 
     if version.has_hispeed:
-        hispeed_count = read_int(fbin)
+        hispeed_count = reader.read_int()
         for _ in range(hispeed_count):
+            tick = reader.read_int()
             time_scale = TimeScalePoint(
-                beat=tick_to_beat(read_int(fbin)), timeScale=read_float(fbin)
+                beat=tick_to_beat(tick),
+                timeScale=reader.read_float(),
+                tick=tick if ticks else None,
             )
-            group_id = read_int(fbin) if version.has_layers else 0
+            group_id = reader.read_int() if version.has_layers else 0
             time_scale_groups[group_id].append(time_scale)
 
     if version.has_skill_fever:
-        skill_count = read_int(fbin)
+        skill_count = reader.read_int()
         for _ in range(skill_count):
-            skill = Skill(beat=tick_to_beat(read_int(fbin)))
+            skill = Skill(beat=tick_to_beat(reader.read_int()))
             events.append(skill)
-        fever_chance_tick = read_int(fbin, 32, True)
-        fever_start_tick = read_int(fbin, 32, True)
+        fever_chance_tick = reader.read_int(32, True)
+        fever_start_tick = reader.read_int(32, True)
         if fever_chance_tick > 0:
             events.append(FeverChance(beat=tick_to_beat(fever_chance_tick)))
         if fever_start_tick > 0:
@@ -52,225 +68,352 @@ def read_events(
     return events
 
 
-TYPE_PARAMS: dict[Type, Iterable[str]] = {
-    Single: (
-        "beat",
-        "critical",
-        "lane",
-        "size",
-        "fake",
-        "timeScaleGroup",
-        "trace",
-        "direction",
-    ),
-    GuidePoint: ("beat", "ease", "lane", "size", "timeScaleGroup"),
-    SlideStartPoint: (
-        "beat",
-        "critical",
-        "ease",
-        "judgeType",
-        "lane",
-        "size",
-        "timeScaleGroup",
-    ),
-    SlideRelayPoint: (
-        "beat",
-        "ease",
-        "lane",
-        "size",
-        "timeScaleGroup",
-        "critical",
-        "type",
-    ),
-    SlideEndPoint: (
-        "beat",
-        "critical",
-        "judgeType",
-        "lane",
-        "size",
-        "timeScaleGroup",
-        "direction",
-    ),
-}
-
-
-def data_init(data_type: Type[T], data: dict) -> T:
-    return data_type(**{k: data[k] for k in TYPE_PARAMS[data_type] if k in data})
+_CRITICAL = NoteFlag.NOTE_CRITICAL.value
+_FRICTION = NoteFlag.NOTE_FRICTION.value
+_DUMMY = NoteFlag.NOTE_DUMMY.value
 
 
 def read_note_data(
-    fbin: BinaryIO, version: Version, type: Literal["tap", "start", "mid", "end"]
+    record: tuple,
+    version: Version,
+    type: NoteKind,
+    ticks: bool = False,
 ):
-    if version.has_floatLaneWidth:
-        tick = read_int(fbin)
-        lane = read_float(fbin)
-        width = read_float(fbin)
+    """
+    Decode one record unpacked with ``note_structs(version)[type]`` into the keyword
+    arguments shared by all note classes, plus the raw flag and the kind-specific
+    trailing fields (flick or hold step type and ease) in file order.
+    """
+    tick, lane, width = record[0], record[1], record[2]
+    rest = record[4:] if version.has_layers else record[3:]
+    if type == "tap" or type == "end":
+        flick, flag = rest[0], rest[1]
+        extra: tuple = (flick,)
     else:
-        tick = read_int(fbin)
-        lane = read_int(fbin)
-        width = read_int(fbin)
-    layer = read_int(fbin) if version.has_layers else 0
-    flick = read_int(fbin) if type != "start" and type != "mid" else FlickType.NONE
-    flag = read_int(fbin)
-    dummy = bool(flag & NoteFlag.NOTE_DUMMY) if version.has_dummyNote else False
+        flag = rest[0]
+        extra = rest[1:]
     data = {
         "beat": tick_to_beat(tick),
         "lane": to_usc_lane(lane, width),
         "size": width_to_size(width),
-        "timeScaleGroup": layer,
-        "critical": bool(flag & NoteFlag.NOTE_CRITICAL),
-        "trace": bool(flag & NoteFlag.NOTE_FRICTION),
-        "direction": flick_to_direction(flick),
-        "fake": dummy,
+        "timeScaleGroup": record[3] if version.has_layers else 0,
+        "tick": tick if ticks else None,
     }
-    if flag & NoteFlag.NOTE_FRICTION:
-        data["judgeType"] = "trace"
-    if type == "mid":
-        hold_step_type = read_int(fbin)
-        # Normal (0): changes shape + adds combo (tick + critical)
-        # Hidden (1): changes shape, no combo (tick + critical=None)
-        # Skip (2): no shape change, adds combo (attach + critical)
-        match hold_step_type:
-            case 0:  # Normal tick
-                data["type"] = "tick"
-            case 1:  # Hidden tick
-                data["type"] = "tick"
-                data["critical"] = None
-            case 2:  # Skip tick
-                data["type"] = "attach"
-    if type == "start" or type == "mid":
-        data["ease"] = ease_num_to_ease(read_int(fbin))
-    return data
-
-
-def read_taps(fbin: BinaryIO, version: Version, type: Literal["single", "damage"]):
+    return data, flag, extra
+
+
+def read_taps(
+    reader: MmwReader,
+    version: Version,
+    type: Literal["single", "damage"],
+    ticks: bool = False,
+):
     notes: list[Single] = []
-    note_count = read_int(fbin)
-    for _ in range(note_count):
+    note_count = reader.read_int()
+    layout = note_structs(version)["tap"]
+    for record in reader.iter_unpack(layout, note_count):
+        data, flag, (flick,) = read_note_data(record, version, "tap", ticks)
         notes.append(
-            data_init(Single, {"type": type, **read_note_data(fbin, version, "tap")})
+            Single(
+                critical=bool(flag & _CRITICAL),
+                fake=bool(flag & _DUMMY) if version.has_dummyNote else False,
+                trace=bool(flag & _FRICTION),
+                direction=flick_to_direction(flick),
+                type=type,
+                **data,
+            )
         )
     return notes
 
 
-def read_holds(fbin: BinaryIO, version: Version):
+def read_tap_array(
+    reader: MmwReader,
+    version: Version,
+    type: Literal["single", "damage"],
+    ticks: bool = False,
+) -> "np.ndarray":
+    """
+    Columnar counterpart of read_taps: map the tap records straight into rows of
+    ``notes.arrays.POINT_DTYPE`` without building a Single per tap. ``note`` is left
+    at -1 for the caller to fill in.
+    """
+    import numpy as np
+
+    from ..notes import arrays
+
+    note_count = reader.read_int()
+    lane_dtype = "<f4" if version.has_floatLaneWidth else "<u4"
+    fields = [("tick", "<u4"), ("lane", lane_dtype), ("width", lane_dtype)]
+    if version.has_layers:
+        fields.append(("layer", "<u4"))
+    fields += [("flick", "<u4"), ("flag", "<u4")]
+    records = np.frombuffer(
+        reader.data, np.dtype(fields), note_count, offset=reader.tell()
+    )
+    reader.seek(records.nbytes, os.SEEK_CUR)
+
+    flick = records["flick"]
+    if note_count and flick.max() >= FlickType.FLICKTYPECOUNT:
+        raise ValueError(f"Unknown flick type: {flick.max()}")
+    direction_codes = np.array(
+        [
+            arrays.DIRECTIONS.index(flick_to_direction(flick_type))
+            for flick_type in range(FlickType.FLICKTYPECOUNT)
+        ],
+        dtype=np.uint16,
+    )
+    flag = records["flag"]
+    flags = direction_codes[flick] << arrays.DIRECTION_SHIFT
+    flags[(flag & _FRICTION) != 0] |= arrays.FLAG_TRACE
+    if version.has_dummyNote:
+        flags[(flag & _DUMMY) != 0] |= arrays.FLAG_FAKE
+    if ticks:
+        flags |= arrays.FLAG_TICK_NATIVE
+
+    lane = records["lane"].astype(np.float64)
+    width = records["width"].astype(np.float64)
+    rows = np.zeros(note_count, dtype=arrays.POINT_DTYPE)
+    rows["tick"] = records["tick"]
+    rows["beat"] = np.round(records["tick"] / 480, 6)  # tick_to_beat
+    rows["lane"] = lane - 6 + width / 2  # to_usc_lane
+    rows["size"] = width / 2  # width_to_size
+    rows["kind"] = arrays.KIND_DAMAGE if type == "damage" else arrays.KIND_SINGLE
+    rows["critical"] = (flag & _CRITICAL) != 0
+    rows["flags"] = flags
+    rows["timeScaleGroup"] = records["layer"] if version.has_layers else 0
+    rows["speedRatio"] = 1.0
+    rows["parent"] = -1
+    rows["note"] = -1
+    return rows
+
+
+def _hold_header_struct(version: Version) -> struct.Struct:
+    # fade type, guide color, hold step count; all follow the start record
+    count = 1 + version.has_fadeType + version.has_guideColor
+    return struct.Struct("<" + "I" * count)
+
+
+def read_holds(reader: MmwReader, version: Version, ticks: bool = False):
     holds: list[Guide | Slide] = []
-    hold_count = read_int(fbin)
+    hold_count = reader.read_int()
+    layouts = note_structs(version)
+    start_struct, mid_struct = layouts["start"], layouts["mid"]
+    end_struct = layouts["end"]
+    header_struct = _hold_header_struct(version)
     for _ in range(hold_count):
-        flag = read_int(fbin) if version.has_guideNote else 0
+        flag = reader.read_int() if version.has_guideNote else 0
         is_guide = bool(flag & HoldFlag.HOLD_GUIDE)
         is_fake = bool(flag & HoldFlag.HOLD_FAKE)
         start_judge = "none" if flag & HoldFlag.HOLD_START_HIDDEN else "normal"
         end_judge = "none" if flag & HoldFlag.HOLD_END_HIDDEN else "normal"
-        start_data = read_note_data(fbin, version, "start")
-        if is_guide:
-            guide_start = data_init(GuidePoint, start_data)
-        else:
-            hold_start = data_init(
-                SlideStartPoint, {"judgeType": start_judge, **start_data}
-            )
 
-        if version.has_fadeType:
-            fade_type = read_int(fbin)
+        start_data, start_flag, (start_ease,) = read_note_data(
+            reader.unpack(start_struct), version, "start", ticks
+        )
+        critical = bool(start_flag & _CRITICAL)
+
+        header = reader.unpack(header_struct)
+        fade_type = header[0] if version.has_fadeType else FadeType.OUT.value
+        if version.has_guideColor:
+            guide_color = header[-2]
         else:
-            fade_type = FadeType.OUT.value
-        guide_color = (
-            read_int(fbin)
-            if version.has_guideColor
-            else (GuideColor.YELLOW if start_data["critical"] else GuideColor.GREEN)
+            guide_color = GuideColor.YELLOW if critical else GuideColor.GREEN
+        hold_step_count = header[-1]
+
+        mids = [
+            read_note_data(record, version, "mid", ticks)
+            for record in reader.iter_unpack(mid_struct, hold_step_count)
+        ]
+        end_data, end_flag, (end_flick,) = read_note_data(
+            reader.unpack(end_struct), version, "end", ticks
         )
 
-        hold_step_count = read_int(fbin)
         if is_guide:
+            points = [GuidePoint(ease=ease_num_to_ease(start_ease), **start_data)]
+            for data, _, (_, ease) in mids:
+                points.append(GuidePoint(ease=ease_num_to_ease(ease), **data))
+            points.append(GuidePoint(ease="linear", **end_data))
             guide = Guide(
                 color=guide_color_to_color(guide_color),
                 fade=fade_type_to_fade(fade_type),
-                midpoints=[guide_start],
-            )
-            for _ in range(hold_step_count):
-                guide.append(
-                    data_init(GuidePoint, read_note_data(fbin, version, "mid"))
-                )
-            guide.append(
-                data_init(
-                    GuidePoint,
-                    {"ease": "linear", **read_note_data(fbin, version, "end")},
-                )
+                midpoints=points,
             )
+            guide.sort()
             holds.append(guide)
         else:
-            slide = Slide(
-                critical=start_data["critical"], fake=is_fake, connections=[hold_start]
-            )
-            for _ in range(hold_step_count):
-                slide.append(
-                    data_init(SlideRelayPoint, read_note_data(fbin, version, "mid"))
+            connections: list[SlideStartPoint | SlideRelayPoint | SlideEndPoint]
+            connections = [
+                SlideStartPoint(
+                    critical=critical,
+                    ease=ease_num_to_ease(start_ease),
+                    judgeType="trace" if start_flag & _FRICTION else start_judge,
+                    **start_data,
+                )
+            ]
+            for data, mid_flag, (hold_step_type, ease) in mids:
+                # Normal (0): changes shape + adds combo (tick + critical)
+                # Hidden (1): changes shape, no combo (tick + critical=None)
+                # Skip (2): no shape change, adds combo (attach + critical)
+                step_critical: bool | None = bool(mid_flag & _CRITICAL)
+                match hold_step_type:
+                    case 0:  # Normal tick
+                        step_type = "tick"
+                    case 1:  # Hidden tick
+                        step_type = "tick"
+                        step_critical = None
+                    case 2:  # Skip tick
+                        step_type = "attach"
+                    case _:
+                        raise ValueError(f"Unknown hold step type: {hold_step_type}")
+                connections.append(
+                    SlideRelayPoint(
+                        ease=ease_num_to_ease(ease),
+                        type=step_type,
+                        critical=step_critical,
+                        **data,
+                    )
                 )
-            slide.append(
-                data_init(
-                    SlideEndPoint,
-                    {"judgeType": end_judge, **read_note_data(fbin, version, "end")},
+            connections.append(
+                SlideEndPoint(
+                    critical=bool(end_flag & _CRITICAL),
+                    judgeType="trace" if end_flag & _FRICTION else end_judge,
+                    direction=flick_to_direction(end_flick),
+                    **end_data,
                 )
             )
+            slide = Slide(critical=critical, fake=is_fake, connections=connections)
+            slide.sort()
             holds.append(slide)
     return holds
 
 
-def load(fp: TextIO) -> Score:
-    fbin = fp.buffer
-    signature = read_cstr(fbin, len(Signature.MikuMikuWorld4UntitledChart.value) + 1)
+@overload
+def load(
+    fp: TextIO, ticks: bool = False, as_arrays: Literal[False] = False
+) -> Score: ...
+@overload
+def load(
+    fp: TextIO, ticks: bool = False, *, as_arrays: Literal[True]
+) -> "ScoreArrays": ...
+
+
+def load(
+    fp: TextIO, ticks: bool = False, as_arrays: bool = False
+) -> "Score | ScoreArrays":
+    """
+    Load an MMWS/CCMMWS/UCMMWS file. With ``as_arrays`` the result is the columnar
+    ``notes.arrays.ScoreArrays`` instead of a Score, and the tap and damage sections
+    are mapped into it without building one Single per tap.
+    """
+    # one read of the whole file; sections are then decoded from memory
+    return loads(fp.buffer.read(), ticks, as_arrays)  # type: ignore[call-overload]
+
+
+@overload
+def loads(
+    data: bytes, ticks: bool = False, as_arrays: Literal[False] = False
+) -> Score: ...
+@overload
+def loads(
+    data: bytes, ticks: bool = False, *, as_arrays: Literal[True]
+) -> "ScoreArrays": ...
+
+
+def loads(
+    data: bytes, ticks: bool = False, as_arrays: bool = False
+) -> "Score | ScoreArrays":
+    """Load MMWS/CCMMWS/UCMMWS data that is already in memory; see ``load``."""
+    reader = MmwReader(data)
+    signature = reader.read_cstr()
     version: Version
     match signature:
         case Signature.MikuMikuWorld.value:
-            version = Version(0, 0, read_int(fbin))
+            version = Version(0, 0, reader.read_int())
         case Signature.MikuMikuWorld4ChartCyanvas.value:
             version = Version(
-                0, version=read_int(fbin, 16), cc_version=read_int(fbin, 16)
+                0, version=reader.read_int(16), cc_version=reader.read_int(16)
             )
         case Signature.MikuMikuWorld4UntitledChart.value:
-            version = Version(read_int(fbin))
+            version = Version(reader.read_int())
         case _:
             raise ValueError("Invalid MMWS file. Unrecognized signature")
 
     if version.has_address:
-        metadata_address = read_int(fbin)
-        events_address = read_int(fbin)
-        tapsAddress = read_int(fbin)
-        holdsAddress = read_int(fbin)
-        damagesAddress = read_int(fbin) if version.has_damageNote else None
-        layersAddress = read_int(fbin) if version.has_layers else None
-        _ = read_int(fbin) if version.has_waypoints else None
+        metadata_address = reader.read_int()
+        events_address = reader.read_int()
+        tapsAddress = reader.read_int()
+        holdsAddress = reader.read_int()
+        damagesAddress = reader.read_int() if version.has_damageNote else None
+        layersAddress = reader.read_int() if version.has_layers else None
+        _ = reader.read_int() if version.has_waypoints else None
 
     if version.has_address:
-        fbin.seek(metadata_address, os.SEEK_SET)
-    metadata = read_metadata(fbin)
+        reader.seek(metadata_address, os.SEEK_SET)
+    metadata = read_metadata(reader)
     notes_data: list[
         Bpm | TimeScaleGroup | Single | Skill | FeverStart | FeverChance | Slide | Guide
     ] = []
 
     time_scale_groups: list[TimeScaleGroup]
     if version.has_address and layersAddress:
-        fbin.seek(layersAddress, os.SEEK_SET)
-        layerCount = read_int(fbin)
+        reader.seek(layersAddress, os.SEEK_SET)
+        layerCount = reader.read_int()
         time_scale_groups = [TimeScaleGroup() for _ in range(layerCount)]
     else:
         time_scale_groups = [TimeScaleGroup()]
     notes_data.extend(time_scale_groups)
 
     if version.has_address:
-        fbin.seek(events_address, os.SEEK_SET)
-    notes_data.extend(read_events(fbin, version, time_scale_groups))
+        reader.seek(events_address, os.SEEK_SET)
+    notes_data.extend(read_events(reader, version, time_scale_groups, ticks))
 
     if version.has_address:
-        fbin.seek(tapsAddress, os.SEEK_SET)
-    notes_data.extend(read_taps(fbin, version, "single"))
+        reader.seek(tapsAddress, os.SEEK_SET)
+    hold_index = len(notes_data)
+    if as_arrays:
+        tap_rows = read_tap_array(reader, version, "single", ticks)
+    else:
+        notes_data.extend(read_taps(reader, version, "single", ticks))
 
     if version.has_address:
-        fbin.seek(holdsAddress, os.SEEK_SET)
-    notes_data.extend(read_holds(fbin, version))
+        reader.seek(holdsAddress, os.SEEK_SET)
+    notes_data.extend(read_holds(reader, version, ticks))
 
+    damage_rows = None
     if version.has_address and damagesAddress:
-        fbin.seek(damagesAddress, os.SEEK_SET)
-        notes_data.extend(read_taps(fbin, version, "damage"))
+        reader.seek(damagesAddress, os.SEEK_SET)
+        if as_arrays:
+            damage_rows = read_tap_array(reader, version, "damage", ticks)
+        else:
+            notes_data.extend(read_taps(reader, version, "damage", ticks))
 
+    if as_arrays:
+        return _score_arrays(metadata, notes_data, hold_index, tap_rows, damage_rows)
     return Score(metadata=metadata, notes=notes_data)
+
+
+def _score_arrays(
+    metadata: MetaData,
+    notes: list,
+    hold_index: int,
+    tap_rows: "np.ndarray",
+    damage_rows: "np.ndarray | None",
+) -> "ScoreArrays":
+    # Lay the rows out as Score.to_arrays() would for the Score load() builds, where
+    # the taps sit between the events and the holds and the damage notes come last
+    import numpy as np
+
+    from ..notes.arrays import ScoreArrays
+
+    arrays = ScoreArrays.from_score(Score(metadata=metadata, notes=notes))
+    hold_rows = arrays.points
+    hold_rows["note"][hold_rows["note"] >= hold_index] += len(tap_rows)
+    arrays.holds["note"] += len(tap_rows)
+    tap_rows["note"] = np.arange(hold_index, hold_index + len(tap_rows))
+    parts = [tap_rows, hold_rows]
+    if damage_rows is not None:
+        first = len(tap_rows) + len(notes)
+        damage_rows["note"] = np.arange(first, first + len(damage_rows))
+        parts.append(damage_rows)
+    arrays.points = np.concatenate(parts)
+    return arrays
@@ -1,39 +1,70 @@
 import os
 import struct
 from enum import Enum, IntEnum, IntFlag, auto as enum_auto
-from typing import BinaryIO, Literal, Callable, TypeVar
+from functools import lru_cache
+from typing import BinaryIO, Literal, Callable, Iterator, TypeVar
 
 T = TypeVar("T")
 from ..notes import *
 
 
 # ==== Binary IO ====
-def read_cstr(f: BinaryIO, chunk_size=1024):
-    buff = bytearray()
-    pos = -1
-    while pos == -1:
-        block = f.read(chunk_size)
-        if not block:
-            break
-        pos = block.find(b"\0")
-        if pos == -1:
-            buff.extend(block)
-        else:
-            buff.extend(block[:pos])
-            seek_back = pos + 1 - len(block)
-            if seek_back:
-                f.seek(seek_back, os.SEEK_CUR)
-    return buff.decode()
-
-
-def read_int(f: BinaryIO, bit_size: Literal[8, 16, 32, 64] = 32, signed=False):
-    return int.from_bytes(f.read(bit_size // 8), "little", signed=signed)
-
-
-def read_float(f: BinaryIO, bit_size: Literal[32, 64] = 32):
-    return float(
-        struct.unpack("<f" if bit_size == 32 else "<d", f.read(bit_size // 8))[0]
-    )
+class MmwReader:
+    """
+    Sequential reader over a whole MMWS file held in memory. C-strings are found with
+    ``bytes.find`` and decoded straight out of a ``memoryview``, so nothing is read
+    ahead and nothing has to be sought back.
+    """
+
+    def __init__(self, data: bytes | bytearray | memoryview):
+        self.data = data if isinstance(data, bytes) else bytes(data)
+        self.view = memoryview(self.data)
+        self.pos = 0
+
+    def tell(self) -> int:
+        return self.pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self.pos
+        elif whence == os.SEEK_END:
+            offset += len(self.data)
+        self.pos = offset
+        return offset
+
+    def read_cstr(self) -> str:
+        end = self.data.find(b"\0", self.pos)
+        if end == -1:
+            end = len(self.data)
+        value = str(self.view[self.pos : end], "utf-8")
+        self.pos = end + 1
+        return value
+
+    def read_int(self, bit_size: Literal[8, 16, 32, 64] = 32, signed=False) -> int:
+        end = self.pos + bit_size // 8
+        value = int.from_bytes(self.view[self.pos : end], "little", signed=signed)
+        self.pos = end
+        return value
+
+    def read_float(self, bit_size: Literal[32, 64] = 32) -> float:
+        (value,) = self.unpack(_FLOAT32 if bit_size == 32 else _FLOAT64)
+        return float(value)
+
+    def unpack(self, layout: struct.Struct) -> tuple:
+        values = layout.unpack_from(self.view, self.pos)
+        self.pos += layout.size
+        return values
+
+    def iter_unpack(self, layout: struct.Struct, count: int) -> Iterator[tuple]:
+        """Unpack ``count`` consecutive records of ``layout``."""
+        end = self.pos + count * layout.size
+        records = layout.iter_unpack(self.view[self.pos : end])
+        self.pos = end
+        return records
+
+
+_FLOAT32 = struct.Struct("<f")
+_FLOAT64 = struct.Struct("<d")
 
 
 def write_cstr(f: BinaryIO, value: str):
@@ -150,6 +181,30 @@ class FadeType(IntEnum):
     IN = enum_auto()
 
 
+# Fixed-width note records: tick, lane, width, layer, then the per-kind fields below.
+# The lane and width pair is float from CCMMWS v6 on, the layer is only present from
+# CCMMWS v4 on.
+NoteKind = Literal["tap", "start", "mid", "end"]
+_NOTE_FIELDS: dict[NoteKind, str] = {
+    "tap": "II",  # flick, flag
+    "start": "II",  # flag, ease
+    "mid": "III",  # flag, hold step type, ease
+    "end": "II",  # flick, flag
+}
+
+
+@lru_cache(maxsize=None)
+def _note_structs(float_lanes: bool, layers: bool) -> dict[NoteKind, struct.Struct]:
+    prefix = "<I" + ("ff" if float_lanes else "II") + ("I" if layers else "")
+    return {
+        kind: struct.Struct(prefix + fields) for kind, fields in _NOTE_FIELDS.items()
+    }
+
+
+def note_structs(version: Version) -> dict[NoteKind, struct.Struct]:
+    return _note_structs(version.has_floatLaneWidth, version.has_layers)
+
+
 # ==== Conversion ====
 _NotesList = list[
     Bpm | TimeScaleGroup | Single | Skill | FeverStart | FeverChance | Slide | Guide
@@ -9,7 +9,7 @@ from .holodorievents import (
     convert_holodori_events,
 )
 from .metadata import MetaData
-from .score import Score
+from .score import Score, point_tick, set_point_tick
 from .single import Single, FeverChance, FeverStart, Skill
 from .slide import Slide, SlideStartPoint, SlideRelayPoint, SlideEndPoint
 from .timescale import TimeScaleGroup, TimeScalePoint
@@ -0,0 +1,416 @@
+"""Columnar view of a Score. Singles and every slide/guide point become one row of a structured
+NumPy array so bulk analytics and transforms can run vectorized instead of walking dataclasses.
+"""
+
+from copy import deepcopy
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .metadata import MetaData
+from .single import Single
+from .slide import Slide, SlideStartPoint, SlideRelayPoint, SlideEndPoint
+from .guide import Guide, GuidePoint
+from .score import point_tick, LANE_OFFSET, TICKS_PER_BEAT
+
+# points["kind"]
+KIND_SINGLE = 0
+KIND_DAMAGE = 1
+KIND_SLIDE_START = 2
+KIND_SLIDE_TICK = 3
+KIND_SLIDE_ATTACH = 4
+KIND_SLIDE_END = 5
+KIND_GUIDE_POINT = 6
+
+# holds["kind"]
+HOLD_SLIDE = 0
+HOLD_GUIDE = 1
+
+# points["flags"]
+FLAG_FAKE = 1 << 0
+FLAG_TRACE = 1 << 1
+FLAG_TRACE_UNSET = 1 << 2  # Single.trace is None
+FLAG_TICK_NATIVE = 1 << 3  # the point carried an explicit tick
+DIRECTION_SHIFT = 4  # 2 bits, index into DIRECTIONS
+JUDGE_TYPE_SHIFT = 6  # 2 bits, index into JUDGE_TYPES
+EASE_SHIFT = 8  # 3 bits, index into EASES
+
+DIRECTIONS = (None, "left", "up", "right")
+JUDGE_TYPES = ("normal", "trace", "none")
+EASES = ("linear", "in", "out", "inout", "outin")
+GUIDE_COLORS = ("neutral", "red", "green", "blue", "yellow", "purple", "cyan", "black")
+FADES = ("in", "out", "none")
+
+POINT_DTYPE = np.dtype(
+    [
+        ("tick", np.int64),
+        ("beat", np.float64),
+        ("lane", np.float64),
+        ("size", np.float64),
+        ("kind", np.uint8),
+        ("critical", np.int8),  # -1 = None
+        ("flags", np.uint16),
+        ("timeScaleGroup", np.int32),
+        ("speedRatio", np.float64),
+        ("parent", np.int32),  # row in holds, -1 for singles
+        ("note", np.int32),  # position of the owning note in Score.notes
+    ]
+)
+
+HOLD_DTYPE = np.dtype(
+    [
+        ("kind", np.uint8),
+        ("critical", np.int8),
+        ("fake", np.bool_),
+        ("color", np.uint8),
+        ("fade", np.uint8),
+        ("note", np.int32),
+    ]
+)
+
+_MIN_LANE = -6
+_MAX_LANE = 6
+_HALF_BEAT = TICKS_PER_BEAT // 2
+
+_DIRECTION_CODES = {v: i for i, v in enumerate(DIRECTIONS)}
+_JUDGE_TYPE_CODES = {v: i for i, v in enumerate(JUDGE_TYPES)}
+_EASE_CODES = {v: i for i, v in enumerate(EASES)}
+_GUIDE_COLOR_CODES = {v: i for i, v in enumerate(GUIDE_COLORS)}
+_FADE_CODES = {v: i for i, v in enumerate(FADES)}
+
+
+def _critical_code(critical: bool | None) -> int:
+    return -1 if critical is None else int(critical)
+
+
+def _critical_value(code: int) -> bool | None:
+    return None if code < 0 else bool(code)
+
+
+def _point_row(point, kind: int, parent: int, note: int) -> tuple:
+    flags = 0
+    if getattr(point, "fake", False):
+        flags |= FLAG_FAKE
+    if point.tick is not None:
+        flags |= FLAG_TICK_NATIVE
+    if kind in (KIND_SINGLE, KIND_DAMAGE):
+        if point.trace is None:
+            flags |= FLAG_TRACE_UNSET
+        elif point.trace:
+            flags |= FLAG_TRACE
+    flags |= _DIRECTION_CODES[getattr(point, "direction", None)] << DIRECTION_SHIFT
+    flags |= (
+        _JUDGE_TYPE_CODES[getattr(point, "judgeType", "normal")] << JUDGE_TYPE_SHIFT
+    )
+    flags |= _EASE_CODES[getattr(point, "ease", "linear")] << EASE_SHIFT
+    return (
+        point_tick(point),
+        point.beat,
+        point.lane,
+        point.size,
+        kind,
+        _critical_code(getattr(point, "critical", None)),
+        flags,
+        point.timeScaleGroup,
+        point.speedRatio,
+        parent,
+        note,
+    )
+
+
+def _slide_point_kind(point: SlideStartPoint | SlideRelayPoint | SlideEndPoint) -> int:
+    if isinstance(point, SlideStartPoint):
+        return KIND_SLIDE_START
+    if isinstance(point, SlideEndPoint):
+        return KIND_SLIDE_END
+    return KIND_SLIDE_ATTACH if point.type == "attach" else KIND_SLIDE_TICK
+
+
+def _build_point(row: tuple):
+    tick, beat, lane, size, kind, critical, flags, tsg, speed_ratio = row[:9]
+    tick = tick if flags & FLAG_TICK_NATIVE else None
+    direction = DIRECTIONS[(flags >> DIRECTION_SHIFT) & 0b11]
+    judge_type = JUDGE_TYPES[(flags >> JUDGE_TYPE_SHIFT) & 0b11]
+    ease = EASES[(flags >> EASE_SHIFT) & 0b111]
+    if kind in (KIND_SINGLE, KIND_DAMAGE):
+        return Single(
+            beat=beat,
+            critical=_critical_value(critical),
+            lane=lane,
+            size=size,
+            fake=bool(flags & FLAG_FAKE),
+            timeScaleGroup=tsg,
+            speedRatio=speed_ratio,
+            trace=None if flags & FLAG_TRACE_UNSET else bool(flags & FLAG_TRACE),
+            direction=direction,
+            type="damage" if kind == KIND_DAMAGE else "single",
+            tick=tick,
+        )
+    if kind == KIND_SLIDE_START:
+        return SlideStartPoint(
+            beat=beat,
+            critical=_critical_value(critical),
+            ease=ease,
+            judgeType=judge_type,
+            lane=lane,
+            size=size,
+            timeScaleGroup=tsg,
+            speedRatio=speed_ratio,
+            tick=tick,
+        )
+    if kind in (KIND_SLIDE_TICK, KIND_SLIDE_ATTACH):
+        return SlideRelayPoint(
+            beat=beat,
+            ease=ease,
+            lane=lane,
+            size=size,
+            timeScaleGroup=tsg,
+            type="attach" if kind == KIND_SLIDE_ATTACH else "tick",
+            critical=_critical_value(critical),
+            fake=bool(flags & FLAG_FAKE),
+            speedRatio=speed_ratio,
+            tick=tick,
+        )
+    if kind == KIND_SLIDE_END:
+        return SlideEndPoint(
+            beat=beat,
+            critical=_critical_value(critical),
+            judgeType=judge_type,
+            lane=lane,
+            size=size,
+            timeScaleGroup=tsg,
+            speedRatio=speed_ratio,
+            direction=direction,
+            tick=tick,
+        )
+    return GuidePoint(
+        beat=beat,
+        ease=ease,
+        lane=lane,
+        size=size,
+        timeScaleGroup=tsg,
+        speedRatio=speed_ratio,
+        tick=tick,
+    )
+
+
+@dataclass
+class ScoreArrays:
+    """
+    Columnar form of a Score, built by ``Score.to_arrays()`` and turned back with
+    ``Score.from_arrays()``.
+
+    points: one POINT_DTYPE row per Single and per slide/guide point. Points of one hold are
+        contiguous and in connection order; ``parent`` is their row in ``holds``.
+    holds: one HOLD_DTYPE row per Slide/Guide.
+    others: every other note (Bpm, TimeScaleGroup, Volume, events) with its position in
+        Score.notes. These are few and stay as objects.
+    """
+
+    metadata: MetaData
+    points: np.ndarray
+    holds: np.ndarray
+    others: list[tuple[int, object]] = field(default_factory=list)
+    # hold row -> Guide.color_code
+    color_codes: dict[int, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_score(cls, score) -> "ScoreArrays":
+        points: list[tuple] = []
+        holds: list[tuple] = []
+        others: list[tuple[int, object]] = []
+        color_codes: dict[int, str] = {}
+        for i, note in enumerate(score.notes):
+            if isinstance(note, Single):
+                kind = KIND_DAMAGE if note.type == "damage" else KIND_SINGLE
+                points.append(_point_row(note, kind, -1, i))
+            elif isinstance(note, Slide):
+                parent = len(holds)
+                holds.append(
+                    (HOLD_SLIDE, _critical_code(note.critical), note.fake, 0, 0, i)
+                )
+                for conn in note.connections:
+                    points.append(_point_row(conn, _slide_point_kind(conn), parent, i))
+            elif isinstance(note, Guide):
+                parent = len(holds)
+                holds.append(
+                    (
+                        HOLD_GUIDE,
+                        -1,
+                        False,
+                        _GUIDE_COLOR_CODES[note.color],
+                        _FADE_CODES[note.fade],
+                        i,
+                    )
+                )
+                if note.color_code is not None:
+                    color_codes[parent] = note.color_code
+                for mp in note.midpoints:
+                    points.append(_point_row(mp, KIND_GUIDE_POINT, parent, i))
+            else:
+                others.append((i, deepcopy(note)))
+        return cls(
+            metadata=deepcopy(score.metadata),
+            points=np.array(points, dtype=POINT_DTYPE),
+            holds=np.array(holds, dtype=HOLD_DTYPE),
+            others=others,
+            color_codes=color_codes,
+        )
+
+    def to_notes(self) -> list:
+        placed: list[tuple[int, object]] = [(i, deepcopy(n)) for i, n in self.others]
+        hold_notes: list[Slide | Guide] = []
+        for row, (kind, critical, fake, color, fade, note) in enumerate(
+            self.holds.tolist()
+        ):
+            if kind == HOLD_SLIDE:
+                hold = Slide(critical=_critical_value(critical), fake=fake)
+            else:
+                hold = Guide(
+                    color=GUIDE_COLORS[color],
+                    fade=FADES[fade],
+                    color_code=self.color_codes.get(row),
+                )
+            hold_notes.append(hold)
+            placed.append((note, hold))
+        for row in self.points.tolist():
+            point = _build_point(row)
+            parent = row[9]
+            if parent < 0:
+                placed.append((row[10], point))
+            elif isinstance(hold_notes[parent], Slide):
+                hold_notes[parent].connections.append(point)
+            else:
+                hold_notes[parent].midpoints.append(point)
+        placed.sort(key=lambda x: x[0])
+        return [note for _, note in placed]
+
+    # ==== Vectorized operations ====
+
+    def combo_count(self) -> int:
+        """Same count as ``Score.combo_count``."""
+        points = self.points
+        kind = points["kind"]
+        count = int(np.count_nonzero(kind <= KIND_DAMAGE))
+
+        is_slide = points["parent"] >= 0
+        is_slide[is_slide] = self.holds["kind"][points["parent"][is_slide]] == HOLD_SLIDE
+        slide_points = points[is_slide]
+        if not len(slide_points):
+            return count
+
+        kind = slide_points["kind"]
+        judged = np.isin(kind, (KIND_SLIDE_START, KIND_SLIDE_END)) & (
+            (slide_points["flags"] >> JUDGE_TYPE_SHIFT) & 0b11
+            != _JUDGE_TYPE_CODES["none"]
+        )
+        relays = np.isin(kind, (KIND_SLIDE_TICK, KIND_SLIDE_ATTACH)) & (
+            slide_points["critical"] >= 0
+        )
+        count += int(np.count_nonzero(judged | relays))
+
+        # hold ticks every half beat, walked per slide in beat order
+        order = np.lexsort((slide_points["beat"], slide_points["parent"]))
+        parent = slide_points["parent"][order]
+        kind = kind[order]
+        tick = slide_points["tick"][order]
+        starts = np.flatnonzero(np.r_[True, parent[1:] != parent[:-1]])
+        ends = np.r_[starts[1:], len(parent)] - 1
+
+        start_tick = tick[starts]
+        eighth_tick = (start_tick + _HALF_BEAT) // _HALF_BEAT * _HALF_BEAT
+        has_ticks = (eighth_tick != start_tick) & (eighth_tick != tick[ends])
+
+        is_joint = (kind == KIND_SLIDE_START) | (kind == KIND_SLIDE_TICK)
+        joints = np.cumsum(is_joint)
+        group_base = np.repeat(joints[starts] - is_joint[starts], ends - starts + 1)
+        joints_before = joints - is_joint - group_base
+        closes = ((kind == KIND_SLIDE_END) | (kind == KIND_SLIDE_TICK)) & (
+            joints_before > 0
+        )
+        adj_end = -(-tick // _HALF_BEAT) * _HALF_BEAT
+        last_end = np.maximum.reduceat(
+            np.where(closes, adj_end, np.iinfo(np.int64).min // 2), starts
+        )
+        steps = np.maximum(0, (last_end - eighth_tick) // _HALF_BEAT)
+        return count + int(steps[has_ticks].sum())
+
+    def overlaps(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Row pairs (i, j) of distinct points that ``Score.shift()`` treats as colliding: exactly
+        the same beat and at least one shared lane cell, with lanes quantized the way
+        ``_calc_note_range`` does.
+        """
+        order = np.argsort(self.points["beat"], kind="stable")
+        beat = self.points["beat"][order]
+        lane = self.points["lane"][order]
+        size = self.points["size"][order]
+        left = np.trunc(lane - size + LANE_OFFSET).astype(np.int64)
+        right = left + np.trunc(size * 2).astype(np.int64)
+        first: list[np.ndarray] = []
+        second: list[np.ndarray] = []
+        for d in range(1, len(order)):
+            same = beat[:-d] == beat[d:]
+            if not same.any():
+                break
+            hit = same & (left[:-d] < right[d:]) & (left[d:] < right[:-d])
+            hit &= (left[:-d] < right[:-d]) & (left[d:] < right[d:])
+            first.append(order[:-d][hit])
+            second.append(order[d:][hit])
+        if not first:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty
+        return np.concatenate(first), np.concatenate(second)
+
+    def strip_speed_ratios(self):
+        """Vectorized ``Score.strip_speed_ratios``."""
+        self.points["speedRatio"] = 1.0
+
+    def strip_extended_lanes(self, resize_if_possible: bool = False):
+        """Vectorized ``Score.strip_extended_lanes``, with the same keep/resize rules."""
+        points = self.points
+        lane_start = points["lane"] - points["size"]
+        lane_end = points["lane"] + points["size"]
+        if resize_if_possible:
+            # shift the left end, then the middle
+            left = (lane_start < _MIN_LANE) & (lane_end > _MIN_LANE)
+            extra = (_MIN_LANE - lane_start[left]) / 2
+            points["size"][left] -= extra
+            points["lane"][left] += extra
+            # shift the right end, then the middle
+            right = (
+                (lane_end > _MAX_LANE)
+                & (lane_start < _MAX_LANE)
+                & (lane_start >= _MIN_LANE)
+            )
+            extra = (lane_end[right] - _MAX_LANE) / 2
+            points["size"][right] -= extra
+            points["lane"][right] -= extra
+            lane_start = points["lane"] - points["size"]
+            lane_end = points["lane"] + points["size"]
+        inside = (lane_start >= _MIN_LANE) & (lane_end <= _MAX_LANE)
+
+        # slides/guides whose first or last point is outside are deleted entirely
+        parent = points["parent"]
+        in_hold = parent >= 0
+        hold_rows = parent[in_hold]
+        hold_inside = inside[in_hold]
+        edge = np.r_[True, hold_rows[1:] != hold_rows[:-1]] | np.r_[
+            hold_rows[1:] != hold_rows[:-1], True
+        ]
+        keep_hold = np.ones(len(self.holds), dtype=bool)
+        keep_hold[hold_rows[edge & ~hold_inside]] = False
+
+        keep = inside.copy()
+        keep[in_hold] &= keep_hold[hold_rows]
+        new_rows = np.cumsum(keep_hold) - 1
+        points = points[keep]
+        in_hold = points["parent"] >= 0
+        points["parent"][in_hold] = new_rows[points["parent"][in_hold]]
+        self.points = points
+        self.color_codes = {
+            int(new_rows[row]): code
+            for row, code in self.color_codes.items()
+            if keep_hold[row]
+        }
+        self.holds = self.holds[keep_hold]
@@ -1,11 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from .tick import beat_follows_tick
 
-@dataclass
+
+@beat_follows_tick
+@dataclass(slots=True)
 class Bpm:
     beat: float
     bpm: float
     type: str = "bpm"
+    tick: int | None = field(default=None, compare=False, repr=False)
 
     def get_sus_sort_number(self) -> int:
         return 1
@@ -1,8 +1,12 @@
+from sys import intern
 from dataclasses import dataclass, field
 from typing import Literal, List
 
+from .tick import beat_follows_tick
 
-@dataclass
+
+@beat_follows_tick
+@dataclass(slots=True)
 class GuidePoint:
     beat: float
     ease: Literal["outin", "out", "linear", "in", "inout"]
@@ -10,9 +14,14 @@ class GuidePoint:
     size: float
     timeScaleGroup: int
     speedRatio: float = 1.0
+    tick: int | None = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self):
+        if self.ease is not None:
+            self.ease = intern(self.ease)
 
 
-@dataclass
+@dataclass(slots=True)
 class Guide:
     color: Literal[
         "neutral", "red", "green", "blue", "yellow", "purple", "cyan", "black"
@@ -8,7 +8,7 @@ from typing import Literal
 from .single import FeverChance, FeverStart, Skill
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HolodoriSkill:
     beat: float
     slot: int  # deck position (1-5) whose special skill fires here
@@ -18,7 +18,7 @@ class HolodoriSkill:
         return 3
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HolodoriChargeStart:
     beat: float
     type: Literal["holodoriChargeStart"] = "holodoriChargeStart"
@@ -27,7 +27,7 @@ class HolodoriChargeStart:
         return 3
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HolodoriChargeEnd:
     beat: float
     type: Literal["holodoriChargeEnd"] = "holodoriChargeEnd"
@@ -36,7 +36,7 @@ class HolodoriChargeEnd:
         return 3
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HolodoriFeverStart:
     beat: float
     type: Literal["holodoriFeverStart"] = "holodoriFeverStart"
@@ -45,7 +45,7 @@ class HolodoriFeverStart:
         return 3
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HolodoriFeverEnd:
     beat: float
     type: Literal["holodoriFeverEnd"] = "holodoriFeverEnd"
@@ -1,5 +1,7 @@
-from copy import deepcopy
-from dataclasses import dataclass, asdict
+from bisect import bisect_left, bisect_right, insort
+from copy import copy, deepcopy
+from dataclasses import dataclass, asdict, field
+from typing import TYPE_CHECKING
 
 from .metadata import MetaData, validate_metadata_dict_values
 from .bpm import Bpm, validate_bpm_dict_values
@@ -27,6 +29,11 @@ from .holodorievents import (
 )
 from .volume import Volume, validate_volume_dict_values
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .arrays import ScoreArrays
+
 _EVENTS = (Skill, FeverStart, FeverChance) + HOLODORI_EVENTS
 
 
@@ -37,10 +44,37 @@ def usc_lanes_to_sus_lanes(lane: float, size: float) -> int:
 # 1tickをbeatに変換
 BEAT_PER_TICK = round(4 / 1920, 6)
 
+# 1拍あたりのtick数
+TICKS_PER_BEAT = 480
+
 # ノーツリストを何小節区切りにするか
 # ※ノーツリスト = 重なりを調べるときに使用するリスト
 BAR_INTERVAL = 0.5
 
+_TimedPoint = (
+    Bpm
+    | TimeScalePoint
+    | Single
+    | SlideStartPoint
+    | SlideRelayPoint
+    | SlideEndPoint
+    | GuidePoint
+)
+
+
+def point_tick(point: _TimedPoint) -> int:
+    """Integer tick of a point, exact for tick-native points and rounded from beat otherwise."""
+    tick = point.tick
+    return round(point.beat * TICKS_PER_BEAT) if tick is None else tick
+
+
+def set_point_tick(point: _TimedPoint, tick: int):
+    """Place a point on ``tick``, keeping ``beat`` in sync as its derived view."""
+    # assigning beat drops the tick, so it goes first
+    point.beat = round(tick / TICKS_PER_BEAT, 6)
+    point.tick = tick
+
+
 # uscのレーン表記(中央が0.0)
 # ↓
 # 左端を1に変換するオフセット
@@ -55,28 +89,6 @@ def _calc_note_range(lane: float, size: float) -> list[int]:
     return [_ for _ in range(note_leftpos, note_leftpos + note_size)]
 
 
-# ノーツを入れるリストの番号をbeatの値から計算する
-def _calc_notelist_index(
-    note: Single | SlideStartPoint | SlideRelayPoint | SlideEndPoint | GuidePoint,
-) -> int:
-    return int(note.beat // BAR_INTERVAL)
-
-
-# BAR_INTERVALごとに区切ってノーツを入れたリストから、指定beatのリストと前後のリストにあるノーツを返す
-def _get_target_notelist(
-    split_tmp_notes: list[
-        list[Single | SlideStartPoint | SlideRelayPoint | SlideEndPoint | GuidePoint]
-    ],
-    target_note: (
-        Single | SlideStartPoint | SlideRelayPoint | SlideEndPoint | GuidePoint
-    ),
-) -> list[Single | SlideStartPoint | SlideRelayPoint | SlideEndPoint | GuidePoint]:
-    index = _calc_notelist_index(target_note)
-    start = max(0, index - 1)
-    end = min(len(split_tmp_notes), index + 2)
-    return sum(split_tmp_notes[start:end], [])
-
-
 # スライド、ガイドのpointを入れたリストを返す
 def _convert_tmp_notes(
     tmp_notes: list[Single | Slide | Guide],
@@ -94,47 +106,99 @@ def _convert_tmp_notes(
     return tmp
 
 
-# ノーツの一部または全てが重なっているか調べる
-def _get_overlap_note(
-    target_note: (
-        Single | SlideStartPoint | SlideRelayPoint | SlideEndPoint | GuidePoint
-    ),
-    split_tmp_notes: list[
-        list[Single | SlideStartPoint | SlideRelayPoint | SlideEndPoint | GuidePoint]
-    ],
-) -> Single | SlideStartPoint | SlideRelayPoint | SlideEndPoint | GuidePoint | None:
+_ShiftPoint = Single | SlideStartPoint | SlideRelayPoint | SlideEndPoint | GuidePoint
+
+
+class _OverlapIndex:
+    """Occupancy index used by ``Score.shift()``.
+
+    Every point is tracked by its current beat and a bitmask of the lanes it covers, and each
+    beat keeps the OR of the masks placed on it, so a collision query is a dict lookup and an AND.
+    Moving a point one tick relocates it between two cells instead of rebuilding any lists.
+
+    Collisions follow the old list-based rules exactly: points collide on exactly equal beats, a
+    point is only visible to targets within one ``BAR_INTERVAL`` of the bucket it started in, and
+    candidates are returned in (starting bucket, list order).
+    """
+
+    def __init__(self, points: list[_ShiftPoint]):
+        self._beats: dict[int, float] = {}  # id(point) -> current beat
+        self._masks: dict[int, int] = {}  # id(point) -> lane bitmask
+        self._order: dict[int, tuple[int, int]] = {}  # id(point) -> lookup order
+        self._occupied: dict[float, int] = {}  # beat -> OR of the lane masks on it
+        self._cells: dict[float, list[_ShiftPoint]] = {}  # beat -> points on it
 
-    t_note_range = set(_calc_note_range(target_note.lane, target_note.size))
-    t_note_beat = target_note.beat
+        lane_ranges = [_calc_note_range(p.lane, p.size) for p in points]
+        bias = -min((r[0] for r in lane_ranges if r), default=0)
+        for i, (point, lanes) in enumerate(zip(points, lane_ranges)):
+            key = id(point)
+            self._masks[key] = (
+                ((1 << len(lanes)) - 1) << (lanes[0] + bias) if lanes else 0
+            )
+            self._order[key] = (int(point.beat // BAR_INTERVAL), i)
+            self._place(point)
+
+    def _sort_key(self, point: _ShiftPoint) -> tuple[int, int]:
+        return self._order[id(point)]
+
+    def _place(self, point: _ShiftPoint):
+        beat = point.beat
+        self._beats[id(point)] = beat
+        insort(self._cells.setdefault(beat, []), point, key=self._sort_key)
+        self._occupied[beat] = self._occupied.get(beat, 0) | self._masks[id(point)]
+
+    def _remove(self, point: _ShiftPoint):
+        beat = self._beats[id(point)]
+        cell = self._cells[beat]
+        cell.remove(point)
+        if cell:
+            mask = 0
+            for other in cell:
+                mask |= self._masks[id(other)]
+            self._occupied[beat] = mask
+        else:
+            del self._cells[beat]
+            del self._occupied[beat]
+
+    def overlap(self, point: _ShiftPoint) -> _ShiftPoint | None:
+        """Return the first other point on the same beat that shares a lane, if any."""
+        beat = point.beat
+        mask = self._masks[id(point)]
+        if not self._occupied.get(beat, 0) & mask:
+            return None
+        bucket = int(beat // BAR_INTERVAL)
+        for other in self._cells[beat]:
+            # 同じインスタンス（ノーツ）の場合は飛ばす
+            if other is point:
+                continue
+            if self._masks[id(other)] & mask and (
+                abs(self._order[id(other)][0] - bucket) <= 1
+            ):
+                return other
+        return None
 
-    for note in _get_target_notelist(split_tmp_notes, target_note):
-        # 同じインスタンス（ノーツ）の場合は飛ばす
-        if target_note is note:
-            continue
-        # 同じ拍、かつノーツの一部または全てが重なっているか判定
-        note_range = _calc_note_range(note.lane, note.size)
-        if t_note_beat == note.beat and bool(t_note_range.intersection(note_range)):
-            return note
+    def move(self, point: _ShiftPoint, ticks: int):
+        """Move a point by ``ticks`` ticks, updating its beat and its cell."""
+        self._remove(point)
+        if point.tick is None:
+            point.beat += ticks * BEAT_PER_TICK
+        else:
+            set_point_tick(point, point.tick + ticks)
+        self._place(point)
 
-    return None
+    def swap(self, a: _ShiftPoint, b: _ShiftPoint):
+        """Swap the beats of two points."""
+        self._remove(a)
+        self._remove(b)
+        a_beat, a_tick = a.beat, a.tick
+        a.beat, a.tick = b.beat, b.tick
+        b.beat, b.tick = a_beat, a_tick
+        self._place(a)
+        self._place(b)
 
 
 # スライドが脱法（終点より後に中継点があるetc...）していないか調べ、修正する
-def _check_slide(
-    note: Slide,
-    split_tmp_notes: list[
-        list[
-            Single
-            | Skill
-            | FeverStart
-            | FeverChance
-            | SlideStartPoint
-            | SlideRelayPoint
-            | SlideEndPoint
-            | GuidePoint
-        ]
-    ],
-):
+def _check_slide(note: Slide, index: _OverlapIndex):
     for point in note.connections:
         if isinstance(point, SlideStartPoint):
             start_point = point
@@ -145,104 +209,104 @@ def _check_slide(
 
         if not isinstance(point, SlideEndPoint):
             while point.beat >= end_point.beat:
-                point.beat -= BEAT_PER_TICK
-                while _get_overlap_note(point, split_tmp_notes) != None:
-                    point.beat -= BEAT_PER_TICK
+                index.move(point, -1)
+                while index.overlap(point) != None:
+                    index.move(point, -1)
 
         if not isinstance(point, SlideStartPoint):
             while point.beat <= start_point.beat:
-                point.beat += BEAT_PER_TICK
-                while _get_overlap_note(point, split_tmp_notes) != None:
-                    point.beat += BEAT_PER_TICK
+                index.move(point, 1)
+                while index.overlap(point) != None:
+                    index.move(point, 1)
 
         if point.beat > end_point.beat:
-            point.beat, end_point.beat = end_point.beat, point.beat
+            index.swap(point, end_point)
 
 
-def _shift_slide(note: Slide, split_tmp_notes: list[Single | Slide | Guide]):
+def _shift_slide(note: Slide, index: _OverlapIndex):
     for point in note.connections:
-        while (overlap_note := _get_overlap_note(point, split_tmp_notes)) != None:
+        while (overlap_note := index.overlap(point)) != None:
             match point, overlap_note:
 
                 # スライド始点 + single
                 case SlideStartPoint(), Single():
                     if point.judgeType != "none" and overlap_note.trace:
-                        overlap_note.beat += BEAT_PER_TICK
+                        index.move(overlap_note, 1)
                     else:
-                        point.beat += BEAT_PER_TICK
+                        index.move(point, 1)
 
                 # スライド始点 + スライド始点
                 case SlideStartPoint(), SlideStartPoint():
                     if point.judgeType != "none" and overlap_note.judgeType == "none":
-                        overlap_note.beat += BEAT_PER_TICK
+                        index.move(overlap_note, 1)
                     else:
-                        point.beat += BEAT_PER_TICK
+                        index.move(point, 1)
 
                 # スライド始点 + スライド中継点
                 case SlideStartPoint(), SlideRelayPoint():
-                    overlap_note.beat += BEAT_PER_TICK
+                    index.move(overlap_note, 1)
 
                 # スライド始点 + スライド終点
                 case SlideStartPoint(), SlideEndPoint():
-                    point.beat += BEAT_PER_TICK
+                    index.move(point, 1)
 
                 # スライド中継点 + ノーツ
                 case SlideRelayPoint(), _:
-                    point.beat += BEAT_PER_TICK
+                    index.move(point, 1)
 
                 # スライド終点 + single
                 case SlideEndPoint(), Single():
-                    point.beat -= BEAT_PER_TICK
+                    index.move(point, -1)
 
                 # スライド終点 + スライド始点
                 case SlideEndPoint(), SlideStartPoint():
-                    overlap_note.beat += BEAT_PER_TICK
+                    index.move(overlap_note, 1)
 
                 # スライド終点 + スライド中継点
                 case SlideEndPoint(), SlideRelayPoint():
-                    overlap_note.beat += BEAT_PER_TICK
+                    index.move(overlap_note, 1)
 
                 # スライド終点 + スライド終点
                 case SlideEndPoint(), SlideEndPoint():
                     if point.judgeType == "none" or overlap_note.direction != None:
-                        point.beat -= BEAT_PER_TICK
+                        index.move(point, -1)
                     elif overlap_note.judgeType == "none" or point.direction != None:
-                        overlap_note.beat -= BEAT_PER_TICK
+                        index.move(overlap_note, -1)
                     else:
-                        point.beat -= BEAT_PER_TICK
+                        index.move(point, -1)
 
                 case SlideEndPoint(), _:
-                    point.beat -= BEAT_PER_TICK
+                    index.move(point, -1)
 
                 case _, _:
-                    point.beat += BEAT_PER_TICK
+                    index.move(point, 1)
 
-    _check_slide(note, split_tmp_notes)
+    _check_slide(note, index)
 
 
-def _shift_guide(note: Guide, split_tmp_notes: list[Single | Slide | Guide]):
+def _shift_guide(note: Guide, index: _OverlapIndex):
     for point in note.midpoints:
-        while _get_overlap_note(point, split_tmp_notes) != None:
-            point.beat += BEAT_PER_TICK
+        while index.overlap(point) != None:
+            index.move(point, 1)
 
     note.midpoints.sort(key=lambda x: x.beat)
 
 
-def _shift_single(note: Single, split_tmp_notes: list[Single | Slide | Guide]):
-    while (overlap_note := _get_overlap_note(note, split_tmp_notes)) != None:
+def _shift_single(note: Single, index: _OverlapIndex):
+    while (overlap_note := index.overlap(note)) != None:
         match note, overlap_note:
             case _, Single(trace=True):
-                overlap_note.beat += BEAT_PER_TICK
+                index.move(overlap_note, 1)
             case _, SlideStartPoint():
-                overlap_note.beat += BEAT_PER_TICK
+                index.move(overlap_note, 1)
             case _, SlideRelayPoint():
-                overlap_note.beat += BEAT_PER_TICK
+                index.move(overlap_note, 1)
             case _, SlideEndPoint():
-                overlap_note.beat -= BEAT_PER_TICK
+                index.move(overlap_note, -1)
             case _, GuidePoint():
-                overlap_note.beat += BEAT_PER_TICK
+                index.move(overlap_note, 1)
             case _, _:
-                note.beat += BEAT_PER_TICK
+                index.move(note, 1)
 
 
 # CUT HELPERS
@@ -467,6 +531,320 @@ def _truncate_guide_end(
     return result if len(result) >= 2 else None
 
 
+class _TempoMap:
+    """BPM segments of a Score with the elapsed seconds at the start of each one.
+
+    Built once from the sorted BPM changes and queried by binary search. ``matches`` tells
+    whether it still describes a notes list: the same list object, the same length, and at
+    each position a Bpm was built from, that same Bpm with the same (beat, bpm).
+    """
+
+    def __init__(self, notes: list, timeline: list[tuple[float, float]]):
+        self._notes = notes
+        self._length = len(notes)
+        # (position in notes, Bpm) for every BPM change
+        self._bpms = [(i, n) for i, n in enumerate(notes) if isinstance(n, Bpm)]
+        self._snapshot = [(b.beat, b.bpm) for _, b in self._bpms]
+
+        self.beats = [beat for beat, _ in timeline]
+        self.bpms = [bpm for _, bpm in timeline]
+        # seconds elapsed at the start of each segment, and at its end
+        self.starts = [0.0]
+        for i in range(1, len(timeline)):
+            prev_beat, prev_bpm = timeline[i - 1]
+            self.starts.append(
+                self.starts[-1] + (timeline[i][0] - prev_beat) / prev_bpm * 60.0
+            )
+        self.ends = self.starts[1:] + [float("inf")]
+        self._arrays = None
+
+    def matches(self, notes: list) -> bool:
+        return (
+            notes is self._notes
+            and len(notes) == self._length
+            and all(
+                notes[i] is b and (b.beat, b.bpm) == snap
+                for (i, b), snap in zip(self._bpms, self._snapshot)
+            )
+        )
+
+    def time_at_beat(self, beat: float) -> float:
+        i = bisect_right(self.beats, beat) - 1
+        if i < 0:
+            return 0.0
+        return self.starts[i] + (beat - self.beats[i]) / self.bpms[i] * 60.0
+
+    def beat_at_time(self, time: float) -> float:
+        i = bisect_left(self.ends, time)
+        return self.beats[i] + (time - self.starts[i]) * self.bpms[i] / 60.0
+
+    def arrays(self):
+        if self._arrays is None:
+            import numpy as np
+
+            self._arrays = tuple(
+                np.asarray(a, dtype=np.float64)
+                for a in (self.beats, self.bpms, self.starts, self.ends)
+            )
+        return self._arrays
+
+
+_HALF_BEAT_TICKS = TICKS_PER_BEAT // 2
+
+
+# Combo events of one note as (category, critical, beat, tick)
+def _note_combo_events(note):
+    if isinstance(note, Single):
+        yield (
+            "flicks" if note.direction is not None else "taps",
+            bool(note.critical),
+            note.beat,
+            point_tick(note),
+        )
+    elif isinstance(note, Slide):
+        connections = sorted(note.connections, key=lambda c: c.beat)
+        start_tick = point_tick(connections[0])
+        eighth_tick = start_tick + _HALF_BEAT_TICKS
+        if eighth_tick % _HALF_BEAT_TICKS:
+            eighth_tick -= eighth_tick % _HALF_BEAT_TICKS
+        end_tick = point_tick(connections[-1])
+        has_ticks = eighth_tick != start_tick and eighth_tick != end_tick
+        crit = bool(note.critical)
+        prev_joint: SlideStartPoint | SlideRelayPoint | None = None
+        for conn in connections:
+            if isinstance(conn, SlideStartPoint):
+                if conn.judgeType != "none":
+                    yield (
+                        "long_starts",
+                        bool(conn.critical),
+                        conn.beat,
+                        point_tick(conn),
+                    )
+                prev_joint = conn
+            elif isinstance(conn, SlideEndPoint):
+                if conn.judgeType != "none":
+                    cat = (
+                        "long_flick_ends"
+                        if conn.direction is not None
+                        else "long_ends"
+                    )
+                    yield (cat, bool(conn.critical), conn.beat, point_tick(conn))
+                if prev_joint is not None and has_ticks:
+                    adj_end = point_tick(conn)
+                    if adj_end % _HALF_BEAT_TICKS:
+                        adj_end += _HALF_BEAT_TICKS - adj_end % _HALF_BEAT_TICKS
+                    while eighth_tick < adj_end:
+                        yield (
+                            "long_continuations",
+                            crit,
+                            eighth_tick / TICKS_PER_BEAT,
+                            eighth_tick,
+                        )
+                        eighth_tick += _HALF_BEAT_TICKS
+            elif isinstance(conn, SlideRelayPoint):
+                if conn.type == "attach":
+                    if conn.critical is not None:
+                        yield (
+                            "long_relays",
+                            bool(conn.critical),
+                            conn.beat,
+                            point_tick(conn),
+                        )
+                else:
+                    if conn.critical is not None:
+                        yield (
+                            "long_relays",
+                            bool(conn.critical),
+                            conn.beat,
+                            point_tick(conn),
+                        )
+                    if prev_joint is not None and has_ticks:
+                        adj_end = point_tick(conn)
+                        if adj_end % _HALF_BEAT_TICKS:
+                            adj_end += _HALF_BEAT_TICKS - adj_end % _HALF_BEAT_TICKS
+                        while eighth_tick < adj_end:
+                            yield (
+                                "long_continuations",
+                                crit,
+                                eighth_tick / TICKS_PER_BEAT,
+                                eighth_tick,
+                            )
+                            eighth_tick += _HALF_BEAT_TICKS
+                    prev_joint = conn
+
+
+# Everything _note_combo_events reads from a note, to tell whether it was edited in place
+def _combo_signature(note) -> tuple:
+    if isinstance(note, Single):
+        return (note.beat, note.tick, note.critical, note.direction)
+    return (
+        note.critical,
+        tuple(
+            (
+                type(conn),
+                conn.beat,
+                conn.tick,
+                conn.critical,
+                getattr(conn, "judgeType", None),
+                getattr(conn, "direction", None),
+                getattr(conn, "type", None),
+            )
+            for conn in note.connections
+        ),
+    )
+
+
+class _ComboIndex:
+    """Sorted ticks of every combo event in a notes list.
+
+    Each note's contribution is kept by identity together with a snapshot of the fields it
+    was computed from. A refresh compares the snapshots (much cheaper than regenerating the
+    events), so notes that were added, removed or edited in place are the only ones
+    recomputed and applied to the sorted ticks (falling back to a rebuild for large changes);
+    total combo and combo before a tick are then ``len`` and ``bisect``.
+    """
+
+    def __init__(self):
+        # id -> (note, snapshot, number of times it is listed, ticks of one listing)
+        self._contributions: dict[
+            int, tuple[Single | Slide, tuple, int, list[int]]
+        ] = {}
+        self.ticks: list[int] = []
+
+    def refresh(self, notes: list):
+        current: dict[int, Single | Slide] = {}
+        counts: dict[int, int] = {}
+        for note in notes:
+            if isinstance(note, (Single, Slide)):
+                key = id(note)
+                if key in current:
+                    counts[key] += 1
+                else:
+                    current[key] = note
+                    counts[key] = 1
+
+        contributions = self._contributions
+        removed = []
+        added = []
+        for key in [key for key in contributions if key not in current]:
+            _, _, count, ticks = contributions.pop(key)
+            removed.extend([ticks] * count)
+        for key, note in current.items():
+            signature = _combo_signature(note)
+            count = counts[key]
+            cached = contributions.get(key)
+            if cached is not None:
+                if cached[1] == signature and cached[2] == count:
+                    continue
+                removed.extend([cached[3]] * cached[2])
+            ticks = [event[3] for event in _note_combo_events(note)]
+            contributions[key] = (note, signature, count, ticks)
+            added.extend([ticks] * count)
+        if not removed and not added:
+            return
+
+        if (len(removed) + len(added)) * 8 > len(contributions):
+            self.ticks = sorted(
+                tick
+                for _, _, count, ticks in contributions.values()
+                for _ in range(count)
+                for tick in ticks
+            )
+        else:
+            for ticks in removed:
+                for tick in ticks:
+                    del self.ticks[bisect_left(self.ticks, tick)]
+            for ticks in added:
+                for tick in ticks:
+                    insort(self.ticks, tick)
+
+
+# Base game equivalents of the extended guide colors / eases
+_BASE_GUIDE_COLORS = {
+    "neutral": "green",
+    "red": "yellow",
+    "green": "green",
+    "blue": "green",
+    "yellow": "yellow",
+    "purple": "yellow",
+    "cyan": "green",
+    "black": "green",
+}
+# XXX: Probably better to add an attach tick halfway, then switch ease
+# If anyone wants to PR this, feel free!
+_BASE_EASES = {
+    "outin": "in",
+    "out": "out",
+    "linear": "linear",
+    "in": "in",
+    "inout": "out",
+}
+
+_MIN_LANE = -6
+_MAX_LANE = 6
+
+
+# Fit a point into the base game lanes; returns whether it is (now) inside them
+def _fit_lanes(point, resize_if_possible: bool) -> bool:
+    # point.lane 0 (+1/-1 for each lane, based on middle of note, starting at center lane)
+    # point.size +0.5 for each lane.
+    lane_start = point.lane - point.size
+    lane_end = point.lane + point.size
+    if lane_start < _MIN_LANE:
+        if resize_if_possible and (lane_end > _MIN_LANE):
+            # shift the left end, then the middle
+            extra = abs(lane_start - _MIN_LANE)
+            point.size -= extra / 2
+            point.lane += extra / 2
+    if lane_end > _MAX_LANE:
+        if (
+            resize_if_possible
+            and (lane_start < _MAX_LANE)
+            and (lane_start >= _MIN_LANE)
+        ):
+            # shift the right end, then the middle
+            extra = abs(lane_end - _MAX_LANE)
+            point.size -= extra / 2
+            point.lane -= extra / 2
+    lane_start = point.lane - point.size
+    lane_end = point.lane + point.size
+    return lane_start >= _MIN_LANE and lane_end <= _MAX_LANE
+
+
+# strip_extended_lanes() for one note: the note, a rebuilt Slide/Guide, or None if deleted
+def _strip_note_lanes(note: Single | Slide | Guide, resize_if_possible: bool):
+    if isinstance(note, Single):
+        return note if _fit_lanes(note, resize_if_possible) else None
+    points = note.connections if isinstance(note, Slide) else note.midpoints
+    kept = []
+    for i, point in enumerate(points):
+        if _fit_lanes(point, resize_if_possible):
+            kept.append(point)
+        elif i == 0 or i == len(points) - 1:
+            return None
+    if isinstance(note, Slide):
+        return Slide(critical=note.critical, connections=kept, type=note.type)
+    return Guide(
+        note.color,
+        fade=note.fade,
+        midpoints=kept,
+        type=note.type,
+        color_code=note.color_code,
+    )
+
+
+# Copy a note together with its points, leaving every other note untouched
+def _copy_note(note):
+    note = copy(note)
+    if isinstance(note, Slide):
+        note.connections = [copy(c) for c in note.connections]
+    elif isinstance(note, Guide):
+        note.midpoints = [copy(m) for m in note.midpoints]
+    elif isinstance(note, TimeScaleGroup):
+        note.changes = [copy(c) for c in note.changes]
+    return note
+
+
 def usc_remove_fake_field(notes: list) -> list:
     for note in notes:
         note.pop("fake", 0)
@@ -500,6 +878,45 @@ class Score:
         | Slide
         | Guide
     ]
+    _tempo_map: _TempoMap | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _combo_index: "_ComboIndex | None" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # id() of note objects shared with a clone; copied before they are modified
+    _borrowed: set[int] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+
+    def clone(self) -> "Score":
+        """
+        Cheap structural copy. The notes list and metadata are copied, but the note objects are
+        shared between both scores until one of them modifies a note through a Score method
+        (shift(), cut(), strip_speed_ratios(), ...), which then copies only that note first.
+
+        Notes edited directly (``score.notes[0].lane = 1``) are not copied; deepcopy the score
+        when doing that.
+        """
+        shared = {id(note) for note in self.notes}
+        self._borrowed |= shared
+        clone = Score(metadata=deepcopy(self.metadata), notes=list(self.notes))
+        clone._borrowed = shared
+        return clone
+
+    def _own(self, index: int):
+        """Return ``notes[index]``, copying it first if it is shared with a clone."""
+        note = self.notes[index]
+        if id(note) in self._borrowed:
+            self._borrowed.discard(id(note))
+            note = self.notes[index] = _copy_note(note)
+        return note
+
+    def _own_all(self, types: type | tuple[type, ...] = object):
+        if self._borrowed:
+            for i, note in enumerate(self.notes):
+                if isinstance(note, types):
+                    self._own(i)
 
     def validate(self) -> bool:
         metadata_validation = validate_metadata_dict_values(self.metadata.__dict__)
@@ -575,42 +992,100 @@ class Score:
 
     def replace_extended_guide_colors(
         self,
-        color_map: dict = {
-            "neutral": "green",
-            "red": "yellow",
-            "green": "green",
-            "blue": "green",
-            "yellow": "yellow",
-            "purple": "yellow",
-            "cyan": "green",
-            "black": "green",
-        },
+        color_map: dict = _BASE_GUIDE_COLORS,
     ):
-        for note in self.notes:
-            if not isinstance(note, Guide):
+        for i, note in enumerate(self.notes):
+            if not isinstance(note, Guide) or color_map[note.color] == note.color:
                 continue
+            note = self._own(i)
             note.color = color_map[note.color]
 
     def replace_extended_ease(self):
-        # XXX: Probably better to add an attach tick halfway, then switch ease
-        # If anyone wants to PR this, feel free!
-        ease_map = {
-            "outin": "in",
-            "out": "out",
-            "linear": "linear",
-            "in": "in",
-            "inout": "out",
-        }
-        for note in self.notes:
+        for i, note in enumerate(self.notes):
             if not isinstance(note, (Slide, Guide)):
                 continue
+            points = note.connections if isinstance(note, Slide) else note.midpoints
+            if all(
+                _BASE_EASES[p.ease] == p.ease for p in points if hasattr(p, "ease")
+            ):
+                continue
+            note = self._own(i)
             if isinstance(note, Slide):
                 for c in note.connections:
                     if hasattr(c, "ease"):
-                        c.ease = ease_map[c.ease]
+                        c.ease = _BASE_EASES[c.ease]
             if isinstance(note, Guide):
                 for m in note.midpoints:
-                    m.ease = ease_map[m.ease]
+                    m.ease = _BASE_EASES[m.ease]
+
+    def normalize(
+        self,
+        *,
+        shift: bool = False,
+        replace_extended_ease: bool = False,
+        replace_extended_guide_colors: bool = False,
+        delete_fake_notes: bool = False,
+        delete_damage_notes: bool = False,
+        strip_extended_lanes: bool = False,
+        strip_speed_ratios: bool = False,
+    ) -> int:
+        """
+        Apply the selected export normalizations, in the order listed. The result is the same as
+        calling the methods of the same name one after another, but everything after shift()
+        (which needs the whole score) is done in a single pass over the notes.
+
+        Returns the number of TimeScaleGroups (layers) in the result.
+        """
+        if shift:
+            self.shift()
+
+        notes = []
+        layers = 0
+        for index, note in enumerate(self.notes):
+            if isinstance(note, TimeScaleGroup):
+                layers += 1
+            elif delete_fake_notes and hasattr(note, "fake") and note.fake:
+                continue
+            elif (
+                delete_damage_notes
+                and isinstance(note, Single)
+                and note.type == "damage"
+            ):
+                continue
+            elif isinstance(note, (Single, Slide, Guide)):
+                points = _convert_tmp_notes([note])
+                if (
+                    replace_extended_ease
+                    and any(
+                        _BASE_EASES[p.ease] != p.ease
+                        for p in points
+                        if hasattr(p, "ease")
+                    )
+                ) or (
+                    replace_extended_guide_colors
+                    and isinstance(note, Guide)
+                    and _BASE_GUIDE_COLORS[note.color] != note.color
+                ) or (
+                    strip_speed_ratios and any(p.speedRatio != 1.0 for p in points)
+                ):
+                    note = self._own(index)
+                    for point in _convert_tmp_notes([note]):
+                        if replace_extended_ease and hasattr(point, "ease"):
+                            point.ease = _BASE_EASES[point.ease]
+                        if strip_speed_ratios:
+                            point.speedRatio = 1.0
+                    if replace_extended_guide_colors and isinstance(note, Guide):
+                        note.color = _BASE_GUIDE_COLORS[note.color]
+                if strip_extended_lanes:
+                    stripped = _strip_note_lanes(note, False)
+                    if stripped is None:
+                        continue
+                    if stripped is not note and id(note) in self._borrowed:
+                        self._borrowed.add(id(stripped))
+                    note = stripped
+            notes.append(note)
+        self.notes = notes
+        return layers
 
     def sort_by_beat(self):
         self.notes = sorted(
@@ -630,12 +1105,54 @@ class Score:
             ),
         )
 
+    def to_arrays(self) -> "ScoreArrays":
+        """Pack the score into structured NumPy arrays (see ``notes.arrays.ScoreArrays``)."""
+        from .arrays import ScoreArrays
+
+        return ScoreArrays.from_score(self)
+
+    @classmethod
+    def from_arrays(cls, arrays: "ScoreArrays") -> "Score":
+        return cls(metadata=deepcopy(arrays.metadata), notes=arrays.to_notes())
+
+    def _timed_points(self):
+        for note in self.notes:
+            if isinstance(note, (Bpm, Single)):
+                yield note
+            elif isinstance(note, TimeScaleGroup):
+                yield from note.changes
+            elif isinstance(note, Slide):
+                yield from note.connections
+            elif isinstance(note, Guide):
+                yield from note.midpoints
+
+    def use_ticks(self, enabled: bool = True):
+        """
+        Switch the score to (or back from) the tick-native timeline.
+
+        When enabled, every Bpm, TimeScalePoint, Single, slide point and guide point stores its
+        integer ``tick`` and ``beat`` becomes a view derived from it (beats are snapped to the
+        480 ticks per beat grid). shift(), cut() and combo counting then compare ticks exactly
+        instead of rounding beats. Move tick-native points with ``set_point_tick``; assigning
+        ``beat`` directly takes a point off the tick timeline.
+
+        The SUS, MMWS and PJSK loaders can produce tick-native scores directly with ``ticks=True``.
+        """
+        self._own_all()
+        for point in self._timed_points():
+            if enabled:
+                set_point_tick(point, point_tick(point))
+            else:
+                point.tick = None
+        self.invalidate_caches()
+
     # フェードなしガイドの中継点を生成する
     def add_point_without_fade(self):
-        for note in self.notes:
+        for i, note in enumerate(self.notes):
             if not isinstance(note, Guide):
                 continue
             if note.fade == "none":
+                note = self._own(i)
                 end_point = note.midpoints[-1]
                 note.append(
                     GuidePoint(
@@ -658,123 +1175,29 @@ class Score:
         Slides/Guides that have a start/end outside the lanes are fully deleted, otherwise only the connectors are deleted.
         """
         notes = []
-        max_lane = 6
-        min_lane = -6
-        for note in self.notes:
-            if (
-                isinstance(note, Bpm)
-                or isinstance(note, TimeScaleGroup)
-                or isinstance(note, _EVENTS + (Volume,))
-            ):
-                notes.append(note)
-                continue
-            if isinstance(note, Single):
-                # note.lane 0 (+1/-1 for each lane, based on middle of note, starting at center lane)
-                # note.size +0.5 for each lane.
-                lane_start = note.lane - note.size
-                lane_end = note.lane + note.size
-                if lane_start < min_lane:
-                    if resize_if_possible and (lane_end > min_lane):
-                        # shift the left end, then the middle
-                        extra = abs(lane_start - min_lane)
-                        note.size -= extra / 2
-                        note.lane += extra / 2
-                if lane_end > max_lane:
-                    if (
-                        resize_if_possible
-                        and (lane_start < max_lane)
-                        and (lane_start >= min_lane)
-                    ):
-                        # shift the right end, then the middle
-                        extra = abs(lane_end - max_lane)
-                        note.size -= extra / 2
-                        note.lane -= extra / 2
-                lane_start = note.lane - note.size
-                lane_end = note.lane + note.size
-                if lane_start >= min_lane and lane_end <= max_lane:
-                    notes.append(note)
-            if isinstance(note, Slide):
-                connectors = []
-                should_add = True
-                for i, connector in enumerate(note.connections):
-                    lane_start = connector.lane - connector.size
-                    lane_end = connector.lane + connector.size
-                    added = False
-                    if lane_start < min_lane:
-                        if resize_if_possible and (lane_end > min_lane):
-                            # shift the left end, then the middle
-                            extra = abs(lane_start - min_lane)
-                            connector.size -= extra / 2
-                            connector.lane += extra / 2
-                    if lane_end > max_lane:
-                        if (
-                            resize_if_possible
-                            and (lane_start < max_lane)
-                            and (lane_start >= min_lane)
-                        ):
-                            # shift the right end, then the middle
-                            extra = abs(lane_end - max_lane)
-                            connector.size -= extra / 2
-                            connector.lane -= extra / 2
-                    lane_start = connector.lane - connector.size
-                    lane_end = connector.lane + connector.size
-                    if lane_start >= min_lane and lane_end <= max_lane:
-                        connectors.append(connector)
-                        added = True
-                    if (i == 0 or i == len(note.connections) - 1) and not added:
-                        should_add = False
-                if should_add:
-                    notes.append(
-                        Slide(
-                            critical=note.critical,
-                            connections=connectors,
-                            type=note.type,
-                        )
-                    )
-            if isinstance(note, Guide):
-                midpoints = []
-                should_add = True
-                for i, midpoint in enumerate(note.midpoints):
-                    lane_start = midpoint.lane - midpoint.size
-                    lane_end = midpoint.lane + midpoint.size
-                    added = False
-                    if lane_start < min_lane:
-                        if resize_if_possible and (lane_end > min_lane):
-                            # shift the left end, then the middle
-                            extra = abs(lane_start - min_lane)
-                            midpoint.size -= extra / 2
-                            midpoint.lane += extra / 2
-                    if lane_end > max_lane:
-                        if (
-                            resize_if_possible
-                            and (lane_start < max_lane)
-                            and (lane_start >= min_lane)
-                        ):
-                            # shift the right end, then the middle
-                            extra = abs(lane_end - max_lane)
-                            midpoint.size -= extra / 2
-                            midpoint.lane -= extra / 2
-                    lane_start = midpoint.lane - midpoint.size
-                    lane_end = midpoint.lane + midpoint.size
-                    if lane_start >= min_lane and lane_end <= max_lane:
-                        midpoints.append(midpoint)
-                        added = True
-                    if (i == 0 or i == len(note.midpoints) - 1) and not added:
-                        should_add = False
-                if should_add:
-                    notes.append(
-                        Guide(
-                            note.color,
-                            fade=note.fade,
-                            midpoints=midpoints,
-                            type=note.type,
-                            color_code=note.color_code,
-                        )
-                    )
+        for index, note in enumerate(self.notes):
+            if isinstance(note, (Single, Slide, Guide)):
+                if resize_if_possible and not all(
+                    _MIN_LANE <= p.lane - p.size and p.lane + p.size <= _MAX_LANE
+                    for p in _convert_tmp_notes([note])
+                ):
+                    note = self._own(index)
+                stripped = _strip_note_lanes(note, resize_if_possible)
+                if stripped is None:
+                    continue
+                if stripped is not note and id(note) in self._borrowed:
+                    self._borrowed.add(id(stripped))
+                note = stripped
+            notes.append(note)
         self.notes = notes
 
     def strip_speed_ratios(self) -> None:
-        for note in self.notes:
+        for i, note in enumerate(self.notes):
+            if not isinstance(note, (Single, Slide, Guide)) or all(
+                p.speedRatio == 1.0 for p in _convert_tmp_notes([note])
+            ):
+                continue
+            note = self._own(i)
             if isinstance(note, Single):
                 note.speedRatio = 1.0
             elif isinstance(note, Slide):
@@ -818,7 +1241,11 @@ class Score:
 
         self.notes.extend(new_groups)
 
-        for note in self.notes:
+        for i, note in enumerate(self.notes):
+            if isinstance(note, (Single, Slide, Guide)) and any(
+                p.speedRatio != 1.0 for p in _convert_tmp_notes([note])
+            ):
+                note = self._own(i)
             if isinstance(note, Single) and note.speedRatio != 1.0:
                 note.timeScaleGroup = ratio_to_group[note.speedRatio]
                 note.speedRatio = 1.0
@@ -903,6 +1330,7 @@ class Score:
 
     # 重なっているノーツをずらす
     def shift(self):
+        self._own_all((Single, Slide, Guide))
         tmp_notes = []
 
         for note in self.notes:
@@ -913,14 +1341,7 @@ class Score:
             ):
                 continue
             tmp_notes.append(note)
-        tmp_notes = _convert_tmp_notes(tmp_notes)
-
-        max_beat = max(tmp_notes, key=lambda x: x.beat).beat
-
-        split_tmp_notes = [list() for _ in range(int(max_beat // BAR_INTERVAL + 1))]
-
-        for note in tmp_notes:
-            split_tmp_notes[_calc_notelist_index(note)].append(note)
+        index = _OverlapIndex(_convert_tmp_notes(tmp_notes))
 
         for note in self.notes:
             if (
@@ -931,11 +1352,12 @@ class Score:
                 continue
 
             if isinstance(note, Single):
-                _shift_single(note, split_tmp_notes)
+                _shift_single(note, index)
             elif isinstance(note, Slide):
-                _shift_slide(note, split_tmp_notes)
+                _shift_slide(note, index)
             elif isinstance(note, Guide):
-                _shift_guide(note, split_tmp_notes)
+                _shift_guide(note, index)
+        self.invalidate_caches()
 
     def _bpm_timeline(self) -> list[tuple[float, float]]:
         bpms = sorted(
@@ -947,31 +1369,54 @@ class Score:
             bpms.insert(0, Bpm(beat=0.0, bpm=bpms[0].bpm))
         return [(b.beat, b.bpm) for b in bpms]
 
+    def _get_tempo_map(self) -> _TempoMap:
+        tempo_map = self._tempo_map
+        if tempo_map is None or not tempo_map.matches(self.notes):
+            tempo_map = self._tempo_map = _TempoMap(self.notes, self._bpm_timeline())
+        return tempo_map
+
+    def invalidate_caches(self):
+        """
+        Drop cached timing and combo data. Only needed after replacing a note that is not a
+        Bpm with a Bpm in place (``notes[i] = Bpm(...)`` where ``notes[i]`` was something
+        else). Reassigning or resizing the list, replacing a Bpm and editing a Bpm's
+        beat/bpm are picked up automatically, and the combo index checks every Single and
+        Slide on each use.
+        """
+        self._tempo_map = None
+        self._combo_index = None
+
     def time_at_beat(self, target_beat: float) -> float:
-        timeline = self._bpm_timeline()
-        elapsed = 0.0
-        for i, (beat, bpm) in enumerate(timeline):
-            next_beat = timeline[i + 1][0] if i + 1 < len(timeline) else target_beat
-            segment_end = min(next_beat, target_beat)
-            if segment_end > beat:
-                elapsed += (segment_end - beat) / bpm * 60.0
-            if segment_end >= target_beat:
-                break
-        return elapsed
+        """
+        Seconds elapsed at ``target_beat``, from a tempo map cached until the BPM changes.
+        Edits to the notes list and its Bpms are detected, except turning a non-Bpm entry
+        into a Bpm in place without changing the list length; call ``invalidate_caches``
+        after that.
+        """
+        return self._get_tempo_map().time_at_beat(target_beat)
 
     def beat_at_time(self, target_time: float) -> float:
-        timeline = self._bpm_timeline()
-        elapsed = 0.0
-        for i, (beat, bpm) in enumerate(timeline):
-            next_beat = timeline[i + 1][0] if i + 1 < len(timeline) else float("inf")
-            segment_duration = (next_beat - beat) / bpm * 60.0
-            if elapsed + segment_duration >= target_time:
-                remaining = target_time - elapsed
-                return beat + remaining * bpm / 60.0
-            elapsed += segment_duration
-        last_beat, last_bpm = timeline[-1]
-        remaining = target_time - elapsed
-        return last_beat + remaining * last_bpm / 60.0
+        return self._get_tempo_map().beat_at_time(target_time)
+
+    def times_at_beats(self, beats: "np.ndarray") -> "np.ndarray":
+        """Vectorized ``time_at_beat`` over an array of beats."""
+        import numpy as np
+
+        seg_beats, seg_bpms, seg_starts, _ = self._get_tempo_map().arrays()
+        beats = np.asarray(beats, dtype=np.float64)
+        i = np.searchsorted(seg_beats, beats, side="right") - 1
+        j = np.maximum(i, 0)
+        times = seg_starts[j] + (beats - seg_beats[j]) / seg_bpms[j] * 60.0
+        return np.where(i < 0, 0.0, times)
+
+    def beats_at_times(self, times: "np.ndarray") -> "np.ndarray":
+        """Vectorized ``beat_at_time`` over an array of times in seconds."""
+        import numpy as np
+
+        seg_beats, seg_bpms, seg_starts, seg_ends = self._get_tempo_map().arrays()
+        times = np.asarray(times, dtype=np.float64)
+        i = np.searchsorted(seg_ends, times, side="left")
+        return seg_beats[i] + (times - seg_starts[i]) * seg_bpms[i] / 60.0
 
     def _note_beat(
         self,
@@ -1008,137 +1453,32 @@ class Score:
                 max_beat = mb
         return self.time_at_beat(max_beat)
 
+    def _get_combo_index(self) -> "_ComboIndex":
+        combo_index = self._combo_index
+        if combo_index is None:
+            combo_index = self._combo_index = _ComboIndex()
+        combo_index.refresh(self.notes)
+        return combo_index
+
     @property
     def combo_count(self) -> int:
-        return sum(1 for _ in self.combo_events())
+        return len(self._get_combo_index().ticks)
 
     def combo_events(self):
-        TICKS_PER_BEAT = 480
-        HALF_BEAT = TICKS_PER_BEAT // 2
         for note in self.notes:
-            if isinstance(note, Single):
-                yield (
-                    "flicks" if note.direction is not None else "taps",
-                    bool(note.critical),
-                    note.beat,
-                )
-            elif isinstance(note, Slide):
-                connections = sorted(note.connections, key=lambda c: c.beat)
-                start_tick = round(connections[0].beat * TICKS_PER_BEAT)
-                eighth_tick = start_tick + HALF_BEAT
-                if eighth_tick % HALF_BEAT:
-                    eighth_tick -= eighth_tick % HALF_BEAT
-                end_tick = round(connections[-1].beat * TICKS_PER_BEAT)
-                has_ticks = eighth_tick != start_tick and eighth_tick != end_tick
-                crit = bool(note.critical)
-                prev_joint: SlideStartPoint | SlideRelayPoint | None = None
-                for conn in connections:
-                    if isinstance(conn, SlideStartPoint):
-                        if conn.judgeType != "none":
-                            yield ("long_starts", bool(conn.critical), conn.beat)
-                        prev_joint = conn
-                    elif isinstance(conn, SlideEndPoint):
-                        if conn.judgeType != "none":
-                            cat = (
-                                "long_flick_ends"
-                                if conn.direction is not None
-                                else "long_ends"
-                            )
-                            yield (cat, bool(conn.critical), conn.beat)
-                        if prev_joint is not None and has_ticks:
-                            adj_end = round(conn.beat * TICKS_PER_BEAT)
-                            if adj_end % HALF_BEAT:
-                                adj_end += HALF_BEAT - adj_end % HALF_BEAT
-                            while eighth_tick < adj_end:
-                                yield (
-                                    "long_continuations",
-                                    crit,
-                                    eighth_tick / TICKS_PER_BEAT,
-                                )
-                                eighth_tick += HALF_BEAT
-                    elif isinstance(conn, SlideRelayPoint):
-                        if conn.type == "attach":
-                            if conn.critical is not None:
-                                yield ("long_relays", bool(conn.critical), conn.beat)
-                        else:
-                            if conn.critical is not None:
-                                yield ("long_relays", bool(conn.critical), conn.beat)
-                            if prev_joint is not None and has_ticks:
-                                adj_end = round(conn.beat * TICKS_PER_BEAT)
-                                if adj_end % HALF_BEAT:
-                                    adj_end += HALF_BEAT - adj_end % HALF_BEAT
-                                while eighth_tick < adj_end:
-                                    yield (
-                                        "long_continuations",
-                                        crit,
-                                        eighth_tick / TICKS_PER_BEAT,
-                                    )
-                                    eighth_tick += HALF_BEAT
-                            prev_joint = conn
+            for category, critical, beat, _ in _note_combo_events(note):
+                yield (category, critical, beat)
 
     @property
     def note_count(self) -> int:
         return self.combo_count
 
+    def combo_before_tick(self, cutoff_tick: int) -> int:
+        """Number of combo events strictly before ``cutoff_tick``."""
+        return bisect_left(self._get_combo_index().ticks, cutoff_tick)
+
     def _combo_before_beat(self, cutoff_beat: float) -> int:
-        TICKS_PER_BEAT = 480
-        HALF_BEAT = TICKS_PER_BEAT // 2
-        cutoff_tick = round(cutoff_beat * TICKS_PER_BEAT)
-        count = 0
-        for note in self.notes:
-            if isinstance(note, Single):
-                if round(note.beat * TICKS_PER_BEAT) < cutoff_tick:
-                    count += 1
-            elif isinstance(note, Slide):
-                connections = sorted(note.connections, key=lambda c: c.beat)
-                start_tick = round(connections[0].beat * TICKS_PER_BEAT)
-                eighth_tick = start_tick + HALF_BEAT
-                if eighth_tick % HALF_BEAT:
-                    eighth_tick -= eighth_tick % HALF_BEAT
-                end_tick = round(connections[-1].beat * TICKS_PER_BEAT)
-                has_ticks = eighth_tick != start_tick and eighth_tick != end_tick
-                prev_joint: SlideStartPoint | SlideRelayPoint | None = None
-                for conn in connections:
-                    conn_tick = round(conn.beat * TICKS_PER_BEAT)
-                    if isinstance(conn, SlideStartPoint):
-                        if conn.judgeType != "none" and conn_tick < cutoff_tick:
-                            count += 1
-                        prev_joint = conn
-                    elif isinstance(conn, SlideEndPoint):
-                        if conn.judgeType != "none" and conn_tick < cutoff_tick:
-                            count += 1
-                        if prev_joint is not None and has_ticks:
-                            adj_end = conn_tick
-                            if adj_end % HALF_BEAT:
-                                adj_end += HALF_BEAT - adj_end % HALF_BEAT
-                            effective_end = min(adj_end, cutoff_tick)
-                            if eighth_tick < effective_end:
-                                steps = (
-                                    effective_end - eighth_tick - 1
-                                ) // HALF_BEAT + 1
-                                count += steps
-                                eighth_tick += steps * HALF_BEAT
-                    elif isinstance(conn, SlideRelayPoint):
-                        if conn.type == "attach":
-                            if conn.critical is not None and conn_tick < cutoff_tick:
-                                count += 1
-                        else:
-                            # visible tick + 8th hold tick at same beat = 2 combo (correct)
-                            if conn.critical is not None and conn_tick < cutoff_tick:
-                                count += 1
-                            if prev_joint is not None and has_ticks:
-                                adj_end = conn_tick
-                                if adj_end % HALF_BEAT:
-                                    adj_end += HALF_BEAT - adj_end % HALF_BEAT
-                                effective_end = min(adj_end, cutoff_tick)
-                                if eighth_tick < effective_end:
-                                    steps = (
-                                        effective_end - eighth_tick - 1
-                                    ) // HALF_BEAT + 1
-                                    count += steps
-                                    eighth_tick += steps * HALF_BEAT
-                            prev_joint = conn
-        return count
+        return self.combo_before_tick(round(cutoff_beat * TICKS_PER_BEAT))
 
     def cut(
         self,
@@ -1149,8 +1489,8 @@ class Score:
         if start_at is None and end_at is None:
             raise ValueError("At least one of start_at or end_at must be specified")
 
-        TICKS_PER_BEAT = 480
-
+        self._own_all()
+        tick_native = any(point.tick is not None for point in self._timed_points())
         start_beat = self.beat_at_time(start_at) if start_at is not None else 0.0
         end_beat = self.beat_at_time(end_at) if end_at is not None else float("inf")
 
@@ -1301,6 +1641,11 @@ class Score:
                     mp.timeScaleGroup = old_to_new.get(mp.timeScaleGroup, 0)
 
         self.notes = list(new_tsgs) + kept
+        if tick_native:
+            # put the points created at the cut edges on the tick timeline too
+            for point in self._timed_points():
+                if point.tick is None:
+                    set_point_tick(point, point_tick(point))
 
         if start_at is None:
             combo_before = 0
@@ -1309,6 +1654,13 @@ class Score:
 
         if not keep_position and start_at is not None and start_beat > 0:
             shift = start_beat
+
+            def _shift_point(point: _TimedPoint):
+                if point.tick is None:
+                    point.beat -= shift
+                else:
+                    set_point_tick(point, point.tick - cut_start_tick)
+
             for note in self.notes:
                 if isinstance(note, TimeScaleGroup):
                     trimmed: list[TimeScalePoint] = []
@@ -1317,26 +1669,36 @@ class Score:
                         if tp.beat < shift:
                             last_before = tp
                         else:
-                            trimmed.append(
-                                TimeScalePoint(
-                                    beat=tp.beat - shift, timeScale=tp.timeScale
-                                )
+                            moved = TimeScalePoint(
+                                beat=tp.beat - shift, timeScale=tp.timeScale
                             )
+                            if tp.tick is not None:
+                                set_point_tick(moved, tp.tick - cut_start_tick)
+                            trimmed.append(moved)
                     if last_before is not None and (not trimmed or trimmed[0].beat > 0):
                         trimmed.insert(
                             0,
-                            TimeScalePoint(beat=0.0, timeScale=last_before.timeScale),
+                            TimeScalePoint(
+                                beat=0.0,
+                                timeScale=last_before.timeScale,
+                                tick=0 if tick_native else None,
+                            ),
                         )
                     note.changes = trimmed
+                elif isinstance(note, Bpm) and note.tick is not None:
+                    set_point_tick(note, max(0, note.tick - cut_start_tick))
                 elif isinstance(note, (Bpm, Volume)):
                     note.beat = max(0.0, note.beat - shift)
-                elif isinstance(note, (Single,) + _EVENTS):
+                elif isinstance(note, _EVENTS):
                     note.beat -= shift
+                elif isinstance(note, Single):
+                    _shift_point(note)
                 elif isinstance(note, Slide):
                     for conn in note.connections:
-                        conn.beat -= shift
+                        _shift_point(conn)
                 elif isinstance(note, Guide):
                     for mp in note.midpoints:
-                        mp.beat -= shift
+                        _shift_point(mp)
+            self.invalidate_caches()
 
         return combo_before, (cut_start_tick, cut_end_tick)
@@ -1,8 +1,11 @@
-from dataclasses import dataclass
+from sys import intern
+from dataclasses import dataclass, field
 from typing import Literal
 
+from .tick import beat_follows_tick
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Skill:
     # lane: int = 0
     # width: int = 1
@@ -13,7 +16,7 @@ class Skill:
         return 3
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FeverChance:
     # lane: int = 15
     # width: int = 1
@@ -24,7 +27,7 @@ class FeverChance:
         return 3
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FeverStart:
     # lane: int = 15
     # width: int = 1
@@ -35,7 +38,8 @@ class FeverStart:
         return 3
 
 
-@dataclass(kw_only=True)
+@beat_follows_tick
+@dataclass(kw_only=True, slots=True)
 class Single:
     beat: float
     critical: bool | None = None
@@ -47,6 +51,14 @@ class Single:
     trace: bool | None = None
     direction: Literal["left", "up", "right"] | None = None
     type: Literal["single", "damage"] = "single"
+    # integer tick for tick-native scores (see Score.use_ticks); beat is derived from it
+    tick: int | None = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self):
+        # share one copy of the literal strings, JSON loaders hand out a fresh str per note
+        self.type = intern(self.type)
+        if self.direction is not None:
+            self.direction = intern(self.direction)
 
     def get_sus_sort_number(self) -> int:
         return 3
@@ -1,8 +1,12 @@
+from sys import intern
 from dataclasses import dataclass, field
 from typing import Literal, List, Union
 
+from .tick import beat_follows_tick
 
-@dataclass
+
+@beat_follows_tick
+@dataclass(slots=True)
 class SlideStartPoint:
     beat: float
     critical: bool
@@ -13,9 +17,17 @@ class SlideStartPoint:
     timeScaleGroup: int
     speedRatio: float = 1.0
     type: str = "start"
+    tick: int | None = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self):
+        if self.ease is not None:
+            self.ease = intern(self.ease)
+        self.judgeType = intern(self.judgeType)
+        self.type = intern(self.type)
 
 
-@dataclass
+@beat_follows_tick
+@dataclass(slots=True)
 class SlideRelayPoint:
     beat: float
     ease: Literal["outin", "out", "linear", "in", "inout"]
@@ -26,9 +38,16 @@ class SlideRelayPoint:
     critical: bool | None = None
     fake: bool = False
     speedRatio: float = 1.0
+    tick: int | None = field(default=None, compare=False, repr=False)
 
+    def __post_init__(self):
+        if self.ease is not None:
+            self.ease = intern(self.ease)
+        self.type = intern(self.type)
 
-@dataclass
+
+@beat_follows_tick
+@dataclass(slots=True)
 class SlideEndPoint:
     beat: float
     critical: bool
@@ -39,9 +58,16 @@ class SlideEndPoint:
     speedRatio: float = 1.0
     direction: Literal["left", "up", "right"] | None = None
     type: str = "end"
+    tick: int | None = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self):
+        self.judgeType = intern(self.judgeType)
+        if self.direction is not None:
+            self.direction = intern(self.direction)
+        self.type = intern(self.type)
 
 
-@dataclass
+@dataclass(slots=True)
 class Slide:
     critical: bool
     fake: bool = False  # isdummy for UntitledSekai
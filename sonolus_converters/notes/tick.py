@@ -0,0 +1,18 @@
+def beat_follows_tick(cls):
+    """
+    Make assigning ``beat`` on a slotted point class drop its ``tick``.
+
+    On tick-native points (see Score.use_ticks) ``beat`` is only a view of ``tick``, so a
+    plain ``point.beat = x`` would leave the two disagreeing. Writing ``beat`` now takes the
+    point off the tick grid instead; use ``set_point_tick`` to move a tick-native point.
+    Reads still go straight to the slot.
+    """
+    beat = cls.__dict__["beat"]
+    tick = cls.__dict__["tick"]
+
+    def set_beat(self, value):
+        beat.__set__(self, value)
+        tick.__set__(self, None)
+
+    cls.beat = property(beat.__get__, set_beat)
+    return cls
@@ -1,14 +1,18 @@
 from dataclasses import dataclass, field
 from typing import List
 
+from .tick import beat_follows_tick
 
-@dataclass
+
+@beat_follows_tick
+@dataclass(slots=True)
 class TimeScalePoint:
     beat: float
     timeScale: float
+    tick: int | None = field(default=None, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeScaleGroup:
     changes: List[TimeScalePoint] = field(default_factory=list)
     type: str = "timeScaleGroup"
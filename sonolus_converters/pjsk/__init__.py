@@ -1,3 +1,3 @@
-from .loader import load, load_raw
+from .loader import load, load_data, load_raw
 from .exporter import export
 from .detector import detect
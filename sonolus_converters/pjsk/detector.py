@@ -2,21 +2,62 @@ import base64
 import gzip
 import json
 import io
+import re
+import string
+
+from ..utils import inflate_prefix
+
+_B64_ALPHABET = (string.ascii_letters + string.digits + "+/=").encode()
+_B64_PREFIX = 16 * 1024  # base64 characters decoded by detect_prefix
+_INFLATE_PREFIX = 4 * 1024
+_KEY_RE = re.compile(rb'"(?:NoteList|MusicScoreEventDataList)"\s*:')
+
+
+def detect_prefix(data: bytes) -> bool:
+    """
+    Cheap positive check for the base64(gzip(json)) server format: the whole input is
+    base64, and the first inflated kilobytes open a JSON object with one of the score
+    keys. ``False`` means undecided; ``detect`` gives the exact answer.
+    """
+    if not data or len(data) % 4 or data.translate(None, _B64_ALPHABET):
+        return False
+    try:
+        decoded = base64.b64decode(data[:_B64_PREFIX], validate=True)
+    except ValueError:
+        return False
+    if decoded[:2] != b"\x1f\x8b":
+        return False
+    text = inflate_prefix(decoded, _INFLATE_PREFIX)
+    return (
+        text is not None
+        and text.lstrip()[:1] == b"{"
+        and _KEY_RE.search(text) is not None
+    )
 
 
 def detect(data: bytes) -> bool:
+    return decode_score(data) is not None
+
+
+def decode_score(data: bytes) -> dict | None:
+    """
+    Decode base64(gzip(json)) server data, or ``None`` if ``data`` is not a score in
+    that format. The result can be passed to ``pjsk.load_data``.
+    """
     try:
         decoded = base64.b64decode(data, validate=True)
     except Exception:
-        return False
+        return None
 
     if decoded[:2] != b"\x1f\x8b":
-        return False
+        return None
 
     try:
         with gzip.GzipFile(fileobj=io.BytesIO(decoded), mode="rb") as gz:
             parsed = json.loads(gz.read())
     except (gzip.BadGzipFile, json.JSONDecodeError, EOFError):
-        return False
+        return None
 
-    return "NoteList" in parsed and "MusicScoreEventDataList" in parsed
+    if "NoteList" in parsed and "MusicScoreEventDataList" in parsed:
+        return parsed
+    return None
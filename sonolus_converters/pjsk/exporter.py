@@ -6,7 +6,7 @@ import math
 from pathlib import Path
 from typing import IO
 
-from ..notes.score import Score
+from ..notes.score import Score, point_tick
 from ..notes.bpm import Bpm
 from ..notes.timescale import TimeScaleGroup
 from ..notes.single import Single, Skill, FeverChance, FeverStart
@@ -124,7 +124,7 @@ def export(
                     "$id": next_ref(),
                     "id": next_id(),
                     "eventType": 0,
-                    "ticks": _beat_to_ticks(note.beat),
+                    "ticks": point_tick(note),
                     "changeValue": note.bpm,
                 }
             )
@@ -135,7 +135,7 @@ def export(
                         "$id": next_ref(),
                         "id": next_id(),
                         "eventType": 1,
-                        "ticks": _beat_to_ticks(point.beat),
+                        "ticks": point_tick(point),
                         "changeValue": point.timeScale,
                     }
                 )
@@ -224,7 +224,7 @@ def export(
             continue
 
         if isinstance(note, Single):
-            ticks = _beat_to_ticks(note.beat)
+            ticks = point_tick(note)
             lane_start, lane_end = _unconvert_lane(note.lane, note.size)
             critical = 1 if note.critical else 0
             direction = _DIRECTION_MAP_REV.get(note.direction, 0)
@@ -263,7 +263,7 @@ def export(
             )
 
             for i, conn in enumerate(note.connections):
-                ticks = _beat_to_ticks(conn.beat)
+                ticks = point_tick(conn)
                 lane_start, lane_end = _unconvert_lane(conn.lane, conn.size)
                 note_line_type = _EASE_MAP_REV.get(getattr(conn, "ease", "linear"), 0)
 
@@ -358,7 +358,7 @@ def export(
             )
 
             for i, mp in enumerate(note.midpoints):
-                ticks = _beat_to_ticks(mp.beat)
+                ticks = point_tick(mp)
                 lane_start, lane_end = _unconvert_lane(mp.lane, mp.size)
                 note_line_type = _EASE_MAP_REV.get(mp.ease, 0)
                 critical = 1 if note.color == "yellow" else 0
@@ -58,9 +58,12 @@ def load_raw(data: os.PathLike | IO[bytes] | bytes | str) -> dict:
     return _decode(raw)
 
 
-def load(data: os.PathLike | IO[bytes] | bytes | str) -> Score:
-    pjsk = load_raw(data)
+def load(data: os.PathLike | IO[bytes] | bytes | str, ticks: bool = False) -> Score:
+    return load_data(load_raw(data), ticks)
 
+
+def load_data(pjsk: dict, ticks: bool = False) -> Score:
+    """Load an already decoded score, as returned by ``load_raw``."""
     metadata = MetaData(
         title="",
         artist="",
@@ -74,22 +77,25 @@ def load(data: os.PathLike | IO[bytes] | bytes | str) -> Score:
 
     for event in pjsk.get("MusicScoreEventDataList", []):
         event_type = event["eventType"]
-        ticks = event["ticks"]
-        beat = _tick_to_beat(ticks)
+        tick = event["ticks"]
+        beat = _tick_to_beat(tick)
         value = event["changeValue"]
+        native_tick = tick if ticks else None
 
         if event_type == 0:
-            notes.append(Bpm(beat=beat, bpm=float(value)))
+            notes.append(Bpm(beat=beat, bpm=float(value), tick=native_tick))
         elif event_type == 1:
             if tsg is None:
                 tsg = TimeScaleGroup()
                 notes.append(tsg)
-            tsg.append(TimeScalePoint(beat=beat, timeScale=float(value)))
+            tsg.append(
+                TimeScalePoint(beat=beat, timeScale=float(value), tick=native_tick)
+            )
         elif event_type == 2:
             notes.append(Volume(beat=beat, volume=float(value)))
 
     if not any(isinstance(n, Bpm) for n in notes):
-        notes.insert(0, Bpm(beat=0.0, bpm=120.0))
+        notes.insert(0, Bpm(beat=0.0, bpm=120.0, tick=0 if ticks else None))
 
     note_list = pjsk.get("NoteList", [])
     notes_by_id: dict[int, dict] = {n["id"]: n for n in note_list}
@@ -118,27 +124,28 @@ def load(data: os.PathLike | IO[bytes] | bytes | str) -> Score:
         is_guide = head["category"] in (9, 10, 11)
 
         if is_guide:
-            _build_guide(chain, notes)
+            _build_guide(chain, notes, ticks)
         else:
-            _build_slide(chain, notes)
+            _build_slide(chain, notes, ticks)
 
     for n in note_list:
         if n["id"] in consumed:
             continue
         if not n.get("IsSingle", True):
             continue
-        _build_single(n, notes)
+        _build_single(n, notes, ticks)
 
     score = Score(metadata=metadata, notes=notes)
     score.sort_by_beat()
     return score
 
 
-def _build_single(n: dict, notes: list) -> None:
+def _build_single(n: dict, notes: list, tick_native: bool = False) -> None:
     category = n["category"]
     note_type = n["type"]
     ticks = n["ticks"]
     beat = _tick_to_beat(ticks)
+    tick = ticks if tick_native else None
     lane, size = _convert_lane(n["laneStart"], n["laneEnd"])
     critical = note_type == 1
     direction_val = n.get("direction", 0)
@@ -158,6 +165,7 @@ def _build_single(n: dict, notes: list) -> None:
                 speedRatio=speed_ratio,
                 trace=False,
                 direction=None,
+                tick=tick,
             )
         )
     elif category == 3:
@@ -174,6 +182,7 @@ def _build_single(n: dict, notes: list) -> None:
                 speedRatio=speed_ratio,
                 trace=False,
                 direction=direction,
+                tick=tick,
             )
         )
     elif category in (4, 5):
@@ -187,6 +196,7 @@ def _build_single(n: dict, notes: list) -> None:
                 speedRatio=speed_ratio,
                 trace=True,
                 direction=None,
+                tick=tick,
             )
         )
     elif category == 8:
@@ -203,17 +213,19 @@ def _build_single(n: dict, notes: list) -> None:
                 speedRatio=speed_ratio,
                 trace=True,
                 direction=direction,
+                tick=tick,
             )
         )
 
 
-def _build_slide(chain: list[dict], notes: list) -> None:
+def _build_slide(chain: list[dict], notes: list, tick_native: bool = False) -> None:
     head = chain[0]
     critical = head["type"] == 1
     connections: list = []
 
     for i, n in enumerate(chain):
         beat = _tick_to_beat(n["ticks"])
+        tick = n["ticks"] if tick_native else None
         lane, size = _convert_lane(n["laneStart"], n["laneEnd"])
         ease = _EASE_MAP.get(n.get("noteLineType", 0), "linear")
         category = n["category"]
@@ -238,6 +250,7 @@ def _build_slide(chain: list[dict], notes: list) -> None:
                     size=size,
                     timeScaleGroup=0,
                     speedRatio=speed_ratio,
+                    tick=tick,
                 )
             )
         elif i == len(chain) - 1:
@@ -264,6 +277,7 @@ def _build_slide(chain: list[dict], notes: list) -> None:
                     timeScaleGroup=0,
                     speedRatio=speed_ratio,
                     direction=direction,
+                    tick=tick,
                 )
             )
         else:
@@ -287,6 +301,7 @@ def _build_slide(chain: list[dict], notes: list) -> None:
                     type="attach" if is_skip else "tick",
                     critical=relay_critical,
                     speedRatio=speed_ratio,
+                    tick=tick,
                 )
             )
 
@@ -295,7 +310,7 @@ def _build_slide(chain: list[dict], notes: list) -> None:
     notes.append(slide)
 
 
-def _build_guide(chain: list[dict], notes: list) -> None:
+def _build_guide(chain: list[dict], notes: list, tick_native: bool = False) -> None:
     head = chain[0]
     critical = head["type"] == 1
     color = "yellow" if critical else "green"
@@ -303,6 +318,7 @@ def _build_guide(chain: list[dict], notes: list) -> None:
     midpoints: list[GuidePoint] = []
     for n in chain:
         beat = _tick_to_beat(n["ticks"])
+        tick = n["ticks"] if tick_native else None
         lane, size = _convert_lane(n["laneStart"], n["laneEnd"])
         ease = _EASE_MAP.get(n.get("noteLineType", 0), "linear")
 
@@ -314,6 +330,7 @@ def _build_guide(chain: list[dict], notes: list) -> None:
                 size=size,
                 timeScaleGroup=0,
                 speedRatio=n.get("speedRatio", 1.0),
+                tick=tick,
             )
         )
 
@@ -1,3 +1,3 @@
 from .exporter import export
-from .loader import load
+from .loader import load, loads, IncrementalSusLoader
 from .detector import detect
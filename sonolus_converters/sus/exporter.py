@@ -1,13 +1,15 @@
+import heapq
 import math
+from bisect import bisect_right
 
-from copy import deepcopy
 from pathlib import Path
 import io
-from typing import Union
+import os
+from typing import Iterable, Iterator, TextIO, Union
 
 from typing import cast
 from ..version import __version__
-from ..notes.score import Score
+from ..notes.score import Score, point_tick
 from ..notes.bpm import Bpm
 from ..notes.timescale import TimeScaleGroup, TimeScalePoint
 from ..notes.single import Single, Skill, FeverStart, FeverChance
@@ -73,15 +75,37 @@ class _SusNote:
 
 
 class _ChannelProvider:
+    """
+    Interval-scheduling allocator for slide/guide channels. Holds must be requested
+    in order of start tick; each gets the lowest channel whose previous hold ended
+    before it starts. Channels past the 36 base36 ones are handed out when more holds
+    overlap than that; ``_channel_id`` decides whether they can be written.
+    """
+
     def __init__(self):
-        self.channels: dict[int, tuple[int, int]] = {k: (0, 0) for k in range(36)}
+        self.free: list[int] = []  # min-heap of released channels
+        self.busy: list[tuple[int, int]] = []  # min-heap of (end tick, channel)
+        self.count = 0
 
     def generate(self, start_tick: int, end_tick: int) -> int:
-        for key, (s, e) in self.channels.items():
-            if (s == 0 and e == 0) or end_tick < s or start_tick > e:
-                self.channels[key] = (start_tick, end_tick)
-                return key
+        while self.busy and self.busy[0][0] < start_tick:
+            heapq.heappush(self.free, heapq.heappop(self.busy)[1])
+        if self.free:
+            channel = heapq.heappop(self.free)
+        else:
+            channel = self.count
+            self.count += 1
+        heapq.heappush(self.busy, (end_tick, channel))
+        return channel
+
+
+def _channel_id(channel: int, extended: bool = False) -> str:
+    # 0-35 are the standard single-character channels. With ``extended``, overflow
+    # channels use two characters ("10" = 36 ... "zz" = 1295); only this package's
+    # sus and bandori_sus loaders read those headers back
+    if channel >= (36 * 36 if extended else 36):
         raise RuntimeError("No more slide channels available")
+    return _to_base36(channel)
 
 
 # SUS WRITING
@@ -91,6 +115,38 @@ class _NoteMap:
     def __init__(self):
         self.data: list[tuple[int, str, float]] = []  # (tick_offset, data, speedRatio)
         self.ticks_per_measure: int = 0
+        self.gcd: int = 0  # of all tick offsets
+        self.has_speed: bool = False
+
+    def add(self, tick_offset: int, data: str, speed: float) -> None:
+        self.data.append((tick_offset, data, speed))
+        self.gcd = math.gcd(self.gcd, tick_offset)
+        if abs(speed - 1.0) > 0.0001:
+            self.has_speed = True
+
+    def pack(self) -> list[str]:
+        """
+        Lay the entries out as the data parts of one or more lines. The n-th entry
+        to land on a cell goes to the n-th line, so stacked notes take as few lines
+        as possible and keep their order.
+        """
+        gcd = math.gcd(self.gcd, self.ticks_per_measure)
+        count = self.ticks_per_measure // gcd
+        has_speed = self.has_speed
+        empty = "00,1.0" if has_speed else "00"
+
+        rows: list[list[str]] = []
+        depth: dict[int, int] = {}
+        for tick_off, d, sr in self.data:
+            idx = (tick_off % self.ticks_per_measure) // gcd
+            row = depth.get(idx, 0)
+            depth[idx] = row + 1
+            if row == len(rows):
+                rows.append([empty] * count)
+            rows[row][idx] = f"{d},{_format_number(sr)}" if has_speed else d
+
+        sep = " " if has_speed else ""
+        return [sep.join(row) for row in rows]
 
 
 def _score_to_sus(
@@ -119,7 +175,7 @@ def _score_to_sus(
     til_index = 0
     for note in convert_holodori_events(score.notes):
         if isinstance(note, Bpm):
-            bpms.append((_beat_to_tick(note.beat), note.bpm))
+            bpms.append((point_tick(note), note.bpm))
 
         elif isinstance(note, Volume):
             volumes.append((_beat_to_tick(note.beat), note.volume))
@@ -128,7 +184,7 @@ def _score_to_sus(
             til: list[tuple[int, float]] = []
             for cp in cast(TimeScaleGroup, note).changes:
                 cp = cast(TimeScalePoint, cp)
-                til.append((_beat_to_tick(cp.beat), cp.timeScale))
+                til.append((point_tick(cp), cp.timeScale))
             tils.append(til)
             til_index += 1
 
@@ -142,7 +198,7 @@ def _score_to_sus(
             taps.append(_SusNote(_beat_to_tick(note.beat), 15, 1, 2))
 
         elif isinstance(note, Single):
-            tick = _beat_to_tick(note.beat)
+            tick = point_tick(note)
             lane = _usc_to_sus_lane(note.lane, note.size)
             width = _usc_to_sus_width(note.size)
             sr = note.speedRatio
@@ -161,10 +217,10 @@ def _score_to_sus(
         elif isinstance(note, Slide):
             slide: list[_SusNote] = []
             conns = sorted(note.connections, key=lambda c: c.beat)
-            start_tick = _beat_to_tick(conns[0].beat)
+            start_tick = point_tick(conns[0])
 
             for step in conns:
-                tick = _beat_to_tick(step.beat)
+                tick = point_tick(step)
                 lane = _usc_to_sus_lane(step.lane, step.size)
                 width = _usc_to_sus_width(step.size)
                 sr = step.speedRatio
@@ -233,11 +289,11 @@ def _score_to_sus(
             guide_slide: list[_SusNote] = []
             points = sorted(note.midpoints, key=lambda p: p.beat)
             is_critical = note.color == "yellow"
-            start_tick = _beat_to_tick(points[0].beat) if points else 0
+            start_tick = point_tick(points[0]) if points else 0
 
             for idx, step in enumerate(points):
                 step = cast(GuidePoint, step)
-                tick = _beat_to_tick(step.beat)
+                tick = point_tick(step)
                 lane = _usc_to_sus_lane(step.lane, step.size)
                 width = _usc_to_sus_width(step.size)
                 sr = step.speedRatio
@@ -292,7 +348,18 @@ def _score_to_sus(
 # SUS TEXT GENERATION
 
 
-def _dump_sus(
+def _channel_entries(
+    groups: list[list[_SusNote]], prefix: str, extended: bool = False
+) -> Iterator[tuple[_SusNote, str]]:
+    ch_prov = _ChannelProvider()
+    for group in sorted(groups, key=lambda s: s[0].tick):
+        channel = ch_prov.generate(group[0].tick, group[-1].tick)
+        ch_str = _channel_id(channel, extended)
+        for n in group:
+            yield n, prefix + _to_base36(n.lane) + ch_str
+
+
+def _iter_sus(
     taps: list[_SusNote],
     directionals: list[_SusNote],
     slides: list[list[_SusNote]],
@@ -304,7 +371,13 @@ def _dump_sus(
     metadata: Score,
     comment: str,
     measure_extensions: bool = False,
-) -> str:
+    extended_channels: bool = False,
+) -> Iterator[str]:
+    """
+    Yield the lines of a SUS document. The header and timing sections are small and
+    built up front; note data is produced one measure block at a time, so it can be
+    written out without ever holding the whole document.
+    """
     lines: list[str] = []
     tpb = TICKS_PER_BEAT
 
@@ -344,27 +417,32 @@ def _dump_sus(
         lines.append(f"#{mstr}02: {_format_number(length)}")
     lines.append("")
 
-    # Build bar tick lookup (reversed for searching)
+    # Bar index: parallel lists sorted by measure (and therefore start tick)
+    bar_measures: list[int] = []
+    bar_lens: list[float] = []
+    bar_starts: list[int] = []
     acc = 0
-    bar_tick_list: list[tuple[int, float, int]] = []  # (measure, length, start_tick)
     for i, (measure, length) in enumerate(sorted_bl):
-        start_tick = acc
+        bar_measures.append(measure)
+        bar_lens.append(length)
+        bar_starts.append(acc)
         if i + 1 < len(sorted_bl):
             acc += int((sorted_bl[i + 1][0] - measure) * length * tpb)
-        bar_tick_list.append((measure, length, start_tick))
-    bar_tick_list.reverse()
+
+    def bar_at_tick(tick: int) -> int:
+        return bisect_right(bar_starts, tick) - 1
 
     def get_measure_from_tick(tick: int) -> int:
-        for measure, length, start_tick in bar_tick_list:
-            if tick >= start_tick:
-                return measure + int((tick - start_tick) / tpb / length)
-        return 0
+        i = bar_at_tick(tick)
+        if i < 0:
+            return 0
+        return bar_measures[i] + int((tick - bar_starts[i]) / tpb / bar_lens[i])
 
     def get_tick_from_measure(m: int) -> int:
-        for measure, length, start_tick in bar_tick_list:
-            if measure <= m:
-                return start_tick + int((m - measure) * length * tpb)
-        return 0
+        i = bisect_right(bar_measures, m) - 1
+        if i < 0:
+            return 0
+        return bar_starts[i] + int((m - bar_measures[i]) * bar_lens[i] * tpb)
 
     # BPM definitions
     bpm_ids: dict[float, str] = {}
@@ -421,99 +499,90 @@ def _dump_sus(
     lines.append("#HISPEED 00")
     lines.append("#MEASUREHS 00")
     lines.append("")
+    yield from lines
 
     # NOTE DATA
     measures_map: dict[int, dict[str, _NoteMap]] = {}
 
-    def append_data(tick: int, info: str, data_str: str, speed: float = 1.0):
-        for measure, length, start_tick in bar_tick_list:
-            if tick >= start_tick:
-                cur_measure = measure + int((tick - start_tick) / tpb / length)
-                if cur_measure not in measures_map:
-                    measures_map[cur_measure] = {}
-                nm = measures_map[cur_measure].setdefault(info, _NoteMap())
-                nm.data.append((tick - start_tick, data_str, speed))
-                nm.ticks_per_measure = int(length * tpb)
-                break
-
-    def append_note(n: _SusNote, prefix: str, channel: str = ""):
-        info = prefix + _to_base36(n.lane) + channel
-        append_data(n.tick, info, str(n.type) + _to_base36(n.width), n.speedRatio)
-
-    def write_note_lines() -> list[str]:
-        result: list[str] = []
+    def place_notes(entries: Iterable[tuple[_SusNote, str]]) -> None:
+        """Place ``(note, info)`` pairs into ``measures_map`` in order.
+
+        Entries mostly arrive in tick order, so the bar of the previous entry is
+        tried first and the bar index is only bisected when the tick leaves it.
+        """
+        i = lo = 0
+        hi: float = 0
+        for n, info in entries:
+            tick = n.tick
+            if not lo <= tick < hi:
+                i = bar_at_tick(tick)
+                if i < 0:
+                    lo = hi = 0
+                    continue
+                lo = bar_starts[i]
+                hi = bar_starts[i + 1] if i + 1 < len(bar_starts) else math.inf
+            length = bar_lens[i]
+            cur_measure = bar_measures[i] + int((tick - lo) / tpb / length)
+            nm = measures_map.setdefault(cur_measure, {}).setdefault(info, _NoteMap())
+            nm.add(tick - lo, str(n.type) + _to_base36(n.width), n.speedRatio)
+            nm.ticks_per_measure = int(length * tpb)
+
+    def write_note_lines() -> Iterator[str]:
         for measure in sorted(measures_map.keys()):
+            result: list[str] = []
             mstr = _mbs(measure, result)
-            note_map = measures_map[measure]
-            for info, nm in note_map.items():
-                conflicts: list[tuple[int, str, float]] = []
-
-                gcd = nm.ticks_per_measure
-                for tick_off, _, _ in nm.data:
-                    gcd = math.gcd(tick_off, gcd)
-
-                count = nm.ticks_per_measure // gcd
-                has_speed = any(abs(sr - 1.0) > 0.0001 for _, _, sr in nm.data)
-
-                data = ["00,1.0" if has_speed else "00"] * count
-                for tick_off, d, sr in nm.data:
-                    idx = (tick_off % nm.ticks_per_measure) // gcd
-                    if data[idx][:2] != "00":
-                        conflicts.append((tick_off, d, sr))
-                    else:
-                        data[idx] = f"{d},{_format_number(sr)}" if has_speed else d
-
-                sep = " " if has_speed else ""
-                result.append(f"#{mstr}{info}:{sep.join(data)}")
-
-                while conflicts:
-                    temp: list[tuple[int, str, float]] = []
-                    data2 = ["00,1.0" if has_speed else "00"] * count
-                    for tick_off, d, sr in conflicts:
-                        idx = (tick_off % nm.ticks_per_measure) // gcd
-                        if data2[idx][:2] != "00":
-                            temp.append((tick_off, d, sr))
-                        else:
-                            data2[idx] = f"{d},{_format_number(sr)}" if has_speed else d
-                    result.append(f"#{mstr}{info}:{sep.join(data2)}")
-                    conflicts = temp
-
-        return result
+            for info, nm in measures_map[measure].items():
+                for data in nm.pack():
+                    result.append(f"#{mstr}{info}:{data}")
+            yield from result
 
     # Taps
     measures_map.clear()
-    for tap in sorted(taps, key=lambda n: n.tick):
-        append_note(tap, "1")
-    lines.extend(write_note_lines())
+    place_notes(
+        (tap, "1" + _to_base36(tap.lane)) for tap in sorted(taps, key=lambda n: n.tick)
+    )
+    yield from write_note_lines()
 
     # Directionals
     measures_map.clear()
-    for d in sorted(directionals, key=lambda n: n.tick):
-        append_note(d, "5")
-    lines.extend(write_note_lines())
+    place_notes(
+        (d, "5" + _to_base36(d.lane))
+        for d in sorted(directionals, key=lambda n: n.tick)
+    )
+    yield from write_note_lines()
 
     # Slides
     measures_map.clear()
-    ch_prov = _ChannelProvider()
-    for slide in sorted(slides, key=lambda s: s[0].tick):
-        ch = ch_prov.generate(slide[0].tick, slide[-1].tick)
-        ch_str = _to_base36(ch)
-        for n in slide:
-            append_note(n, "3", ch_str)
-    lines.extend(write_note_lines())
+    place_notes(_channel_entries(slides, "3", extended_channels))
+    yield from write_note_lines()
 
     # Guides
     measures_map.clear()
-    ch_prov_g = _ChannelProvider()
-    for guide in sorted(guides, key=lambda s: s[0].tick):
-        ch = ch_prov_g.generate(guide[0].tick, guide[-1].tick)
-        ch_str = _to_base36(ch)
-        for n in guide:
-            append_note(n, "9", ch_str)
-    lines.extend(write_note_lines())
+    place_notes(_channel_entries(guides, "9", extended_channels))
+    yield from write_note_lines()
 
-    lines.append("")
-    return "\n".join(lines)
+    yield ""
+
+
+def _write_lines(f: TextIO, lines: Iterable[str]) -> None:
+    # same text as "\n".join(lines), written line by line
+    it = iter(lines)
+    f.write(next(it, ""))
+    for line in it:
+        f.write("\n")
+        f.write(line)
+
+
+def _write_or_rollback(f: TextIO, lines: Iterable[str]) -> None:
+    # lines are generated while writing; if that fails, cut the stream back to where
+    # it was so no partial export is left behind
+    start = f.tell()
+    try:
+        _write_lines(f, lines)
+    except BaseException:
+        f.seek(start)
+        f.truncate()
+        raise
 
 
 # PUBLIC API
@@ -528,28 +597,31 @@ def export(
     keep_note_speed_ratios: bool = False,
     measure_extensions: bool = False,
     skip_shift: bool = False,
+    extended_channels: bool = False,
 ):
-    score = deepcopy(score)
-    if not skip_shift:
-        score.shift()
-    score.replace_extended_ease()
-    score.replace_extended_guide_colors()
-    score.delete_fake_notes()
-    if delete_damage:
-        score.delete_damage_notes()
-    if not allow_extended_lanes:
-        score.strip_extended_lanes()
-    if not keep_note_speed_ratios:
-        score.strip_speed_ratios()
+    """
+    extended_channels: when more than 36 slides or guides overlap, write the extra
+    ones on two-character channels (``#mmm3xCC``) instead of raising RuntimeError.
+    Those headers are not standard SUS; other readers will misread them.
+    """
+    score = score.clone()
+    tsg_count = score.normalize(
+        shift=not skip_shift,
+        replace_extended_ease=True,
+        replace_extended_guide_colors=True,
+        delete_fake_notes=True,
+        delete_damage_notes=delete_damage,
+        strip_extended_lanes=not allow_extended_lanes,
+        strip_speed_ratios=not keep_note_speed_ratios,
+    )
 
     if not allow_layers:
-        tsg_count = sum(1 for n in score.notes if isinstance(n, TimeScaleGroup))
         if tsg_count > 1:
             raise ValueError("Layers found where allow_layers is false")
 
     taps, directionals, slides, guides, bpms, bl, tils, volumes = _score_to_sus(score)
 
-    sus_text = _dump_sus(
+    lines = _iter_sus(
         taps,
         directionals,
         slides,
@@ -561,18 +633,34 @@ def export(
         score,
         f"This file was generated by sonolus-level-converters {__version__}",
         measure_extensions=measure_extensions,
+        extended_channels=extended_channels,
     )
 
     if isinstance(path, (str, Path)):
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            f.write(sus_text)
+        # write next to the target and swap it in, so a failed export leaves an
+        # existing file untouched
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            with tmp.open("w", encoding="utf-8") as f:
+                _write_lines(f, lines)
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
     elif isinstance(path, (io.StringIO, io.TextIOBase)):
-        path.write(sus_text)
+        _write_or_rollback(path, lines)
         path.seek(0)
     elif isinstance(path, io.BytesIO):
-        path.write(sus_text.encode("utf-8"))
+        # encode incrementally through the wrapper's buffer, then hand the
+        # BytesIO back to the caller unclosed, even if the export fails
+        f = io.TextIOWrapper(path, encoding="utf-8", newline="")
+        try:
+            _write_or_rollback(f, lines)
+            f.flush()
+        finally:
+            f.detach()
         path.seek(0)
     else:
         raise TypeError(f"Unsupported path type: {type(path)}")
@@ -1,4 +1,9 @@
-from typing import TextIO, Literal
+import io
+import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Iterable, Iterator, TextIO, Literal
 from dataclasses import dataclass
 from ..notes.score import Score
 from ..notes.metadata import MetaData
@@ -30,6 +35,11 @@ class _Bar:
     measure: int
     ticks_per_measure: int
     ticks: int
+    start: int = 0  # running total of ``ticks``: the tick this bar length starts at
+
+
+# (header, data, measure, hispeed layer) of a note or slide/guide channel line
+_ChannelLine = tuple[str, str, int, int]
 
 
 def _tick_to_beat(tick: int) -> float:
@@ -62,52 +72,39 @@ def _get_bars(bar_lengths: list[tuple[int, float]], ticks_per_beat: int) -> list
         ticks = int(
             (measure - sorted_bl[i - 1][0]) * sorted_bl[i - 1][1] * ticks_per_beat
         )
-        bars.append(_Bar(measure, tpm, ticks))
+        bars.append(_Bar(measure, tpm, ticks, bars[-1].start + ticks))
     return bars
 
 
 def _get_ticks(bars: list[_Bar], measure: int, i: int, total: int) -> int:
-    b_index = 0
-    acc_ticks = 0
-    for idx in range(len(bars)):
-        if bars[idx].measure > measure:
-            break
-        b_index = idx
-        acc_ticks += bars[idx].ticks
+    # last bar length starting at or before this measure (the first one if none do)
+    b_index = bisect_right(bars, measure, key=lambda bar: bar.measure) - 1
+    bar = bars[max(b_index, 0)]
     return (
-        acc_ticks
-        + (measure - bars[b_index].measure) * bars[b_index].ticks_per_measure
-        + (i * bars[b_index].ticks_per_measure) // total
+        bar.start
+        + (measure - bar.measure) * bar.ticks_per_measure
+        + (i * bar.ticks_per_measure) // total
     )
 
 
+# one cell: two characters, an optional ",speed" ratio, then any separators
+_NOTE_CELL_RE = re.compile(r"\s*(\S.)(?:,([^\s,]*))?[\s,]*", re.DOTALL)
+
+
 def _parse_note_cells(data: str) -> list[tuple[str, float]]:
     if "," not in data:
         end = len(data) - len(data) % 2
         return [(data[i : i + 2], 1.0) for i in range(0, end, 2)]
 
     cells: list[tuple[str, float]] = []
-    i = 0
-    while i < len(data):
-        while i < len(data) and data[i].isspace():
-            i += 1
-        if i + 1 >= len(data):
-            break
-        note_data = data[i : i + 2]
-        i += 2
+    for match in _NOTE_CELL_RE.finditer(data):
+        note_data, speed = match.groups()
         speed_ratio = 1.0
-        if i < len(data) and data[i] == ",":
-            i += 1
-            start = i
-            while i < len(data) and not data[i].isspace() and data[i] != ",":
-                i += 1
-            if i > start:
-                sr = float(data[start:i])
-                if sr > 0.0:
-                    speed_ratio = sr
+        if speed:
+            sr = float(speed)
+            if sr > 0.0:
+                speed_ratio = sr
         cells.append((note_data, speed_ratio))
-        while i < len(data) and (data[i].isspace() or data[i] == ","):
-            i += 1
     return cells
 
 
@@ -131,6 +128,28 @@ def _get_notes(
     return notes
 
 
+def _decode_note_lines(
+    bars: list[_Bar], lines: list[_ChannelLine]
+) -> list[list[_SusNote]]:
+    return [
+        _get_notes(header, data, bars, measure, til)
+        for header, data, measure, til in lines
+    ]
+
+
+def _decode_note_lines_parallel(
+    bars: list[_Bar], lines: list[_ChannelLine], workers: int
+) -> list[list[_SusNote]]:
+    # contiguous chunks, a few per worker; map() keeps them in file order
+    size = -(-len(lines) // (workers * 4))
+    chunks = [lines[i : i + size] for i in range(0, len(lines), size)]
+    decoded: list[list[_SusNote]] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for notes in pool.map(partial(_decode_note_lines, bars), chunks):
+            decoded.extend(notes)
+    return decoded
+
+
 def _get_note_stream(stream: list[_SusNote]) -> list[list[_SusNote]]:
     sorted_stream = sorted(stream, key=lambda n: n.tick)
     slides: list[list[_SusNote]] = []
@@ -178,14 +197,191 @@ def _is_command(line: str) -> bool:
     return ":" not in line
 
 
+# SUS TOKENIZER
+
+_SusLineKind = Literal[
+    "command", "bar_length", "bpm", "bpm_change", "til", "notes", "slide", "data"
+]
+
+
+@dataclass
+class _SusLine:
+    kind: _SusLineKind
+    header: str  # "00110", "BPM01", ...; the upper-cased key for commands
+    data: str  # text after the ":"; the unquoted value for commands
+    line: str = ""  # the whole line, kept for commands only
+
+
+def _iter_lines(source: str | TextIO) -> Iterator[str]:
+    if isinstance(source, str):
+        source = io.StringIO(source)
+    for chunk in source:
+        yield from chunk.splitlines()
+
+
+def _header_kind(header: str) -> _SusLineKind:
+    if len(header) == 5:
+        if header.endswith("02") and header[:3].isdigit():
+            return "bar_length"
+        if header.startswith("BPM"):
+            return "bpm"
+        if header.endswith("08"):
+            return "bpm_change"
+        if header.startswith("TIL"):
+            return "til"
+        if header[3] in ("1", "5"):
+            return "notes"
+    elif len(header) in (6, 7) and header[3] in ("3", "9"):
+        return "slide"
+    return "data"
+
+
+def _tokenize(
+    lines: Iterable[str], is_command: Callable[[str], bool] = _is_command
+) -> Iterator[_SusLine]:
+    """
+    Classify every "#" line of a SUS file once. Lines are consumed lazily, so a
+    file handle is never read into memory as a whole. ``is_command`` lets a dialect
+    decide which lines are ``#KEY value`` commands; everything else with a ":" is
+    split into header and data.
+    """
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line.startswith("#"):
+            continue
+
+        if is_command(line):
+            space = line.find(" ", 1)
+            if space == -1:
+                yield _SusLine("command", "", "", line)
+                continue
+            value = line[space + 1 :].strip()
+            if value.startswith('"') and value.endswith('"'):
+                value = value[1:-1]
+            yield _SusLine("command", line[1:space].upper(), value, line)
+            continue
+
+        colon = line.find(":", 1)
+        if colon == -1:
+            continue
+        header = line[1:colon].strip()
+        yield _SusLine(_header_kind(header), header, line[colon + 1 :].strip())
+
+
 # MAIN LOADER
 
 
-def load(fp: TextIO) -> Score:
-    return loads(fp.read())
+def load(fp: TextIO, ticks: bool = False, workers: int | None = None) -> Score:
+    return _load_lines(_iter_lines(fp), ticks, workers)
+
+
+def loads(data: str, ticks: bool = False, workers: int | None = None) -> Score:
+    """
+    workers: decode the note and slide channel lines in a pool of this many processes.
+    Only worth it for very large charts; the result is identical to the default path.
+    On platforms that spawn worker processes (Windows, macOS) the calling script must
+    start from an ``if __name__ == "__main__":`` guard.
+    """
+    return _load_lines(_iter_lines(data), ticks, workers)
+
+
+def _load_lines(
+    lines: Iterable[str], ticks: bool = False, workers: int | None = None
+) -> Score:
+    scan = _scan_lines(lines)
+    if workers and workers > 1 and scan.channel_lines:
+        decoded = _decode_note_lines_parallel(scan.bars, scan.channel_lines, workers)
+    else:
+        decoded = _decode_note_lines(scan.bars, scan.channel_lines)
+
+    taps, directionals, channels = _group_channel_lines(scan.channel_lines, decoded)
+    slides: list[list[_SusNote]] = []
+    guides: list[list[_SusNote]] = []
+    for (channel_type, _), indices in channels.items():
+        holds = slides if channel_type == "3" else guides
+        holds.extend(_get_note_stream([n for i in indices for n in decoded[i]]))
+
+    return _build_score(scan, taps, directionals, slides, guides, ticks)
+
+
+class IncrementalSusLoader:
+    """
+    Re-parses a SUS file that is edited and reloaded over and over (e.g. on every save in an
+    editor), redoing only the work that the edit invalidated.
+
+    Decoded notes are kept per channel line, keyed by its text, measure and hispeed layer, for
+    as long as the bar lengths and ticks_per_beat are unchanged, and slide/guide streams are
+    only re-assembled for channels with a changed line. The result is always identical to
+    ``loads(data, ticks)``.
+    """
+
+    def __init__(self, ticks: bool = False):
+        self.ticks = ticks
+        self._bars_key: tuple | None = None
+        self._decoded: dict[_ChannelLine, list[_SusNote]] = {}
+        self._streams: dict[tuple[_ChannelLine, ...], list[list[_SusNote]]] = {}
+
+    def load(self, fp: TextIO) -> Score:
+        return self._load_lines(_iter_lines(fp))
+
+    def loads(self, data: str) -> Score:
+        return self._load_lines(_iter_lines(data))
+
+    def _load_lines(self, lines: Iterable[str]) -> Score:
+        scan = _scan_lines(lines)
+        bars_key = (tuple(scan.bar_lengths), scan.ticks_per_beat)
+        if bars_key != self._bars_key:
+            self._bars_key = bars_key
+            self._decoded = {}
+            self._streams = {}
+
+        # only lines of the current text are kept, so the caches never outgrow the file
+        decoded_cache: dict[_ChannelLine, list[_SusNote]] = {}
+        decoded: list[list[_SusNote]] = []
+        for line in scan.channel_lines:
+            notes = decoded_cache.get(line)
+            if notes is None:
+                notes = self._decoded.get(line)
+                if notes is None:
+                    notes = _get_notes(line[0], line[1], scan.bars, line[2], line[3])
+                decoded_cache[line] = notes
+            decoded.append(notes)
+        self._decoded = decoded_cache
+
+        taps, directionals, channels = _group_channel_lines(scan.channel_lines, decoded)
+        streams_cache: dict[tuple[_ChannelLine, ...], list[list[_SusNote]]] = {}
+        slides: list[list[_SusNote]] = []
+        guides: list[list[_SusNote]] = []
+        for (channel_type, _), indices in channels.items():
+            key = tuple(scan.channel_lines[i] for i in indices)
+            streams = self._streams.get(key)
+            if streams is None:
+                streams = _get_note_stream([n for i in indices for n in decoded[i]])
+            streams_cache[key] = streams
+            (slides if channel_type == "3" else guides).extend(streams)
+        self._streams = streams_cache
+
+        return _build_score(scan, taps, directionals, slides, guides, self.ticks)
 
 
-def loads(data: str) -> Score:
+@dataclass
+class _SusScan:
+    bars: list[_Bar]
+    bar_lengths: list[tuple[int, float]]
+    ticks_per_beat: int
+    title: str
+    artist: str
+    designer: str
+    wave_offset: float
+    requests: list[str]
+    bpms: list[tuple[int, float]]
+    tils: list[list[tuple[int, float]]]
+    volumes: list[tuple[int, float]]
+    channel_lines: list[_ChannelLine]
+
+
+# Phases 1 and 2: everything but decoding the note and slide/guide channel lines
+def _scan_lines(lines: Iterable[str]) -> _SusScan:
     ticks_per_beat = TICKS_PER_BEAT
     title = ""
     artist = ""
@@ -202,94 +398,52 @@ def loads(data: str) -> Score:
     current_til: int = 0
     volume_data: list[str] = []
 
-    taps: list[_SusNote] = []
-    directionals: list[_SusNote] = []
-    slide_streams: dict[int, list[_SusNote]] = {}
-    guide_streams: dict[int, list[_SusNote]] = {}
+    channel_lines: list[_ChannelLine] = []
 
-    # PHASE 1: first pass to get bar_lengths, ticks_per_beat, and MEASUREBS
+    # PHASE 1: tokenize, collecting bar_lengths, ticks_per_beat, and MEASUREBS
     measure_offset = 0
-    lines_to_process: list[tuple[str, int]] = []  # (line, measure_offset)
-    for raw_line in data.splitlines():
-        line = raw_line.strip()
-        if not line.startswith("#"):
-            continue
-
-        if _is_command(line):
-            space = line.find(" ", 1)
-            if space == -1:
-                lines_to_process.append((line, measure_offset))
-                continue
-            key = line[1:space].upper()
-            value = line[space + 1 :].strip()
-            if value.startswith('"') and value.endswith('"'):
-                value = value[1:-1]
-            if key == "REQUEST":
-                parts = value.split()
+    records: list[tuple[_SusLine, int]] = []  # (record, measure_offset)
+    for record in _tokenize(lines):
+        if record.kind == "command":
+            if record.header == "REQUEST":
+                parts = record.data.split()
                 if len(parts) == 2 and parts[0] == "ticks_per_beat":
                     ticks_per_beat = int(parts[1])
-            elif key == "MEASUREBS":
-                measure_offset = int(value)
-        else:
-            colon = line.find(":", 1)
-            if colon == -1:
-                lines_to_process.append((line, measure_offset))
-                continue
-            header = line[1:colon].strip()
-            line_data = line[colon + 1 :].strip()
-            if len(header) == 5 and header.endswith("02") and header[:3].isdigit():
-                bar_lengths.append((int(header[:3]) + measure_offset, float(line_data)))
-
-        lines_to_process.append((line, measure_offset))
+            elif record.header == "MEASUREBS":
+                measure_offset = int(record.data)
+        elif record.kind == "bar_length":
+            bar_lengths.append(
+                (int(record.header[:3]) + measure_offset, float(record.data))
+            )
+            continue
+        records.append((record, measure_offset))
 
     if not bar_lengths:
         bar_lengths.append((0, 4.0))
 
     bars = _get_bars(bar_lengths, ticks_per_beat)
 
-    # PHASE 2: second pass for everything else (needs bars for tick calculation)
-    for line, m_offset in lines_to_process:
-        if _is_command(line):
-            space = line.find(" ", 1)
-            if space == -1:
-                continue
-            key = line[1:space].upper()
-            value = line[space + 1 :].strip()
-            if value.startswith('"') and value.endswith('"'):
-                value = value[1:-1]
-
-            if key == "TITLE":
-                title = value
-            elif key == "ARTIST":
-                artist = value
-            elif key == "DESIGNER":
-                designer = value
-            elif key == "WAVEOFFSET":
-                wave_offset = float(value)
-            elif key == "REQUEST":
-                requests.append(value)
-            elif key == "HISPEED":
-                tid = til_map.get(value)
+    # PHASE 2: everything else, in file order (needs bars for tick calculation)
+    for record, m_offset in records:
+        kind, header, line_data = record.kind, record.header, record.data
+        if kind == "command":
+            if header == "TITLE":
+                title = line_data
+            elif header == "ARTIST":
+                artist = line_data
+            elif header == "DESIGNER":
+                designer = line_data
+            elif header == "WAVEOFFSET":
+                wave_offset = float(line_data)
+            elif header == "REQUEST":
+                requests.append(line_data)
+            elif header == "HISPEED":
+                tid = til_map.get(line_data)
                 if tid is not None:
                     current_til = tid
-            continue
-
-        colon = line.find(":", 1)
-        if colon == -1:
-            continue
-        header = line[1:colon].strip()
-        line_data = line[colon + 1 :].strip()
-
-        if len(header) not in (5, 6):
-            if header.startswith("VOLUME"):
-                volume_data.append(line_data)
-            continue
-
-        if len(header) == 5 and header.endswith("02") and header[:3].isdigit():
-            pass  # already handled in phase 1
-        elif header.startswith("BPM") and len(header) == 5:
+        elif kind == "bpm":
             bpm_definitions[header[3:]] = float(line_data)
-        elif len(header) == 5 and header.endswith("08"):
+        elif kind == "bpm_change":
             measure = int(header[:3]) + m_offset
             stripped = line_data.replace(" ", "")
             pairs = [
@@ -302,7 +456,7 @@ def loads(data: str) -> Score:
                 tick = _get_ticks(bars, measure, j, len(pairs))
                 bpm = bpm_definitions.get(pair, 120.0)
                 bpm_data_lines.append((tick, bpm))
-        elif header.startswith("TIL") and len(header) == 5:
+        elif kind == "til":
             til_id = header[3:]
             til_map[til_id] = til_data_index
             stripped = line_data.strip('"').replace(" ", "")
@@ -315,54 +469,11 @@ def loads(data: str) -> Score:
                     new_til.append((measure_ticks + tick_offset, value))
             tils.append(new_til)
             til_data_index += 1
-        elif len(header) == 5 and header[3] == "1":
-            measure = int(header[:3]) + m_offset
-            taps.extend(_get_notes(header, line_data, bars, measure, current_til))
-        elif len(header) == 5 and header[3] == "5":
-            measure = int(header[:3]) + m_offset
-            directionals.extend(
-                _get_notes(header, line_data, bars, measure, current_til)
-            )
-        elif len(header) == 6 and header[3] == "3":
-            measure = int(header[:3]) + m_offset
-            channel = int(header[5], 36)
-            slide_streams.setdefault(channel, []).extend(
-                _get_notes(header, line_data, bars, measure, current_til)
-            )
-        elif len(header) == 6 and header[3] == "9":
+        elif kind in ("notes", "slide"):
             measure = int(header[:3]) + m_offset
-            channel = int(header[5], 36)
-            guide_streams.setdefault(channel, []).extend(
-                _get_notes(header, line_data, bars, measure, current_til)
-            )
-
-    # Build slide/guide note streams
-    slides: list[list[_SusNote]] = []
-    for stream in slide_streams.values():
-        slides.extend(_get_note_stream(stream))
-
-    guides: list[list[_SusNote]] = []
-    for stream in guide_streams.values():
-        guides.extend(_get_note_stream(stream))
-
-    # Deduplicate slides/guides sharing same start+end (tick, lane).
-    # Game's noteInfoDict merges notes at same (time, lane), so duplicate
-    # slides from different channels collapse into one.
-    def _dedup_holds(holds: list[list[_SusNote]]) -> list[list[_SusNote]]:
-        seen: set[tuple[int, int, int, int]] = set()
-        result: list[list[_SusNote]] = []
-        for hold in holds:
-            if len(hold) < 2:
-                continue
-            key = (hold[0].tick, hold[0].lane, hold[-1].tick, hold[-1].lane)
-            if key in seen:
-                continue
-            seen.add(key)
-            result.append(hold)
-        return result
-
-    slides = _dedup_holds(slides)
-    guides = _dedup_holds(guides)
+            channel_lines.append((header, line_data, measure, current_til))
+        elif len(header) not in (5, 6) and header.startswith("VOLUME"):
+            volume_data.append(line_data)
 
     # Parse volumes
     volumes: list[tuple[int, float]] = []
@@ -375,21 +486,79 @@ def loads(data: str) -> Score:
                 measure_ticks = _get_ticks(bars, measure, 0, 1)
                 volumes.append((measure_ticks + tick_offset, value))
 
-    # PHASE 3: SUS → Score (matching ChartMaker susToScore)
-    return _sus_to_score(
-        taps,
-        directionals,
-        slides,
-        guides,
-        sorted(bpm_data_lines, key=lambda x: x[0]),
+    return _SusScan(
+        bars,
         bar_lengths,
-        tils,
-        volumes,
+        ticks_per_beat,
         title,
         artist,
         designer,
         wave_offset,
         requests,
+        sorted(bpm_data_lines, key=lambda x: x[0]),
+        tils,
+        volumes,
+        channel_lines,
+    )
+
+
+# Split decoded channel lines into taps, directionals and the line indices of each
+# (type, channel) slide/guide stream, in order of first appearance
+def _group_channel_lines(
+    channel_lines: list[_ChannelLine], decoded: list[list[_SusNote]]
+) -> tuple[list[_SusNote], list[_SusNote], dict[tuple[str, int], list[int]]]:
+    taps: list[_SusNote] = []
+    directionals: list[_SusNote] = []
+    channels: dict[tuple[str, int], list[int]] = {}
+    for i, (header, _, _, _) in enumerate(channel_lines):
+        if len(header) == 5:
+            (taps if header[3] == "1" else directionals).extend(decoded[i])
+        else:
+            channels.setdefault((header[3], int(header[5:], 36)), []).append(i)
+    return taps, directionals, channels
+
+
+# Deduplicate slides/guides sharing same start+end (tick, lane).
+# Game's noteInfoDict merges notes at same (time, lane), so duplicate
+# slides from different channels collapse into one.
+def _dedup_holds(holds: list[list[_SusNote]]) -> list[list[_SusNote]]:
+    seen: set[tuple[int, int, int, int]] = set()
+    result: list[list[_SusNote]] = []
+    for hold in holds:
+        if len(hold) < 2:
+            continue
+        key = (hold[0].tick, hold[0].lane, hold[-1].tick, hold[-1].lane)
+        if key in seen:
+            continue
+        seen.add(key)
+        result.append(hold)
+    return result
+
+
+def _build_score(
+    scan: _SusScan,
+    taps: list[_SusNote],
+    directionals: list[_SusNote],
+    slides: list[list[_SusNote]],
+    guides: list[list[_SusNote]],
+    ticks: bool,
+) -> Score:
+    # PHASE 3: SUS → Score (matching ChartMaker susToScore)
+    return _sus_to_score(
+        taps,
+        directionals,
+        _dedup_holds(slides),
+        _dedup_holds(guides),
+        scan.bpms,
+        scan.bar_lengths,
+        scan.tils,
+        scan.volumes,
+        scan.title,
+        scan.artist,
+        scan.designer,
+        scan.wave_offset,
+        scan.requests,
+        ticks,
     )
 
 
@@ -407,6 +576,7 @@ def _sus_to_score(
     designer: str,
     wave_offset: float,
     requests: list[str],
+    ticks: bool = False,
 ) -> Score:
     # BUILD LOOKUP SETS (matching ChartMaker exactly)
     flicks: dict[str, Literal["up", "left", "right"]] = {}
@@ -458,9 +628,15 @@ def _sus_to_score(
     # BPM
     if sus_bpms:
         for tick, bpm in sus_bpms:
-            notes.append(Bpm(beat=_tick_to_beat(tick), bpm=bpm))
+            notes.append(
+                Bpm(
+                    beat=_tick_to_beat(tick),
+                    bpm=bpm,
+                    tick=tick if ticks else None,
+                )
+            )
     else:
-        notes.append(Bpm(beat=0, bpm=120.0))
+        notes.append(Bpm(beat=0, bpm=120.0, tick=0 if ticks else None))
 
     # Volume
     for tick, vol in sus_volumes:
@@ -474,13 +650,26 @@ def _sus_to_score(
             for tick, speed in sorted(til, key=lambda x: x[0]):
                 if tick == 0:
                     has_initial = True
-                tsg.append(TimeScalePoint(beat=_tick_to_beat(tick), timeScale=speed))
+                tsg.append(
+                    TimeScalePoint(
+                        beat=_tick_to_beat(tick),
+                        timeScale=speed,
+                        tick=tick if ticks else None,
+                    )
+                )
             if not has_initial:
-                tsg.insert(0, TimeScalePoint(beat=0.0, timeScale=1.0))
+                tsg.insert(
+                    0,
+                    TimeScalePoint(
+                        beat=0.0, timeScale=1.0, tick=0 if ticks else None
+                    ),
+                )
             notes.append(tsg)
     else:
         tsg = TimeScaleGroup()
-        tsg.append(TimeScalePoint(beat=0.0, timeScale=1.0))
+        tsg.append(
+            TimeScalePoint(beat=0.0, timeScale=1.0, tick=0 if ticks else None)
+        )
         notes.append(tsg)
 
     # TAPS → Singles/Skills/Fever
@@ -533,6 +722,7 @@ def _sus_to_score(
                 speedRatio=note.speedRatio,
                 trace=is_friction,
                 direction=direction,
+                tick=note.tick if ticks else None,
             )
         )
 
@@ -564,6 +754,7 @@ def _sus_to_score(
                             size=_sus_to_usc_size(note.width),
                             timeScaleGroup=note.til,
                             speedRatio=note.speedRatio,
+                            tick=note.tick if ticks else None,
                         )
                     )
                 notes.append(guide_note)
@@ -577,6 +768,7 @@ def _sus_to_score(
                     elif key in ease_outs:
                         ease = "out"
                     beat = _tick_to_beat(note.tick)
+                    tick = note.tick if ticks else None
                     lane = _sus_to_usc_lane(note.lane, note.width)
                     size = _sus_to_usc_size(note.width)
 
@@ -600,6 +792,7 @@ def _sus_to_score(
                                 size=size,
                                 timeScaleGroup=note.til,
                                 speedRatio=note.speedRatio,
+                                tick=tick,
                             )
                         )
 
@@ -626,6 +819,7 @@ def _sus_to_score(
                                 timeScaleGroup=note.til,
                                 speedRatio=note.speedRatio,
                                 direction=direction,
+                                tick=tick,
                             )
                         )
 
@@ -651,6 +845,7 @@ def _sus_to_score(
                                 type=step_type,
                                 critical=mid_critical,
                                 speedRatio=note.speedRatio,
+                                tick=tick,
                             )
                         )
 
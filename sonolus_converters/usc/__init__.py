@@ -1,3 +1,3 @@
-from .loader import load
+from .loader import load, load_data
 from .exporter import export
 from .detector import detect
@@ -1,10 +1,32 @@
 import json
+import re
+from collections import abc
 from typing import Literal
 
+_SNIFF_SIZE = 4 * 1024
+_USC_KEY_RE = re.compile(rb'\s*\{\s*"usc"\s*:')
+# "version" as the last key of the top-level object, as usc.export writes it
+_TRAILING_VERSION_RE = re.compile(rb'"version"\s*:\s*(\d+)\s*\}\s*$')
+_VERSIONS: dict[int, Literal["v1", "v2"]] = {1: "v1", 2: "v2"}
 
-def detect(data: str | bytes | bytearray) -> Literal["v1", "v2"] | None:
+
+def detect_prefix(data: bytes) -> Literal["v1", "v2"] | None:
+    """
+    Recognize a USC document from its first key and its trailing ``version`` without
+    parsing it. ``None`` means undecided; ``detect`` gives the exact answer.
+    """
+    if not _USC_KEY_RE.match(data, 0, _SNIFF_SIZE):
+        return
+    match = _TRAILING_VERSION_RE.search(data[-_SNIFF_SIZE:])
+    if match:
+        return _VERSIONS.get(int(match.group(1)))
+
+
+def detect(
+    data: str | bytes | bytearray | abc.Mapping, *, skip_json=False
+) -> Literal["v1", "v2"] | None:
     try:
-        usc = json.loads(data)
+        usc = data if skip_json else json.loads(data)
         if "usc" in usc and "version" in usc:
             match usc["version"]:
                 case 1:
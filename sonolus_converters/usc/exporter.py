@@ -24,11 +24,21 @@ def _remove_none(data):
             _remove_none(obj)
 
 
+def _remove_ticks(notes: list):
+    # tick-native scores carry integer ticks, USC only stores beats
+    for note in notes:
+        note.pop("tick", None)
+        for key in ("connections", "midpoints", "changes"):
+            for point in note.get(key, ()):
+                point.pop("tick", None)
+
+
 def export(
     path: Union[str, Path, io.BytesIO, io.StringIO, io.TextIOBase],
     score: Score,
     minified: bool = True,
 ):
+    score = score.clone()
     if not any(isinstance(note, Bpm) for note in score.notes):
         score.notes.insert(0, Bpm(beat=round(0, 6), bpm=160.0))
     notes = [
@@ -37,6 +47,7 @@ def export(
         if not isinstance(i, Volume)
     ]
     _remove_none(notes)
+    _remove_ticks(notes)
     usc_remove_fake_field(notes)
 
     usc_data = {
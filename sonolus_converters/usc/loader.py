@@ -10,7 +10,11 @@ from ..notes.guide import Guide, GuidePoint
 
 
 def load(fp: TextIO) -> Score:
-    usc = json.load(fp)
+    return load_data(json.load(fp))
+
+
+def load_data(usc: dict) -> Score:
+    """Load a USC document that has already been parsed from JSON."""
     metadata = MetaData(
         title="",
         artist="",
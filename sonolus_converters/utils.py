@@ -1,4 +1,5 @@
 import json
+import zlib
 
 
 class SinglePrecisionFloatEncoder(json.JSONEncoder):
@@ -13,3 +14,12 @@ class SinglePrecisionFloatEncoder(json.JSONEncoder):
 # x = -3.200000047683716
 # print(json.dumps(x))  # -3.200000047683716
 # print(json.dumps(x, cls=SinglePrecisionFloatEncoder))  # -3.2
+
+
+def inflate_prefix(data: bytes, size: int) -> bytes | None:
+    """Inflate at most ``size`` bytes from the start of a gzip stream, without reading
+    past what is needed. ``None`` if the data does not start a valid stream."""
+    try:
+        return zlib.decompressobj(wbits=31).decompress(data, size)
+    except zlib.error:
+        return None